@@ -0,0 +1,113 @@
+"""Tail latency and retry amplification under injected faults.
+
+Replays a cassette (see tool_replay.py) through the production retry and
+circuit-breaker layers with faults injected per host, from many threads:
+
+    HTTP_FAULTS__HOSTS='{"api.semanticscholar.org": {"error_rate": 0.3, "error_status": 429}, "api.openalex.org": {"latency_ms": 3000, "latency_distribution": "lognormal"}}' \\
+    PYTHONPATH=. python benchmarks/fault_load.py --cassette cassettes/tools.jsonl.gz
+
+Every recorded request is issued --rounds times by --workers threads.
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from medicalagent.config.settings import (
+    CassetteMode,
+    CassetteSettings,
+    FaultInjectionSettings,
+)
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.cassette import CassetteHTTPTransport
+from medicalagent.infra.requests_transport.circuit_breaker import (
+    CircuitBreakerHTTPTransport,
+)
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+from medicalagent.infra.requests_transport.faults import FaultInjectingHTTPTransport
+from medicalagent.infra.requests_transport.metrics import TransportMetrics
+from medicalagent.infra.requests_transport.retry import (
+    RetryingHTTPTransport,
+    RetryPolicy,
+)
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+
+
+def recorded_requests(path: str) -> list[HTTPRequestData]:
+    """Plain (non-stream) requests found in a cassette"""
+    requests = {}
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            kind, key = json.loads(line)["key"].split(" ", 1)
+            if kind == "request":
+                # POST keys (batch lookups) carry the JSON body last
+                method, url, params, *body = json.loads(key)
+                requests[key] = HTTPRequestData(
+                    method=method,
+                    url=url,
+                    params=dict(params),
+                    json_body=body[0] if body else None,
+                )
+    return list(requests.values())
+
+
+def build_stack(
+    cassette: str, metrics: TransportMetrics
+) -> tuple[RetryingHTTPTransport, CircuitBreakerHTTPTransport]:
+    """Retries on top of the breaker, as in the DI container"""
+    settings = CassetteSettings(mode=CassetteMode.replay, path=cassette)
+    transport: AbstractSyncHTTPTransport = CassetteHTTPTransport(
+        None, settings, metrics
+    )
+    transport = FaultInjectingHTTPTransport(
+        transport, FaultInjectionSettings(enabled=True), metrics
+    )
+    breaker = CircuitBreakerHTTPTransport(transport)
+    return RetryingHTTPTransport(breaker, RetryPolicy(metrics=metrics)), breaker
+
+
+def timed_call(transport: AbstractSyncHTTPTransport, data: HTTPRequestData) -> float:
+    started = time.perf_counter()
+    try:
+        transport.request(data)
+    except BaseTransportException:
+        pass
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cassette", default="cassettes/tools.jsonl.gz")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    metrics = TransportMetrics()
+    transport, breaker = build_stack(args.cassette, metrics)
+    calls = recorded_requests(args.cassette) * args.rounds
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        latencies = sorted(pool.map(lambda d: timed_call(transport, d), calls))
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"calls: {len(latencies)}")
+    print(
+        f"latency s  p50 {quantiles[49]:.3f}  p95 {quantiles[94]:.3f}  "
+        f"p99 {quantiles[98]:.3f}  max {latencies[-1]:.3f}"
+    )
+    for host, endpoints in metrics.snapshot().items():
+        attempts = sum(e["attempts"] for e in endpoints.values())
+        retries = sum(e["retries"] for e in endpoints.values())
+        errors = sum(e["errors"] for e in endpoints.values())
+        print(
+            f"{host}: attempts {attempts}, retries {retries}, errors {errors}, "
+            f"amplification {attempts / max(1, attempts - retries):.2f}x"
+        )
+    stats = {"retry": transport.stats(), "circuits": breaker.stats()}
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Response decoding micro-benchmark.
+
+Compares what RequestsHTTPTransport used to do with a JSON body
+(``response.text`` -> ``json.loads``) with the current decode_body pipeline
+(media-type parsing + decoding straight from bytes, orjson when installed).
+
+    PYTHONPATH=. python benchmarks/json_decode.py
+    BENCH_PAYLOAD_DIR=recorded/ PYTHONPATH=. python benchmarks/json_decode.py
+"""
+
+import json
+import timeit
+
+from benchmarks.payloads import load_payloads
+from medicalagent.infra.requests_transport.decoding import decode_body, orjson
+
+CONTENT_TYPE = "application/json; charset=utf-8"
+
+
+def stdlib_text(raw: bytes) -> object:
+    return json.loads(raw.decode("utf-8"))
+
+
+def pipeline(raw: bytes) -> object:
+    return decode_body(CONTENT_TYPE, raw)
+
+
+def main() -> None:
+    print(f"orjson available: {orjson is not None}")
+    print(
+        f"{'payload':<32}{'size KiB':>10}{'stdlib ms':>12}{'pipeline ms':>14}{'speedup':>9}"
+    )
+    for name, raw in load_payloads().items():
+        assert stdlib_text(raw) == pipeline(raw)  # nosec B101
+        number = 50
+        baseline = min(timeit.repeat(lambda: stdlib_text(raw), number=number, repeat=5))
+        current = min(timeit.repeat(lambda: pipeline(raw), number=number, repeat=5))
+        print(
+            f"{name:<32}{len(raw) / 1024:>10.1f}"
+            f"{baseline / number * 1000:>12.3f}{current / number * 1000:>14.3f}"
+            f"{baseline / current:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""OpenAlex work normalization micro-benchmark.
+
+Compares the previous abstract reconstruction (a (position, word) tuple per
+occurrence, sorted, sliced afterwards) with openalex_works, which places
+words straight into a preallocated list and can stop at the truncation
+length. Timings are per page of works, abstracts included.
+
+    PYTHONPATH=. python benchmarks/openalex_normalize.py
+    BENCH_PAYLOAD_DIR=recorded/ PYTHONPATH=. python benchmarks/openalex_normalize.py
+"""
+
+import json
+import timeit
+from typing import Any
+
+from medicalagent.adapters.academic.openalex_works import (
+    reconstruct_abstract,
+    work_to_paper,
+)
+
+from benchmarks.payloads import load_payloads
+
+# What openalex_search shows of each abstract
+TRUNCATE = 600
+
+
+def sorted_tuples(index: dict[str, list[int]] | None) -> str | None:
+    if not index:
+        return None
+    word_list = [(pos, word) for word, positions in index.items() for pos in positions]
+    return " ".join(word for _, word in sorted(word_list))
+
+
+def legacy(works: list[dict[str, Any]]) -> list[str]:
+    return [
+        (sorted_tuples(work.get("abstract_inverted_index")) or "")[:TRUNCATE]
+        for work in works
+    ]
+
+
+def placed(works: list[dict[str, Any]], max_chars: int | None) -> list[str]:
+    return [
+        (reconstruct_abstract(work.get("abstract_inverted_index"), max_chars) or "")[
+            :TRUNCATE
+        ]
+        for work in works
+    ]
+
+
+def normalize(works: list[dict[str, Any]]) -> list[Any]:
+    return [work_to_paper(work, TRUNCATE) for work in works]
+
+
+def main() -> None:
+    print(
+        f"{'payload':<28}{'works':>6}{'sorted ms':>11}{'placed ms':>11}"
+        f"{'trunc ms':>10}{'speedup':>9}{'papers ms':>11}"
+    )
+    for name, raw in load_payloads().items():
+        works = json.loads(raw).get("results")
+        if not works or "abstract_inverted_index" not in works[0]:
+            continue  # not an OpenAlex /works page
+        assert legacy(works) == placed(works, None) == placed(works, TRUNCATE)  # nosec B101
+
+        number = 20
+
+        def best(func: Any) -> float:
+            return min(timeit.repeat(func, number=number, repeat=5)) / number * 1000
+
+        baseline = best(lambda: legacy(works))
+        full = best(lambda: placed(works, None))
+        truncated = best(lambda: placed(works, TRUNCATE))
+        papers = best(lambda: normalize(works))
+        print(
+            f"{name:<28}{len(works):>6}{baseline:>11.3f}{full:>11.3f}"
+            f"{truncated:>10.3f}{baseline / truncated:>8.1f}x{papers:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Payload fixtures for the benchmarks.
+
+Recorded responses are read from BENCH_PAYLOAD_DIR (``*.json`` files, e.g.
+saved OpenAlex ``/works`` and Semantic Scholar ``/paper/search`` pages).
+Without it, deterministic payloads with the same shape and field sizes as
+the `select`/`fields` projections our tools request are generated.
+"""
+
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any
+
+WORDS = (
+    "patients randomized trial cohort outcomes mortality risk cardiovascular "
+    "glucagon-like peptide receptor agonist therapy reduction significant "
+    "confidence interval hazard ratio follow-up years primary endpoint adverse "
+    "events placebo treatment group analysis colorectal cancer screening "
+    "detection rate colonoscopy sensitivity specificity population study"
+).split()
+
+
+def _abstract(rng: random.Random, n_words: int) -> list[str]:
+    return [rng.choice(WORDS) for _ in range(n_words)]
+
+
+def _inverted_index(words: list[str]) -> dict[str, list[int]]:
+    index: dict[str, list[int]] = {}
+    for pos, word in enumerate(words):
+        index.setdefault(word, []).append(pos)
+    return index
+
+
+def openalex_work(rng: random.Random, i: int, abstract_words: int = 250) -> dict:
+    return {
+        "id": f"https://openalex.org/W{4_000_000_000 + i}",
+        "title": " ".join(_abstract(rng, 12)).capitalize(),
+        "publication_year": rng.randint(2015, 2026),
+        "cited_by_count": rng.randint(0, 5000),
+        "doi": f"https://doi.org/10.{1000 + i}/bench.{i}",
+        "primary_location": {
+            "landing_page_url": f"https://journal.example.org/article/{i}",
+            "source": {"display_name": "Journal of Benchmarks"},
+        },
+        "authorships": [
+            {"author": {"display_name": f"Author {i}-{a}"}}
+            for a in range(rng.randint(1, 12))
+        ],
+        "abstract_inverted_index": _inverted_index(_abstract(rng, abstract_words)),
+    }
+
+
+def openalex_page(n: int = 25, seed: int = 7, abstract_words: int = 250) -> dict:
+    rng = random.Random(seed)  # nosec B311
+    return {
+        "meta": {"count": 10_000, "per_page": n, "next_cursor": "IlsxNjk"},
+        "results": [openalex_work(rng, i, abstract_words) for i in range(n)],
+    }
+
+
+def semantic_scholar_page(n: int = 25, seed: int = 7) -> dict:
+    rng = random.Random(seed)  # nosec B311
+    return {
+        "total": 10_000,
+        "offset": 0,
+        "data": [
+            {
+                "paperId": f"{i:040x}",
+                "url": f"https://www.semanticscholar.org/paper/{i:040x}",
+                "title": " ".join(_abstract(rng, 12)).capitalize(),
+                "abstract": " ".join(_abstract(rng, 250)),
+                "year": rng.randint(2015, 2026),
+                "citationCount": rng.randint(0, 5000),
+                "isOpenAccess": bool(i % 2),
+                "authors": [
+                    {"authorId": str(a), "name": f"Author {i}-{a}"}
+                    for a in range(rng.randint(1, 12))
+                ],
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def load_payloads() -> dict[str, bytes]:
+    """name -> raw JSON body"""
+    directory = os.environ.get("BENCH_PAYLOAD_DIR")
+    if directory:
+        return {p.name: p.read_bytes() for p in sorted(Path(directory).glob("*.json"))}
+
+    generated: dict[str, Any] = {
+        "openalex_works_25": openalex_page(25),
+        "openalex_works_200": openalex_page(200),
+        # Full text indexed as the abstract, which some OpenAlex works have
+        "openalex_works_long_25": openalex_page(25, abstract_words=3000),
+        "semantic_scholar_search_25": semantic_scholar_page(25),
+        "semantic_scholar_search_100": semantic_scholar_page(100),
+    }
+    return {name: json.dumps(body).encode() for name, body in generated.items()}
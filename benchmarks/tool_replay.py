@@ -0,0 +1,84 @@
+"""Search tools against a recorded cassette, without network.
+
+Record once (needs network), then replay as often as needed:
+
+    PYTHONPATH=. python benchmarks/tool_replay.py --record "GLP-1 cardiac outcomes"
+    PYTHONPATH=. python benchmarks/tool_replay.py "GLP-1 cardiac outcomes"
+    PYTHONPATH=. python benchmarks/tool_replay.py --latency-scale 1 "GLP-1 cardiac outcomes"
+
+With --latency-scale 0 the numbers are pure tool overhead (request
+building, decoding, formatting); with 1 the recorded upstream timings are
+reproduced, which is what caching and concurrency changes should improve.
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from medicalagent.adapters.academic.rerank import Reranker
+from medicalagent.adapters.agent.schemas import AgentContext
+from medicalagent.adapters.agent.tools.openalex_search_tool import openalex_search_tool
+from medicalagent.adapters.agent.tools.semantic_scholar_search import (
+    semantic_scholar_tool,
+)
+from medicalagent.adapters.repositories import InMemoryPaperRepository
+from medicalagent.config.settings import CassetteMode, CassetteSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.cassette import CassetteHTTPTransport
+from medicalagent.infra.requests_transport.requests_transport import (
+    RequestsHTTPTransport,
+)
+
+TOOLS = (openalex_search_tool, semantic_scholar_tool)
+
+
+def build_transport(args: argparse.Namespace) -> CassetteHTTPTransport:
+    settings = CassetteSettings(
+        mode=CassetteMode.record if args.record else CassetteMode.replay,
+        path=args.cassette,
+        latency_scale=args.latency_scale,
+    )
+    inner = RequestsHTTPTransport() if args.record else None
+    return CassetteHTTPTransport(inner, settings)
+
+
+def run_tool(tool, transport: AbstractSyncHTTPTransport, query: str) -> str:  # noqa: ANN001
+    # A fresh (empty) paper index per call: every call goes through the transport
+    container = SimpleNamespace(
+        http_transport=transport,
+        paper_repository=InMemoryPaperRepository(),
+        reranker=Reranker(),
+    )
+    # The tools' real context schema, so new context fields get their defaults
+    context = AgentContext(container=container, dialog_id=0, user_prompt=query)
+    runtime = SimpleNamespace(context=context)
+    return tool.func(runtime=runtime, query=query)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("queries", nargs="+")
+    parser.add_argument("--cassette", default="cassettes/tools.jsonl.gz")
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--latency-scale", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    transport = build_transport(args)
+    repeat = 1 if args.record else args.repeat
+
+    print(f"{'tool':<28}{'query':<36}{'chars':>8}{'ms/call':>10}")
+    for tool in TOOLS:
+        for query in args.queries:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                output = run_tool(tool, transport, query)
+            elapsed = (time.perf_counter() - started) / repeat
+            print(
+                f"{tool.name:<28}{query[:34]:<36}{len(output):>8}{elapsed * 1000:>10.2f}"
+            )
+    print(transport.stats())
+
+
+if __name__ == "__main__":
+    main()
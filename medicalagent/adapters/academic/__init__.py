@@ -0,0 +1 @@
+"""Clients for academic literature APIs, returning normalized Papers."""
@@ -0,0 +1,93 @@
+"""Resolve many DOIs at once with the sources' batch endpoints."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+
+from medicalagent.adapters.academic import openalex, semantic_scholar
+from medicalagent.adapters.academic.index import index_papers, lookup_dois
+from medicalagent.domain.paper import Paper, normalize_doi
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+from medicalagent.ports.paper_repository import PaperRepository
+
+logger = getLogger(__name__)
+
+BatchFetch = Callable[[AbstractSyncHTTPTransport, list[str]], list[Paper]]
+
+# Tried in order: a source only gets the DOIs the previous ones did not
+# resolve, so the usual case is a single OpenAlex request
+BATCH_SOURCES: list[tuple[str, BatchFetch, int]] = [
+    (openalex.SOURCE_NAME, openalex.get_papers_by_dois, openalex.DOI_BATCH_SIZE),
+    (
+        semantic_scholar.SOURCE_NAME,
+        semantic_scholar.get_papers_by_dois,
+        semantic_scholar.DOI_BATCH_SIZE,
+    ),
+]
+
+
+@dataclass
+class DOIResolution:
+    """Papers keyed by normalized DOI, plus what could not be resolved"""
+
+    # Requested DOIs, normalized and deduplicated
+    dois: list[str] = field(default_factory=list)
+    papers: dict[str, Paper] = field(default_factory=dict)
+    # Identifiers that are not DOIs
+    invalid: list[str] = field(default_factory=list)
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def missing(self) -> list[str]:
+        return [doi for doi in self.dois if doi not in self.papers]
+
+
+def resolve_dois(
+    transport: AbstractSyncHTTPTransport,
+    repository: PaperRepository,
+    identifiers: list[str],
+) -> DOIResolution:
+    """Resolve DOIs (bare, 'doi:' or doi.org links): local index first, then
+    each source's batch endpoint in chunks.
+
+    A failed chunk is recorded in `failures` and its DOIs fall through to
+    the next source; the other chunks are unaffected.
+    """
+    resolution = DOIResolution()
+    for identifier in identifiers:
+        doi = normalize_doi(identifier)
+        if not doi or not doi.startswith("10."):
+            resolution.invalid.append(identifier)
+        elif doi not in resolution.dois:
+            resolution.dois.append(doi)
+
+    for paper in lookup_dois(repository, resolution.dois):
+        if paper.doi:
+            resolution.papers[paper.doi] = paper
+
+    for source, fetch, batch_size in BATCH_SOURCES:
+        missing = resolution.missing
+        fetched: list[Paper] = []
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start : start + batch_size]
+            try:
+                papers = fetch(transport, chunk)
+            except BaseTransportException as e:
+                resolution.failures.append(
+                    f"{source} ({len(chunk)} DOIs): {e.message} "
+                    f"(Status: {e.status_code})"
+                )
+                continue
+            requested = set(chunk)
+            for paper in papers:
+                if paper.doi in requested and paper.doi not in resolution.papers:
+                    resolution.papers[paper.doi] = paper
+                    fetched.append(paper)
+        index_papers(repository, fetched)
+
+    logger.debug(
+        f"Resolved {len(resolution.papers)}/{len(resolution.dois)} DOIs, "
+        f"{len(resolution.failures)} failed batches"
+    )
+    return resolution
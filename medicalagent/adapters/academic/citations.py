@@ -0,0 +1,243 @@
+"""Bounded citation-graph expansion over OpenAlex, with a local edge cache."""
+
+import re
+import time
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any
+
+from medicalagent.adapters.academic import openalex, openalex_works
+from medicalagent.config.settings import CitationGraphSettings
+from medicalagent.domain.paper import Paper, normalize_doi
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.cache import CacheStats, MemoryLRUCache
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+
+logger = getLogger(__name__)
+
+# Card fields plus outgoing edges; no abstracts or authors
+GRAPH_FIELDS = [
+    "id",
+    "title",
+    "publication_year",
+    "cited_by_count",
+    "doi",
+    "primary_location",
+    "referenced_works",
+]
+
+_WORK_ID = re.compile(r"W\d+")
+
+
+@dataclass
+class GraphNode:
+    work_id: str
+    paper: Paper
+    # Ids of the works this one cites
+    references: list[str]
+
+
+@dataclass
+class RelatedWork:
+    paper: Paper
+    # "cites" or "cited by", relative to `via`
+    relation: str
+    via: str
+    depth: int
+
+
+@dataclass
+class CitationExpansion:
+    seed: Paper
+    related: list[RelatedWork] = field(default_factory=list)
+    # Set when the time budget stopped the walk early
+    truncated: bool = False
+    failures: list[str] = field(default_factory=list)
+
+
+class CitationGraph:
+    """Breadth-first walk over OpenAlex citations, both directions.
+
+    Each visited work contributes its `fan_out` most cited references and
+    its `fan_out` most cited citing works to the next level. References of
+    a whole level are fetched in batched `openalex:` requests; citing works
+    take one `cites:` request per node. Works and edges are kept in a local
+    LRU, so overlapping expansions (the same study from several news items)
+    go upstream once.
+    """
+
+    def __init__(self, settings: CitationGraphSettings | None = None) -> None:
+        self.settings = settings or CitationGraphSettings()
+        self.cache_stats = CacheStats()
+        self._cache = MemoryLRUCache(
+            self.settings.cache_max_entries,
+            self.settings.cache_max_bytes,
+            self.cache_stats,
+        )
+
+    def expand(
+        self,
+        transport: AbstractSyncHTTPTransport,
+        seed: str,
+        depth: int = 1,
+        fan_out: int = 5,
+    ) -> CitationExpansion:
+        """Works around `seed` (DOI or OpenAlex id), most cited first.
+
+        Raises ValueError for an unknown seed; failures past the seed are
+        recorded on the result and skipped.
+        """
+        depth = max(1, min(depth, self.settings.max_depth))
+        fan_out = max(1, min(fan_out, self.settings.max_fan_out))
+        deadline = time.monotonic() + self.settings.time_budget
+
+        seed_node = self._seed(transport, seed)
+        expansion = CitationExpansion(seed=seed_node.paper)
+        visited = {seed_node.work_id}
+        frontier = [seed_node]
+        for level in range(1, depth + 1):
+            references = self._nodes(
+                transport,
+                [ref for node in frontier for ref in node.references],
+                deadline,
+                expansion,
+            )
+            next_frontier = []
+            for node in frontier:
+                if time.monotonic() >= deadline:
+                    expansion.truncated = True
+                    break
+                neighbors = [
+                    ("cites", self._citing(transport, node, expansion)),
+                    (
+                        "cited by",
+                        [references[r] for r in node.references if r in references],
+                    ),
+                ]
+                for relation, nodes in neighbors:
+                    fresh = [n for n in nodes if n.work_id not in visited]
+                    fresh.sort(key=lambda n: n.paper.citations or 0, reverse=True)
+                    for neighbor in fresh[:fan_out]:
+                        visited.add(neighbor.work_id)
+                        next_frontier.append(neighbor)
+                        expansion.related.append(
+                            RelatedWork(neighbor.paper, relation, node.work_id, level)
+                        )
+            if expansion.truncated:
+                break
+            frontier = next_frontier
+
+        expansion.related.sort(key=lambda r: r.paper.citations or 0, reverse=True)
+        logger.debug(
+            f"Citation graph around {seed_node.work_id}: "
+            f"{len(expansion.related)} works, truncated={expansion.truncated}, "
+            f"cache {self.cache_stats.as_dict()}"
+        )
+        return expansion
+
+    def _seed(self, transport: AbstractSyncHTTPTransport, seed: str) -> GraphNode:
+        doi = normalize_doi(seed)
+        if doi and doi.startswith("10."):
+            found, work_id = self._get(f"doi:{doi}")
+            if not found:
+                works = openalex.filter_works(transport, f"doi:{doi}", 1, GRAPH_FIELDS)
+                if not works:
+                    raise ValueError(f"No OpenAlex work with DOI {doi}")
+                work_id = self._store(works)[0].work_id
+                self._cache.set(f"doi:{doi}", work_id, self.settings.cache_ttl, 64)
+        else:
+            work_id = openalex.short_id(seed)
+            if not _WORK_ID.fullmatch(work_id):
+                raise ValueError(f"{seed!r} is neither a DOI nor an OpenAlex work id")
+        nodes = self._nodes(transport, [work_id], None, None)
+        if work_id not in nodes:
+            raise ValueError(f"No OpenAlex work {work_id}")
+        return nodes[work_id]
+
+    def _nodes(
+        self,
+        transport: AbstractSyncHTTPTransport,
+        work_ids: list[str],
+        deadline: float | None,
+        expansion: CitationExpansion | None,
+    ) -> dict[str, GraphNode]:
+        """Cached nodes, the missing ones fetched in batches of ids"""
+        nodes: dict[str, GraphNode] = {}
+        missing = []
+        for work_id in dict.fromkeys(work_ids):
+            found, node = self._get(f"work:{work_id}")
+            if found:
+                nodes[work_id] = node
+            else:
+                missing.append(work_id)
+
+        batch_size = openalex.DOI_BATCH_SIZE
+        for start in range(0, len(missing), batch_size):
+            if deadline is not None and time.monotonic() >= deadline:
+                if expansion is not None:
+                    expansion.truncated = True
+                break
+            chunk = missing[start : start + batch_size]
+            filter_ = "openalex:" + "|".join(chunk)
+            try:
+                works = openalex.filter_works(
+                    transport, filter_, len(chunk), GRAPH_FIELDS
+                )
+            except BaseTransportException as e:
+                if expansion is None:
+                    raise
+                expansion.failures.append(f"references: {e.message}")
+                continue
+            nodes.update((node.work_id, node) for node in self._store(works))
+        return nodes
+
+    def _citing(
+        self,
+        transport: AbstractSyncHTTPTransport,
+        node: GraphNode,
+        expansion: CitationExpansion,
+    ) -> list[GraphNode]:
+        """Most cited works citing `node`; the edge list is cached"""
+        key = f"citing:{node.work_id}"
+        found, citing_ids = self._get(key)
+        if found:
+            cached = self._nodes(transport, citing_ids, None, expansion)
+            return [cached[work_id] for work_id in citing_ids if work_id in cached]
+
+        try:
+            works = openalex.filter_works(
+                transport,
+                f"cites:{node.work_id}",
+                self.settings.citing_page_size,
+                GRAPH_FIELDS,
+                sort="cited_by_count:desc",
+            )
+        except BaseTransportException as e:
+            expansion.failures.append(f"works citing {node.work_id}: {e.message}")
+            return []
+        nodes = self._store(works)
+        citing_ids = [n.work_id for n in nodes]
+        self._cache.set(key, citing_ids, self.settings.cache_ttl, 16 * len(citing_ids))
+        return nodes
+
+    def _get(self, key: str) -> tuple[bool, Any]:
+        found, value = self._cache.get(key)
+        self.cache_stats.incr("hits" if found else "misses")
+        return found, value
+
+    def _store(self, works: list[dict]) -> list[GraphNode]:
+        nodes = []
+        for work in works:
+            references = [
+                openalex.short_id(r) for r in work.get("referenced_works") or []
+            ]
+            node = GraphNode(
+                work_id=openalex.short_id(work.get("id") or ""),
+                paper=openalex_works.work_to_paper(work),
+                references=references,
+            )
+            # Rough size: the byte bound only needs to be in the right range
+            size = 512 + 16 * len(references)
+            self._cache.set(f"work:{node.work_id}", node, self.settings.cache_ttl, size)
+            nodes.append(node)
+        return nodes
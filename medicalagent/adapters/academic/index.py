@@ -0,0 +1,154 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from logging import getLogger
+
+from medicalagent.config import settings
+from medicalagent.domain.paper import Paper, QueryRun
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+from medicalagent.ports.paper_repository import PaperRepository
+
+logger = getLogger(__name__)
+
+
+# Shown with results served from the index because upstream failed
+STALE_NOTE = (
+    "NOTE: {source} is unavailable; showing previously indexed papers, "
+    "which may miss recent ones."
+)
+
+
+@dataclass
+class IndexedSearch:
+    papers: list[Paper]
+    # Upstream failed; the papers are indexed ones of any age
+    stale: bool = False
+
+
+def search_with_index(  # noqa: PLR0913
+    repository: PaperRepository,
+    source: str,
+    query: str,
+    year_min: int | None,
+    limit: int,
+    *,
+    fetch: Callable[[], list[Paper]],
+    store: bool = True,
+) -> IndexedSearch:
+    """Papers from the index if this query went upstream recently, else from
+    `fetch` (stored, unless `store` is false for partial records).
+
+    Freshness is tracked per query, not per paper: a warm index must not
+    hide papers published since the query last went upstream. When `fetch`
+    fails, indexed papers of any age are served instead, if there are any.
+    """
+    papers = lookup_papers(repository, source, query, year_min, limit)
+    if papers is not None:
+        return IndexedSearch(papers)
+    try:
+        papers = fetch()
+    except BaseTransportException:
+        stale = _search(repository, source, query, year_min, limit, max_age=None)
+        if not stale:
+            raise
+        logger.warning(f"{source} unavailable, serving indexed papers for {query!r}")
+        return IndexedSearch(stale, stale=True)
+    if store:
+        index_papers(repository, papers)
+        _record_run(
+            repository,
+            QueryRun(
+                source=source,
+                query=query,
+                year_min=year_min,
+                limit=limit,
+                found=len(papers),
+            ),
+        )
+    return IndexedSearch(papers)
+
+
+def lookup_papers(
+    repository: PaperRepository,
+    source: str,
+    query: str,
+    year_min: int | None,
+    limit: int,
+) -> list[Paper] | None:
+    """Indexed papers from `source` answering the query.
+
+    None unless the query went upstream within the query TTL, for at least
+    `limit` results, and the index returns as many as that run found; the
+    caller then goes upstream. Index failures are logged and treated as
+    misses.
+    """
+    index_settings = settings.PAPER_INDEX
+    if not index_settings.enabled:
+        return None
+    try:
+        run = repository.get_query_run(
+            source, query, year_min, index_settings.query_max_age
+        )
+    except Exception:
+        logger.warning("Paper index query lookup failed", exc_info=True)
+        return None
+    if run is None or run.limit < limit:
+        logger.debug(f"Paper index miss for {source} {query!r}: not run recently")
+        return None
+    papers = _search(
+        repository, source, query, year_min, limit, max_age=index_settings.max_age
+    )
+    if papers is None or len(papers) < min(limit, run.found):
+        logger.debug(f"Paper index miss for {source} {query!r}")
+        return None
+    logger.debug(f"Paper index hit for {source} {query!r}")
+    return papers
+
+
+def index_papers(repository: PaperRepository, papers: list[Paper]) -> None:
+    """Store freshly fetched papers; never fails the search that fetched them"""
+    if not settings.PAPER_INDEX.enabled or not papers:
+        return
+    try:
+        repository.upsert(papers)
+    except Exception:
+        logger.warning("Paper index update failed", exc_info=True)
+
+
+def lookup_dois(repository: PaperRepository, dois: list[str]) -> list[Paper]:
+    """Fresh indexed papers with the given DOIs; failures count as misses"""
+    index_settings = settings.PAPER_INDEX
+    if not index_settings.enabled or not dois:
+        return []
+    try:
+        return repository.get_by_dois(dois, index_settings.max_age)
+    except Exception:
+        logger.warning("Paper index DOI lookup failed", exc_info=True)
+        return []
+
+
+def _search(  # noqa: PLR0913
+    repository: PaperRepository,
+    source: str,
+    query: str,
+    year_min: int | None,
+    limit: int,
+    *,
+    max_age: timedelta | None,
+) -> list[Paper] | None:
+    if not settings.PAPER_INDEX.enabled:
+        return None
+    try:
+        return repository.search(query, limit, year_min, source, max_age)
+    except Exception:
+        logger.warning("Paper index lookup failed", exc_info=True)
+        return None
+
+
+def _record_run(repository: PaperRepository, run: QueryRun) -> None:
+    if not settings.PAPER_INDEX.enabled:
+        return
+    try:
+        repository.record_query_run(run)
+    except Exception:
+        logger.warning("Paper index query update failed", exc_info=True)
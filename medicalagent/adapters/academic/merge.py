@@ -0,0 +1,41 @@
+from medicalagent.domain.paper import Paper, normalize_title
+
+# Reciprocal rank fusion damping: the usual value from the literature
+RRF_K = 60
+# Shorter titles ("Editorial", "Correction") are too generic to match on
+MIN_TITLE_WORDS = 4
+
+
+def merge_papers(rankings: list[list[Paper]]) -> list[Paper]:
+    """Merge per-source result lists into one deduplicated ranking.
+
+    Papers are the same if their DOIs or their normalized titles match.
+    Ranked by reciprocal rank fusion - a paper several sources rank highly
+    comes first - with citations breaking ties.
+    """
+    merged: dict[str, Paper] = {}
+    scores: dict[str, float] = {}
+    # DOI and title keys -> key of the merged record they belong to
+    aliases: dict[str, str] = {}
+
+    for ranking in rankings:
+        for rank, paper in enumerate(ranking, start=1):
+            paper_keys = _match_keys(paper)
+            key = next((aliases[k] for k in paper_keys if k in aliases), paper_keys[0])
+            merged[key] = merged[key].merged_with(paper) if key in merged else paper
+            scores[key] = scores.get(key, 0.0) + 1 / (RRF_K + rank)
+            for paper_key in paper_keys:
+                aliases.setdefault(paper_key, key)
+
+    ranked = sorted(
+        merged, key=lambda k: (scores[k], merged[k].citations or 0), reverse=True
+    )
+    return [merged[key] for key in ranked]
+
+
+def _match_keys(paper: Paper) -> list[str]:
+    keys = [paper.dedup_key]
+    title = normalize_title(paper.title)
+    if paper.doi and len(title.split()) >= MIN_TITLE_WORDS:
+        keys.append(f"title:{title}")
+    return keys
@@ -0,0 +1,54 @@
+"""OpenAlex work JSON -> Paper, shared by every OpenAlex request."""
+
+from typing import Any
+
+from medicalagent.domain.paper import Paper, normalize_doi
+
+SOURCE_NAME = "OpenAlex"
+
+
+def reconstruct_abstract(
+    index: dict[str, list[int]] | None, max_chars: int | None = None
+) -> str | None:
+    """OpenAlex ships abstracts as {word: [positions]}.
+
+    Each word is placed straight into its slot of a preallocated list, so
+    there is no (position, word) list to build and sort. With `max_chars`,
+    positions that cannot start within the limit (every word but the last
+    takes at least two chars with its space) are never placed.
+    """
+    if not index:
+        return None
+    size = max(map(max, filter(None, index.values())), default=-1) + 1
+    if max_chars is not None:
+        size = min(size, (max_chars + 1) // 2)
+    words = [""] * size
+    for word, positions in index.items():
+        for pos in positions:
+            if pos < size:
+                words[pos] = word
+    # Missing positions (rare) leave empty slots behind
+    abstract = " ".join(filter(None, words))
+    if max_chars is not None:
+        abstract = abstract[:max_chars]
+    return abstract or None
+
+
+def work_to_paper(work: dict[str, Any], abstract_chars: int | None = None) -> Paper:
+    location = work.get("primary_location") or {}
+    authors = []
+    for authorship in work.get("authorships") or ():
+        author = authorship.get("author") or {}
+        authors.append(author.get("display_name") or "Unknown")
+    return Paper(
+        title=work.get("title") or "Untitled",
+        year=work.get("publication_year"),
+        doi=normalize_doi(work.get("doi")),
+        url=location.get("landing_page_url") or work.get("id"),
+        abstract=reconstruct_abstract(
+            work.get("abstract_inverted_index"), abstract_chars
+        ),
+        authors=authors,
+        citations=work.get("cited_by_count") or 0,
+        sources=[SOURCE_NAME],
+    )
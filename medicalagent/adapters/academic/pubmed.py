@@ -0,0 +1,165 @@
+import re
+from typing import Any
+from xml.etree.ElementTree import Element  # nosec B405
+
+from medicalagent.config import settings
+from medicalagent.domain.paper import Paper, normalize_doi
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.exceptions import ClientError
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+from medicalagent.infra.requests_transport.streaming import iter_xml_elements
+
+SOURCE_NAME = "PubMed"
+EUTILS_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+ESEARCH_URL = f"{EUTILS_URL}/esearch.fcgi"
+EFETCH_URL = f"{EUTILS_URL}/efetch.fcgi"
+ARTICLE_URL = "https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+
+_YEAR = re.compile(r"\d{4}")
+
+
+def search_papers(
+    transport: AbstractSyncHTTPTransport,
+    query: str,
+    year_min: int | None = None,
+    limit: int = 5,
+) -> list[Paper]:
+    """Most relevant PubMed articles: one esearch plus one batched efetch.
+
+    esearch leaves the result set on the NCBI history server and efetch
+    reads all records from it at once, instead of one call per PMID.
+    """
+    pmids, webenv, query_key = search_pmids(transport, query, year_min, limit)
+    if not pmids:
+        return []
+    papers: list[Paper] = []
+    if webenv and query_key:
+        try:
+            papers = fetch_papers(transport, pmids, webenv, query_key)
+        except ClientError:
+            # esearch answers are cached; their history session may be gone
+            papers = []
+    return papers or fetch_papers(transport, pmids)
+
+
+def search_pmids(
+    transport: AbstractSyncHTTPTransport,
+    query: str,
+    year_min: int | None = None,
+    limit: int = 5,
+) -> tuple[list[str], str | None, str | None]:
+    """PMIDs in relevance order, plus the history server WebEnv/query_key"""
+    params = {
+        **_common_params(),
+        "term": query,
+        "retmax": limit,
+        "retmode": "json",
+        "sort": "relevance",
+        "usehistory": "y",
+    }
+    if year_min:
+        # Publication date range; E-utilities need both ends
+        params.update(datetype="pdat", mindate=str(year_min), maxdate="3000")
+    response = transport.request(
+        HTTPRequestData(method="GET", url=ESEARCH_URL, params=params)
+    )
+    result = response.get("esearchresult") or {}
+    return result.get("idlist") or [], result.get("webenv"), result.get("querykey")
+
+
+def fetch_papers(
+    transport: AbstractSyncHTTPTransport,
+    pmids: list[str],
+    webenv: str | None = None,
+    query_key: str | None = None,
+) -> list[Paper]:
+    """Full records in one efetch: from the history server when given a
+    WebEnv, else by PMID list. The XML is parsed as it streams in.
+    """
+    params: dict[str, Any] = {
+        **_common_params(),
+        "retmode": "xml",
+        "rettype": "abstract",
+    }
+    if webenv and query_key:
+        params.update(WebEnv=webenv, query_key=query_key, retstart=0)
+        params["retmax"] = len(pmids)
+    else:
+        params["id"] = ",".join(pmids)
+    _, chunks = transport.stream(
+        HTTPRequestData(method="GET", url=EFETCH_URL, params=params)
+    )
+    return [
+        article_to_paper(article)
+        for article in iter_xml_elements(chunks, "PubmedArticle")
+    ]
+
+
+def article_to_paper(article: Element) -> Paper:
+    citation = article.find("MedlineCitation")
+    if citation is None:
+        citation = Element("MedlineCitation")
+    pmid = citation.findtext("PMID")
+    details = citation.find("Article")
+    if details is None:
+        details = Element("Article")
+
+    abstract_parts = []
+    for part in details.iterfind("Abstract/AbstractText"):
+        text = _text(part)
+        label = part.get("Label")
+        abstract_parts.append(f"{label}: {text}" if label else text)
+
+    authors = []
+    for author in details.iterfind("AuthorList/Author"):
+        name = author.findtext("CollectiveName") or " ".join(
+            filter(None, (author.findtext("LastName"), author.findtext("Initials")))
+        )
+        if name:
+            authors.append(name)
+
+    doi = None
+    for article_id in article.iterfind("PubmedData/ArticleIdList/ArticleId"):
+        if article_id.get("IdType") == "doi":
+            doi = normalize_doi(article_id.text)
+            break
+
+    return Paper(
+        title=_text(details.find("ArticleTitle")) or "Untitled",
+        year=_year(details),
+        doi=doi,
+        url=ARTICLE_URL.format(pmid=pmid) if pmid else None,
+        abstract=" ".join(abstract_parts) or None,
+        authors=authors,
+        sources=[SOURCE_NAME],
+    )
+
+
+def _year(details: Element) -> int | None:
+    """Journal issue date, else electronic publication date"""
+    pub_date = details.find("Journal/JournalIssue/PubDate")
+    if pub_date is not None:
+        text = pub_date.findtext("Year") or pub_date.findtext("MedlineDate") or ""
+        if match := _YEAR.search(text):
+            return int(match.group())
+    year = details.findtext("ArticleDate/Year")
+    return int(year) if year and year.isdigit() else None
+
+
+def _text(element: Element | None) -> str:
+    """Element text including inline markup (<i>, <sup>, ...)"""
+    if element is None:
+        return ""
+    return " ".join("".join(element.itertext()).split())
+
+
+def _common_params() -> dict[str, Any]:
+    search_settings = settings.ACADEMIC_SEARCH
+    params = {
+        "db": "pubmed",
+        "tool": search_settings.ncbi_tool,
+        "email": search_settings.ncbi_email,
+    }
+    if search_settings.ncbi_api_key:
+        params["api_key"] = search_settings.ncbi_api_key
+    return params
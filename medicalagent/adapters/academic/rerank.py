@@ -0,0 +1,169 @@
+"""CPU-only relevance re-ranking of academic results.
+
+Sources rank by their own criteria (OpenAlex by year and citations), so
+tools over-fetch candidates and keep the ones most relevant to the tool
+query and the user's prompt: BM25 over title and abstract, fused with the
+cosine similarity of a small local embedding model when one is configured.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from logging import getLogger
+
+from medicalagent.adapters.academic.merge import RRF_K
+from medicalagent.config.settings import RerankSettings
+from medicalagent.domain.paper import Paper
+from medicalagent.domain.sites import DomainMatcher
+
+try:
+    import numpy as np
+    from fastembed import TextEmbedding
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+    TextEmbedding = None  # type: ignore[assignment,misc]
+
+logger = getLogger(__name__)
+
+_TERM = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+# Question phrasing and filler; domain words are left to IDF
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have how i in is it its"
+    " me my of on or show tell that the their there these this to was were"
+    " what when which who why will with find latest news new recent about any"
+    " please papers paper studies study research".split()
+)
+
+
+def terms(text: str) -> list[str]:
+    return [t for t in _TERM.findall(text.casefold()) if t not in STOPWORDS]
+
+
+class Reranker:
+    """Orders candidate papers by relevance to one or more queries.
+
+    The embedding model, if any, is loaded on first use and shared by all
+    sessions; a missing or broken model falls back to BM25 alone.
+    """
+
+    def __init__(self, settings: RerankSettings | None = None) -> None:
+        self.settings = settings or RerankSettings()
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._model_failed = False
+
+    def candidates(self, limit: int) -> int:
+        """How many results to fetch to show `limit` of them"""
+        if not self.settings.enabled:
+            return limit
+        return max(
+            limit,
+            min(limit * self.settings.candidate_factor, self.settings.max_candidates),
+        )
+
+    def rerank(
+        self,
+        papers: list[Paper],
+        queries: list[str],
+        limit: int,
+        trusted: DomainMatcher | None = None,
+    ) -> list[Paper]:
+        """The `limit` papers most relevant to `queries`, best first.
+
+        Rankings (BM25, embeddings, landing page on a `trusted` domain) are
+        fused by reciprocal rank; ties keep the source order.
+        """
+        preferred = [1.0 if trusted and trusted.matches(p.url) else 0.0 for p in papers]
+        query = " ".join(q for q in queries if q)
+        if not self.settings.enabled or len(papers) <= 1 or not query.strip():
+            order = sorted(range(len(papers)), key=lambda i: -preferred[i])
+            return [papers[i] for i in order[:limit]]
+
+        rankings = [_ranks(self.bm25(papers, query))]
+        similarities = self._similarities(papers, query)
+        if similarities is not None:
+            rankings.append(_ranks(similarities))
+        if any(preferred):
+            rankings.append(_ranks(preferred))
+        scores = [
+            sum(1 / (RRF_K + ranks[i]) for ranks in rankings)
+            for i in range(len(papers))
+        ]
+        order = sorted(range(len(papers)), key=lambda i: (-scores[i], i))
+        return [papers[i] for i in order[:limit]]
+
+    def bm25(self, papers: list[Paper], query: str) -> list[float]:
+        """Okapi BM25 of each paper against `query`; IDF over the candidates"""
+        documents = [
+            Counter(
+                terms(paper.title) * self.settings.title_weight
+                + terms(paper.abstract or "")
+            )
+            for paper in papers
+        ]
+        lengths = [sum(document.values()) for document in documents]
+        average = sum(lengths) / len(lengths) or 1
+        k1, b = self.settings.k1, self.settings.b
+
+        scores = [0.0] * len(documents)
+        for term in set(terms(query)):
+            frequency = sum(1 for document in documents if term in document)
+            if not frequency:
+                continue
+            idf = math.log(1 + (len(documents) - frequency + 0.5) / (frequency + 0.5))
+            for i, document in enumerate(documents):
+                tf = document[term]
+                if tf:
+                    norm = k1 * (1 - b + b * lengths[i] / average)
+                    scores[i] += idf * tf * (k1 + 1) / (tf + norm)
+        return scores
+
+    def _similarities(self, papers: list[Paper], query: str) -> list[float] | None:
+        model = self._embedding_model()
+        if model is None:
+            return None
+        texts = [f"{paper.title}. {paper.abstract or ''}" for paper in papers]
+        try:
+            query_vector = np.asarray(next(iter(model.query_embed([query]))))
+            vectors = np.asarray(list(model.passage_embed(texts)))
+        except Exception:
+            logger.exception("Embedding re-rank failed, using BM25 only")
+            return None
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector)
+        return (vectors @ query_vector / np.maximum(norms, 1e-12)).tolist()
+
+    def _embedding_model(self):  # noqa: ANN202
+        if not self.settings.embedding_model or self._model_failed:
+            return None
+        with self._model_lock:
+            if self._model is None and not self._model_failed:
+                if TextEmbedding is None:
+                    logger.warning(
+                        "RERANK__EMBEDDING_MODEL is set but fastembed is not installed"
+                    )
+                    self._model_failed = True
+                    return None
+                try:
+                    self._model = TextEmbedding(
+                        model_name=self.settings.embedding_model
+                    )
+                except Exception:
+                    logger.exception("Could not load the re-rank embedding model")
+                    self._model_failed = True
+            return self._model
+
+
+def _ranks(scores: list[float]) -> list[int]:
+    """1-based rank of each score, highest first; equal scores share a rank,
+    so a ranking cannot favour one of two equally scored papers.
+    """
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])
+    ranks = [0] * len(scores)
+    for position, index in enumerate(order):
+        previous = order[position - 1]
+        if position and scores[index] == scores[previous]:
+            ranks[index] = ranks[previous]
+        else:
+            ranks[index] = position + 1
+    return ranks
@@ -0,0 +1,136 @@
+import time
+from collections.abc import Iterator
+from logging import getLogger
+from typing import Any
+
+from medicalagent.domain.paper import Paper, normalize_doi
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+from medicalagent.infra.requests_transport.streaming import (
+    iter_file_chunks,
+    iter_json_items,
+    json_value,
+    spool,
+)
+
+logger = getLogger(__name__)
+
+SOURCE_NAME = "Semantic Scholar"
+SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+# Up to 1000 papers per page, continued with a token; no relevance ranking
+BULK_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
+BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+# The batch endpoint accepts up to 500 ids per request
+DOI_BATCH_SIZE = 500
+
+# We request specific fields to help the agent judge relevance/impact
+PAPER_FIELDS = [
+    "title",
+    "url",
+    "abstract",
+    "year",
+    "citationCount",
+    "isOpenAccess",
+    "authors",
+    "externalIds",  # DOI, to merge with other sources
+]
+
+# Projection for citation checks: no abstracts or author lists, which are
+# most of the payload
+CITATION_FIELDS = ["title", "url", "year", "citationCount", "externalIds"]
+
+
+def search_papers(
+    transport: AbstractSyncHTTPTransport,
+    query: str,
+    year_min: int | None = None,
+    limit: int = 5,
+    fields: list[str] = PAPER_FIELDS,
+) -> list[Paper]:
+    params: dict[str, Any] = {
+        "query": query,
+        "limit": limit,
+        "fields": ",".join(fields),
+    }
+    if year_min:
+        params["year"] = f"{year_min}-"
+    response = transport.request(
+        HTTPRequestData(method="GET", url=SEARCH_URL, params=params)
+    )
+    # The 'data' key contains the list of papers
+    return [paper_from_json(paper) for paper in response.get("data") or []]
+
+
+def iter_bulk_search(  # noqa: PLR0913
+    transport: AbstractSyncHTTPTransport,
+    query: str,
+    year_min: int | None = None,
+    *,
+    fields: list[str] = CITATION_FIELDS,
+    sort: str = "citationCount:desc",
+    deadline: float | None = None,
+) -> Iterator[Paper]:
+    """Papers matching the query in `sort` order, page by page.
+
+    Pages are fetched lazily while the consumer keeps reading, following
+    the continuation token; none is requested after `deadline`
+    (time.monotonic()). Keep `fields` small: a page holds up to 1000 papers.
+    Pages are streamed, so they bypass the response cache.
+    """
+    params: dict[str, Any] = {
+        "query": query,
+        "fields": ",".join(fields),
+        "sort": sort,
+    }
+    if year_min:
+        params["year"] = f"{year_min}-"
+    while True:
+        # Pages run to megabytes: spool each one (spilling to disk) and
+        # parse it a record at a time, stopping when the consumer does
+        with spool(
+            transport,
+            HTTPRequestData(method="GET", url=BULK_SEARCH_URL, params=dict(params)),
+        ) as page:
+            for paper in iter_json_items(iter_file_chunks(page), "data"):
+                yield paper_from_json(paper)
+            page.seek(0)
+            token = json_value(iter_file_chunks(page), "token")
+
+        if not token:
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.debug(f"Bulk search for {query!r} stopped by time budget")
+            return
+        params["token"] = token
+
+
+def get_papers_by_dois(
+    transport: AbstractSyncHTTPTransport, dois: list[str]
+) -> list[Paper]:
+    """Papers for up to DOI_BATCH_SIZE normalized DOIs in one request"""
+    response = transport.request(
+        HTTPRequestData(
+            method="POST",
+            url=BATCH_URL,
+            params={"fields": ",".join(PAPER_FIELDS)},
+            json_body={"ids": [f"DOI:{doi}" for doi in dois]},
+        )
+    )
+    # One entry per requested id, in order; null for unknown ids
+    return [paper_from_json(paper) for paper in response or [] if paper]
+
+
+def paper_from_json(paper: dict[str, Any]) -> Paper:
+    external_ids = paper.get("externalIds") or {}
+    return Paper(
+        title=paper.get("title") or "Untitled",
+        year=paper.get("year"),
+        doi=normalize_doi(external_ids.get("DOI")),
+        url=paper.get("url"),
+        abstract=paper.get("abstract"),
+        authors=[
+            author.get("name") or "Unknown" for author in paper.get("authors") or []
+        ],
+        citations=paper.get("citationCount") or 0,
+        sources=[SOURCE_NAME],
+    )
@@ -7,7 +7,6 @@ from langchain.agents.middleware import (
     ModelFallbackMiddleware,
     SummarizationMiddleware,
 )
-from langchain_community.tools import DuckDuckGoSearchRun
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import (
     AIMessage,
@@ -20,12 +19,21 @@ from langgraph.pregel.main import RunnableConfig
 
 from medicalagent.adapters.agent.schemas import AgentContext
 from medicalagent.adapters.agent.system_prompt import SYSTEM_PROMPT
+from medicalagent.adapters.agent.tools.academic_search_tool import (
+    academic_search_tool,
+)
+from medicalagent.adapters.agent.tools.citation_graph_tool import citation_graph_tool
+from medicalagent.adapters.agent.tools.duckduckgo_search_tool import (
+    duckduckgo_search_tool,
+)
 from medicalagent.adapters.agent.tools.openalex_search_tool import openalex_search_tool
+from medicalagent.adapters.agent.tools.paper_lookup_tool import paper_lookup_tool
+from medicalagent.adapters.agent.tools.pubmed_search_tool import pubmed_search_tool
 from medicalagent.adapters.agent.tools.save_finding_tool import save_finding_tool
 from medicalagent.adapters.agent.tools.semantic_scholar_search import (
     semantic_scholar_tool,
 )
-from medicalagent.adapters.agent.tools.tavilysearch import get_tavily
+from medicalagent.adapters.agent.tools.tavilysearch import tavily_search_tool
 from medicalagent.config import settings
 from medicalagent.domain.dialog import ChatMessage
 from medicalagent.ports.agent import AgentService
@@ -53,8 +61,6 @@ class LangChainAgentService(AgentService):
 
     def _create_agent(self) -> CompiledStateGraph:
         """Create and configure the LangChain agent."""
-        duckducksearch_tool = DuckDuckGoSearchRun()
-
         primary_model = ChatGroq(
             model_name=settings.AI_SETTINGS.primary_model,
             temperature=0,
@@ -86,9 +92,13 @@ class LangChainAgentService(AgentService):
             system_prompt=SystemMessage(SYSTEM_PROMPT),
             model=primary_model,
             tools=[
-                get_tavily(),
+                tavily_search_tool,
                 save_finding_tool,
-                duckducksearch_tool,
+                duckduckgo_search_tool,
+                academic_search_tool,
+                paper_lookup_tool,
+                citation_graph_tool,
+                pubmed_search_tool,
                 semantic_scholar_tool,
                 openalex_search_tool,
             ],
@@ -123,6 +133,7 @@ class LangChainAgentService(AgentService):
         chat_history: list[ChatMessage],
         dialog_id: int,
         callbacks: list[BaseCallbackHandler] | None = None,
+        trusted_sites: list[str] | None = None,
     ) -> list[AIMessage]:
         try:
             # 1. GENERATE CONTEXT FROM FINDINGS # TODO: MAKE A MIDDLEWARE
@@ -177,9 +188,15 @@ class LangChainAgentService(AgentService):
             # 3. INVOKE
             result = self._agent.invoke(
                 {"messages": messages_payload},
-                context=AgentContext(container=self.container, dialog_id=dialog_id),
+                context=AgentContext(
+                    container=self.container,
+                    dialog_id=dialog_id,
+                    user_prompt=prompt,
+                    trusted_sites=trusted_sites or [],
+                ),
                 config=config,
             )
+            self.container.transport_metrics.log_snapshot()
             return [result["messages"][-1]]
 
         except Exception as e:
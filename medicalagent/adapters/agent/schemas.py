@@ -1,8 +1,19 @@
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from medicalagent.domain.sites import DomainMatcher
 
 
 class AgentContext(BaseModel):
     container: Any
     dialog_id: int
+    # The question being answered; tools rank results against it
+    user_prompt: str = ""
+    # From the user's profile; results from these domains are preferred
+    trusted_sites: list[str] = Field(default_factory=list)
+
+    @cached_property
+    def trusted_domains(self) -> DomainMatcher:
+        return DomainMatcher(self.trusted_sites)
@@ -56,7 +56,17 @@ class StreamlitStatusCallback(BaseCallbackHandler):
             inputs = kwargs.get("inputs") or {}
             query_msg = inputs.get("query") or input_str[:100]
             msg = f"🌍 *Searching the web for: {query_msg}*"
-        elif "openalex" in tool_name or "scholar" in tool_name:
+        elif any(
+            name in tool_name
+            for name in (
+                "openalex",
+                "scholar",
+                "academic",
+                "paper_lookup",
+                "citation",
+                "pubmed",
+            )
+        ):
             msg = "🎓 *Verifying evidence with academic databases...*"
         elif "save_finding" in tool_name:
             msg = "💾 *Archiving verified finding to sidebar...*"
@@ -0,0 +1,162 @@
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from logging import getLogger
+from typing import Any
+
+from langchain_core.tools import tool
+from langgraph.prebuilt.tool_node import ToolRuntime
+
+from medicalagent.adapters.academic import openalex, semantic_scholar
+from medicalagent.adapters.academic.index import (
+    STALE_NOTE,
+    IndexedSearch,
+    search_with_index,
+)
+from medicalagent.adapters.academic.merge import merge_papers
+from medicalagent.adapters.agent.tools.compaction import render_cards
+from medicalagent.adapters.agent.tools.openalex_search_tool import OpenAlexInput
+from medicalagent.config import settings
+from medicalagent.domain.paper import Paper
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.deadline import deadline_scope
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+
+logger = getLogger(__name__)
+
+SourceSearch = Callable[[AbstractSyncHTTPTransport, str, int | None, int], list[Paper]]
+
+SOURCES: dict[str, SourceSearch] = {
+    openalex.SOURCE_NAME: lambda *args: openalex.search_papers(
+        *args, time_budget=settings.ACADEMIC_SEARCH.deep_search_seconds
+    )[0],
+    semantic_scholar.SOURCE_NAME: semantic_scholar.search_papers,
+}
+
+# Shared by all sessions: sources are I/O bound, and each call still goes
+# through the sync transport stack (cache, rate limits, circuit breakers)
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="academic-search")
+
+
+class AcademicSearchInput(OpenAlexInput):
+    """Input schema for the federated academic search."""
+
+
+@tool("academic_search", args_schema=AcademicSearchInput)
+def academic_search_tool(
+    runtime: ToolRuntime,
+    query: str,
+    year_min: int | None = None,
+    max_results: int | None = None,
+) -> str:
+    """
+    Search OpenAlex and Semantic Scholar at the same time.
+    Returns one deduplicated list of papers ranked by agreement between the
+    sources, with Year, Citations, DOI link and a short Abstract.
+    Prefer this over calling openalex_search and semantic_scholar_search
+    one after another.
+    """
+    search_settings = settings.ACADEMIC_SEARCH
+    container = runtime.context.container
+    result_limit = max_results or search_settings.result_limit
+    # Sources stop retrying and queueing when the tool stops waiting
+    deadline = time.monotonic() + search_settings.timeout
+
+    futures: dict[str, Future[IndexedSearch]] = {
+        source: _executor.submit(
+            _search_source,
+            container,
+            source,
+            query,
+            year_min,
+            max(
+                search_settings.per_source_limit,
+                container.reranker.candidates(result_limit),
+            ),
+            deadline=deadline,
+        )
+        for source in SOURCES
+    }
+    wait(futures.values(), timeout=search_settings.timeout)
+    for future in futures.values():
+        # Still queued behind other searches: never start it
+        future.cancel()
+
+    rankings: list[list[Paper]] = []
+    failures: list[str] = []
+    stale: list[str] = []
+    for source, future in futures.items():
+        if future.cancelled() or not future.done():
+            failures.append(f"{source}: timed out")
+            continue
+        try:
+            search = future.result()
+            rankings.append(search.papers)
+            if search.stale:
+                stale.append(STALE_NOTE.format(source=source))
+        except BaseTransportException as e:
+            failures.append(f"{source}: {e.message} (Status: {e.status_code})")
+        except Exception as e:
+            logger.exception(f"{source} search failed")
+            failures.append(f"{source}: {str(e)}")
+
+    if not rankings:
+        return f"Academic Search Failed: {'; '.join(failures)}"
+
+    papers = container.reranker.rerank(
+        merge_papers(rankings),
+        [query, runtime.context.user_prompt],
+        result_limit,
+        trusted=runtime.context.trusted_domains,
+    )
+    if not papers:
+        output = ["No academic papers found for this query."]
+    else:
+        output = [render_cards(papers, format_paper)]
+    output.extend(stale)
+    if failures:
+        output.append(f"NOTE: Some sources were unavailable - {'; '.join(failures)}")
+    return "\n\n".join(output)
+
+
+def _search_source(  # noqa: PLR0913
+    container: Any,
+    source: str,
+    query: str,
+    year_min: int | None,
+    limit: int,
+    *,
+    deadline: float,
+) -> IndexedSearch:
+    """Answer from the local paper index when it can, else go upstream
+    (giving up at `deadline`)"""
+    with deadline_scope(deadline):
+        return search_with_index(
+            container.paper_repository,
+            source,
+            query,
+            year_min,
+            limit,
+            fetch=lambda: SOURCES[source](
+                container.http_transport, query, year_min, limit
+            ),
+        )
+
+
+def format_paper(
+    number: int, paper: Paper, abstract: str | None, author_limit: int
+) -> str:
+    """One result card; `abstract` and authors as cut to the output budget"""
+    lines = [
+        f"[{number}] {paper.title}",
+        f"Year: {paper.year or 'N/A'} | Citations: {paper.citations_label} | "
+        f"Sources: {', '.join(paper.sources)}",
+    ]
+    if author_limit and paper.authors:
+        lines.append(f"Authors: {paper.authors_short(author_limit)}")
+    lines.append(f"Link: {paper.link or 'N/A'}")
+    if abstract:
+        lines.append(f"Abstract: {abstract}")
+    elif not paper.abstract:
+        lines.append("Abstract: No abstract available.")
+    return "\n".join(lines)
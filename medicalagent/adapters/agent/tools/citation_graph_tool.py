@@ -0,0 +1,88 @@
+from typing import Any
+
+from langchain_core.tools import tool
+from langgraph.prebuilt.tool_node import ToolRuntime
+from pydantic import BaseModel, Field, field_validator
+
+from medicalagent.adapters.academic.citations import CitationExpansion, RelatedWork
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+
+
+class CitationGraphInput(BaseModel):
+    """Input schema for the citation graph expansion."""
+
+    work: str = Field(
+        description="DOI or OpenAlex work id of the key study (e.g. '10.1056/NEJMoa2032183')."
+    )
+    depth: int = Field(
+        default=1,
+        description="1 = direct citations and references; 2 = also their neighbours.",
+    )
+    fan_out: int = Field(
+        default=5,
+        description="Most cited citing works and references followed per paper.",
+    )
+    top_k: int = Field(default=10, description="How many related works to return.")
+
+    @field_validator("depth", "fan_out", "top_k", mode="before")
+    @classmethod
+    def coerce_to_int(cls, v: Any) -> Any:
+        """Coerces string inputs from the LLM into integers."""
+        try:
+            return int(v)
+        except (ValueError, TypeError):
+            return v
+
+
+@tool("citation_graph", args_schema=CitationGraphInput)
+def citation_graph_tool(
+    runtime: ToolRuntime, work: str, depth: int = 1, fan_out: int = 5, top_k: int = 10
+) -> str:
+    """
+    Find the most cited works that cite, or are cited by, a key study
+    (and, with depth=2, their neighbours) in one call.
+    Use it to judge a paper's impact and find the studies it builds on or
+    that followed it, instead of running several searches.
+    """
+    graph = runtime.context.container.citation_graph
+    try:
+        expansion = graph.expand(
+            runtime.context.container.http_transport, work, depth, fan_out
+        )
+        return _format_expansion(
+            expansion, max(1, min(top_k, graph.settings.max_results))
+        )
+    except ValueError as e:
+        return f"Citation Graph Failed: {str(e)}"
+    except BaseTransportException as e:
+        return f"Citation Graph Failed: {e.message} (Status: {e.status_code})"
+    except Exception as e:
+        return f"Unexpected Error in citation graph: {str(e)}"
+
+
+def _format_expansion(expansion: CitationExpansion, top_k: int) -> str:
+    seed = expansion.seed
+    output = [
+        f"Key study: {seed.title} ({seed.year or 'N/A'}) | "
+        f"Citations: {seed.citations} | Link: {seed.link or 'N/A'}"
+    ]
+    output.extend(
+        _format_related(number, related)
+        for number, related in enumerate(expansion.related[:top_k], start=1)
+    )
+    if not expansion.related:
+        output.append("No citing or referenced works found.")
+    if expansion.truncated:
+        output.append("NOTE: Time budget reached; the graph was only partly explored.")
+    if expansion.failures:
+        output.append(f"NOTE: Some lookups failed - {'; '.join(expansion.failures)}")
+    return "\n".join(output)
+
+
+def _format_related(number: int, related: RelatedWork) -> str:
+    paper = related.paper
+    return (
+        f"[{number}] {paper.title} ({paper.year or 'N/A'}) | "
+        f"Citations: {paper.citations} | {related.relation} {related.via} "
+        f"(depth {related.depth}) | {paper.link or 'N/A'}"
+    )
@@ -0,0 +1,162 @@
+"""Fit tool output into a token budget instead of fixed character slices.
+
+Cards are rendered at full detail first. If they exceed the budget,
+abstracts share what is left after the rest of the cards, then author lists
+are shortened, then trailing (lowest ranked) results are dropped.
+"""
+
+import re
+from collections.abc import Callable
+from functools import cache
+from logging import getLogger
+
+from medicalagent.config import settings
+from medicalagent.domain.paper import Paper
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None  # type: ignore[assignment]
+
+logger = getLogger(__name__)
+
+# number, paper, abstract (None to omit), authors shown (0 to omit)
+CardRenderer = Callable[[int, Paper, str | None, int], str]
+
+SEPARATOR = "\n\n"
+ELLIPSIS = "..."
+# Placeholder abstract, to measure what the 'Abstract:' lines cost
+STUB = "."
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+
+@cache
+def _encoding():  # noqa: ANN202
+    if tiktoken is None:
+        return None
+    try:
+        # Downloads the vocabulary on first use
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        logger.warning("tiktoken vocabulary unavailable, estimating token counts")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Prompt tokens of `text`, counted locally.
+
+    Uses tiktoken when installed; otherwise estimates BPE tokens as one per
+    punctuation mark and one per word, plus one per 6 chars of long words.
+    Either is close enough to budget with; neither is the model's tokenizer.
+    """
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return sum(1 + len(piece) // 6 for piece in _PIECE.findall(text))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Longest prefix of whole words within `max_tokens`, marked with '...'"""
+    if count_tokens(text) <= max_tokens:
+        return text
+    words = text.split()
+    low, high = 0, len(words)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(" ".join(words[:middle]) + ELLIPSIS) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return " ".join(words[:low]).rstrip(",;:") + ELLIPSIS if low else ""
+
+
+def render_cards(
+    papers: list[Paper], render: CardRenderer, max_tokens: int | None = None
+) -> str:
+    """Cards for `papers`, joined, within the tool output budget"""
+    output_settings = settings.TOOL_OUTPUT
+    budget = max_tokens or output_settings.max_tokens
+    author_limit = output_settings.author_limit
+
+    abstracts = [
+        truncate_tokens(p.abstract, output_settings.abstract_max_tokens)
+        if p.abstract
+        else None
+        for p in papers
+    ]
+    cards = _render(papers, render, abstracts, author_limit)
+    if _total(cards) <= budget:
+        return SEPARATOR.join(cards)
+
+    # 1. Abstracts share what the rest of the cards (and their labels) leave
+    stubs = [STUB if a else None for a in abstracts]
+    labelled = _total(_render(papers, render, stubs, author_limit))
+    shares = _share(abstracts, budget - labelled)
+    # Shares of the abstracts that would be cut (short ones fit whole)
+    cut = [
+        share for share, a in zip(shares, abstracts) if a and share < count_tokens(a)
+    ]
+    if any(abstracts) and min(cut, default=budget) >= (
+        output_settings.abstract_min_tokens
+    ):
+        abstracts = [
+            truncate_tokens(a, share) if a else None
+            for a, share in zip(abstracts, shares)
+        ]
+        cards = _render(papers, render, abstracts, author_limit)
+        if _total(cards) <= budget:
+            return SEPARATOR.join(cards)
+
+    # 2. No abstracts, shorter author lists
+    for limit in (1, 0):
+        cards = _render(papers, render, [None] * len(papers), min(limit, author_limit))
+        if _total(cards) <= budget:
+            return SEPARATOR.join(cards)
+
+    # 3. Drop the lowest ranked results; the note counts against the budget
+    total = len(cards)
+    while len(cards) > 1:
+        cards.pop()
+        note = f"({total - len(cards)} more results omitted to fit the output budget)"
+        if _total([*cards, note]) <= budget:
+            return SEPARATOR.join([*cards, note])
+    # Even the top card alone is over budget: cut it to what the note leaves
+    note = (
+        f"({total - 1} more results omitted to fit the output budget)"
+        if total > 1
+        else ""
+    )
+    room = budget - count_tokens(SEPARATOR + note) if note else budget
+    first = truncate_tokens(cards[0], max(room, 1))
+    return SEPARATOR.join(part for part in (first, note) if part)
+
+
+def _render(
+    papers: list[Paper],
+    render: CardRenderer,
+    abstracts: list[str | None],
+    author_limit: int,
+) -> list[str]:
+    return [
+        render(number, paper, abstract, author_limit)
+        for number, (paper, abstract) in enumerate(zip(papers, abstracts), start=1)
+    ]
+
+
+def _total(cards: list[str]) -> int:
+    return count_tokens(SEPARATOR.join(cards))
+
+
+def _share(abstracts: list[str | None], spare: int) -> list[int]:
+    """Split `spare` tokens over the abstracts; short ones pass their
+    unused share on to the longer ones.
+    """
+    sizes = [count_tokens(a) if a else 0 for a in abstracts]
+    shares = [0] * len(abstracts)
+    pending = sorted((i for i, size in enumerate(sizes) if size), key=sizes.__getitem__)
+    for position, index in enumerate(pending):
+        fair = max(spare, 0) // (len(pending) - position)
+        shares[index] = min(sizes[index], fair)
+        spare -= shares[index]
+    return shares
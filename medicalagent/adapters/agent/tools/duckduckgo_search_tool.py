@@ -0,0 +1,54 @@
+from functools import cache
+
+from langchain_community.tools import DuckDuckGoSearchResults
+from langchain_core.tools import tool
+from langgraph.prebuilt.tool_node import ToolRuntime
+from pydantic import BaseModel, Field
+
+from medicalagent.adapters.news.trusted import prefer_trusted
+
+
+class DuckDuckGoInput(BaseModel):
+    query: str = Field(description="Search query.")
+
+
+@cache
+def get_duckduckgo() -> DuckDuckGoSearchResults:
+    # The list format keeps links, which deduplication needs
+    return DuckDuckGoSearchResults(output_format="list")
+
+
+@tool("duckduckgo_search", args_schema=DuckDuckGoInput)
+def duckduckgo_search_tool(runtime: ToolRuntime, query: str) -> str:
+    """
+    A wrapper around DuckDuckGo Search.
+    Useful for when you need to answer questions about current events.
+    Input should be a search query.
+    """
+    results = get_duckduckgo().invoke(query)
+    if not isinstance(results, list):
+        return str(results)
+
+    # DuckDuckGo cannot be limited to domains; trusted sites are applied here
+    preferred = prefer_trusted(runtime.context.trusted_domains, results, "link")
+    # Syndicated copies and results already shown in this dialog
+    outcome = runtime.context.container.news_deduplicator.filter(
+        runtime.context.dialog_id,
+        preferred.results,
+        url_key="link",
+        text_keys=("title", "snippet"),
+    )
+    output = [
+        f"{result.get('title')}: {result.get('snippet')} ({result.get('link')})"
+        for result in outcome.kept
+    ]
+    # Shown by an earlier search; listed briefly so they stay reachable
+    output.extend(
+        f"Already shown: {result.get('title')} ({result.get('link')})"
+        for result in outcome.repeated
+    )
+    if outcome.duplicates:
+        output.append(f"({outcome.duplicates} duplicate results omitted)")
+    if preferred.fallback:
+        output.append("(No results from the user's trusted sites; showing all.)")
+    return "\n".join(output) or "No good DuckDuckGo Search Result was found"
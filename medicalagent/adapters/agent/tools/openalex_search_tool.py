@@ -4,8 +4,12 @@ from langchain_core.tools import tool
 from langgraph.prebuilt.tool_node import ToolRuntime
 from pydantic import BaseModel, Field, field_validator
 
+from medicalagent.adapters.academic import openalex
+from medicalagent.adapters.academic.index import STALE_NOTE, search_with_index
+from medicalagent.adapters.agent.tools.compaction import render_cards
+from medicalagent.config import settings
+from medicalagent.domain.paper import Paper
 from medicalagent.infra.requests_transport.exceptions import BaseTransportException
-from medicalagent.infra.requests_transport.schemas import HTTPRequestData
 
 
 class OpenAlexInput(BaseModel):
@@ -18,8 +22,17 @@ class OpenAlexInput(BaseModel):
         default=None,
         description="Filter for works published after this year (inclusive). Must be an integer.",
     )
+    max_results: int | None = Field(
+        default=None,
+        ge=1,
+        le=50,
+        description=(
+            "How many papers to return (default 5). Raise it (up to 50) for "
+            "academic backfill, to look beyond the top hits."
+        ),
+    )
 
-    @field_validator("year_min", mode="before")
+    @field_validator("year_min", "max_results", mode="before")
     @classmethod
     def coerce_year_to_int(cls, v: Any) -> int | None:
         """
@@ -38,119 +51,87 @@ class OpenAlexInput(BaseModel):
 
 @tool("openalex_search", args_schema=OpenAlexInput)
 def openalex_search_tool(
-    runtime: ToolRuntime, query: str, year_min: int | None = None
+    runtime: ToolRuntime,
+    query: str,
+    year_min: int | None = None,
+    max_results: int | None = None,
 ) -> str:
     """
     Search OpenAlex for scientific papers using the internal requests transport.
     Returns Title, Year, Citations, DOI, and Abstract.
     Automatically handles retries and year expansion if no results are found.
     """
-    # 1. Dependency Injection (Local import to avoid circular dependency)
-
-    transport = runtime.context.container.http_transport
-
-    base_url = "https://api.openalex.org/works"
-
-    # 2. Field Selection (Optimization: ~8x smaller response)
-    # We only fetch what we need to render the card.
-    fields = [
-        "id",
-        "title",
-        "publication_year",
-        "cited_by_count",
-        "doi",
-        "primary_location",
-        "authorships",
-        "abstract_inverted_index",  # Required to reconstruct the abstract
-    ]
-
-    # 3. Helper to build params and execute request
-    def execute_search(search_year: int | None) -> list:
-        # Construct Filters
-        # We filter for articles to avoid datasets/paratext
-        filters = ["type:article", "has_doi:true"]
-
-        if search_year:
-            # Use the efficient publication_year filter
-            filters.append(f"publication_year:>{search_year - 1}")
-
-        params = {
-            "search": query,
-            "filter": ",".join(filters),
-            # Sort by date (newest) then impact (citations)
-            "sort": "publication_year:desc,cited_by_count:desc",
-            "per_page": 5,
-            "select": ",".join(fields),
-            # Polite Pool: Increases rate limit to 10 req/s
-            "mailto": "medical_agent_user@example.com",
-        }
-
-        request_data = HTTPRequestData(method="GET", url=base_url, params=params)
-
-        response_data = transport.request(request_data)
-        return response_data.get("results", [])
+    container = runtime.context.container
+    limit = max_results or 5
+    # OpenAlex sorts by year and citations; over-fetch and keep the relevant
+    candidates = container.reranker.candidates(limit)
 
     try:
-        # 4. Execution with Smart Fallback
-        results = execute_search(year_min)
-
-        # Fallback: If strict year search failed (common in early Jan for new year),
-        # try relaxing the date constraint by one year.
-        expanded_search = False
-        if not results and year_min:
-            results = execute_search(year_min - 1)
-            expanded_search = True
-
-        if not results:
+        searched_year = year_min
+
+        def fetch() -> list[Paper]:
+            nonlocal searched_year
+            # Execution with Smart Fallback (one year earlier if nothing found)
+            papers, searched_year = openalex.search_papers(
+                container.http_transport,
+                query,
+                year_min,
+                candidates,
+                time_budget=settings.ACADEMIC_SEARCH.deep_search_seconds,
+            )
+            return papers
+
+        # The same query run recently (by any dialog) is answered locally
+        search = search_with_index(
+            container.paper_repository,
+            openalex.SOURCE_NAME,
+            query,
+            year_min,
+            candidates,
+            fetch=fetch,
+        )
+        papers = search.papers
+
+        if not papers:
             return "No academic sources found on OpenAlex for this query."
-
-        # 5. Result Formatting
+        papers = container.reranker.rerank(
+            papers,
+            [query, runtime.context.user_prompt],
+            limit,
+            trusted=runtime.context.trusted_domains,
+        )
+
+        # Result Formatting
         output = []
-        if expanded_search:
-            output.append(
-                f"NOTE: No results found for {year_min}. Showing results from {year_min - 1}+."
-            )
-
-        for work in results:
-            # Reconstruct abstract from inverted index
-            abstract_text = "No abstract available."
-            index = work.get("abstract_inverted_index")
-            if index:
-                word_list = []
-                for word, positions in index.items():
-                    for pos in positions:
-                        word_list.append((pos, word))
-                abstract_text = " ".join([w[1] for w in sorted(word_list)])
-
-            # Extract Authors (Safe parsing)
-            authors = []
-            for authorship in work.get("authorships", [])[:3]:
-                author_name = authorship.get("author", {}).get(
-                    "display_name", "Unknown"
-                )
-                authors.append(author_name)
-
-            author_str = ", ".join(authors)
-            if len(work.get("authorships", [])) > 3:
-                author_str += " et al."
-
-            # Extract DOI/Link
-            doi = work.get("doi")
-            if not doi:
-                loc = work.get("primary_location") or {}
-                doi = loc.get("landing_page_url") or work.get("id")
-
+        if search.stale:
+            output.append(STALE_NOTE.format(source=openalex.SOURCE_NAME))
+        if year_min and searched_year != year_min:
             output.append(
-                f"Title: {work.get('title')}\n"
-                f"Year: {work.get('publication_year')} | Citations: {work.get('cited_by_count')}\n"
-                f"Authors: {author_str}\n"
-                f"Link: {doi}\n"
-                f"Abstract: {abstract_text[:600]}..."  # Truncate to save context
+                f"NOTE: No results found for {year_min}. Showing results from {searched_year}+."
             )
 
+        # Abstracts and author lists are cut to the tool output budget
+        output.append(render_cards(papers, _format_paper))
         return "\n\n".join(output)
 
     except BaseTransportException as e:
         return f"OpenAlex Search Failed: {e.message} (Status: {e.status_code})"
     except Exception as e:
         return f"Unexpected Error: {str(e)}"
+
+
+def _format_paper(
+    number: int, paper: Paper, abstract: str | None, author_limit: int
+) -> str:
+    lines = [
+        f"Title: {paper.title}",
+        f"Year: {paper.year} | Citations: {paper.citations_label}",
+    ]
+    if author_limit and paper.authors:
+        lines.append(f"Authors: {paper.authors_short(author_limit)}")
+    lines.append(f"Link: {paper.link}")
+    if abstract:
+        lines.append(f"Abstract: {abstract}")
+    elif not paper.abstract:
+        lines.append("Abstract: No abstract available.")
+    return "\n".join(lines)
@@ -0,0 +1,61 @@
+from langchain_core.tools import tool
+from langgraph.prebuilt.tool_node import ToolRuntime
+from pydantic import BaseModel, Field
+
+from medicalagent.adapters.academic.batch import resolve_dois
+from medicalagent.adapters.agent.tools.academic_search_tool import format_paper
+from medicalagent.adapters.agent.tools.compaction import render_cards
+from medicalagent.config import settings
+
+
+class PaperLookupInput(BaseModel):
+    """Input schema for the batch DOI lookup."""
+
+    dois: list[str] = Field(
+        description=(
+            "DOIs to resolve, bare or as links "
+            "(e.g. ['10.1056/NEJMoa2032183', 'https://doi.org/10.1038/s41586-020-2649-2'])."
+        )
+    )
+
+
+@tool("paper_lookup", args_schema=PaperLookupInput)
+def paper_lookup_tool(runtime: ToolRuntime, dois: list[str]) -> str:
+    """
+    Resolve many DOIs at once to their papers (Title, Year, Citations, Link,
+    Abstract). Use it to verify the DOIs cited by news items in one call
+    instead of searching for each paper separately.
+    """
+    search_settings = settings.ACADEMIC_SEARCH
+    container = runtime.context.container
+
+    output = []
+    if len(dois) > search_settings.lookup_max_dois:
+        output.append(
+            f"NOTE: Only the first {search_settings.lookup_max_dois} "
+            f"of {len(dois)} DOIs were looked up."
+        )
+        dois = dois[: search_settings.lookup_max_dois]
+
+    try:
+        resolution = resolve_dois(
+            container.http_transport, container.paper_repository, dois
+        )
+    except Exception as e:
+        return f"Paper Lookup Failed: {str(e)}"
+
+    # In the order asked for
+    papers = [
+        resolution.papers[doi] for doi in resolution.dois if doi in resolution.papers
+    ]
+    if papers:
+        output.append(render_cards(papers, format_paper))
+    if resolution.missing:
+        output.append(f"Not found: {', '.join(resolution.missing)}")
+    if resolution.invalid:
+        output.append(
+            f"Not DOIs (use academic_search): {', '.join(resolution.invalid)}"
+        )
+    if resolution.failures:
+        output.append(f"NOTE: Some lookups failed - {'; '.join(resolution.failures)}")
+    return "\n\n".join(output) or "No DOIs given."
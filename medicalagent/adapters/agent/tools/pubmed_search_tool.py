@@ -0,0 +1,59 @@
+from langchain_core.tools import tool
+from langgraph.prebuilt.tool_node import ToolRuntime
+
+from medicalagent.adapters.academic import pubmed
+from medicalagent.adapters.academic.index import STALE_NOTE, search_with_index
+from medicalagent.adapters.agent.tools.academic_search_tool import format_paper
+from medicalagent.adapters.agent.tools.compaction import render_cards
+from medicalagent.adapters.agent.tools.openalex_search_tool import OpenAlexInput
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+
+
+class PubMedInput(OpenAlexInput):
+    """Input schema for PubMed search."""
+
+
+@tool("pubmed_search", args_schema=PubMedInput)
+def pubmed_search_tool(
+    runtime: ToolRuntime,
+    query: str,
+    year_min: int | None = None,
+    max_results: int | None = None,
+) -> str:
+    """
+    Search PubMed, the authoritative index for clinical and biomedical
+    literature. Returns Title, Year, Authors, PubMed/DOI link and Abstract.
+    Prefer it for clinical questions (treatments, trials, guidelines).
+    """
+    container = runtime.context.container
+    limit = max_results or 5
+    candidates = container.reranker.candidates(limit)
+    try:
+        search = search_with_index(
+            container.paper_repository,
+            pubmed.SOURCE_NAME,
+            query,
+            year_min,
+            candidates,
+            fetch=lambda: pubmed.search_papers(
+                container.http_transport, query, year_min, candidates
+            ),
+        )
+
+        if not search.papers:
+            return "No PubMed articles found for this query."
+        papers = container.reranker.rerank(
+            search.papers,
+            [query, runtime.context.user_prompt],
+            limit,
+            trusted=runtime.context.trusted_domains,
+        )
+        output = render_cards(papers, format_paper)
+        if search.stale:
+            return f"{STALE_NOTE.format(source=pubmed.SOURCE_NAME)}\n\n{output}"
+        return output
+
+    except BaseTransportException as e:
+        return f"PubMed Search Failed: {e.message} (Status: {e.status_code})"
+    except Exception as e:
+        return f"Unexpected Error searching PubMed: {str(e)}"
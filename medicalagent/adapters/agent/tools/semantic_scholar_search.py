@@ -1,73 +1,106 @@
+import time
+from itertools import islice
 from typing import Any
 
 from langchain_core.tools import tool
 from langgraph.prebuilt.tool_node import ToolRuntime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from medicalagent.adapters.academic import semantic_scholar
+from medicalagent.adapters.academic.index import STALE_NOTE, search_with_index
+from medicalagent.adapters.agent.tools.compaction import render_cards
+from medicalagent.config import settings
+from medicalagent.domain.paper import Paper
 from medicalagent.infra.requests_transport.exceptions import BaseTransportException
-from medicalagent.infra.requests_transport.schemas import HTTPRequestData
 
 
 class SemanticScholarInput(BaseModel):
     query: str = Field(
         description="Keywords to search for academic papers (e.g. 'GLP-1 agonist cardiac outcomes')."
     )
+    max_results: int | None = Field(
+        default=None,
+        ge=1,
+        le=100,
+        description="How many papers to return (default 5).",
+    )
+    most_cited: bool = Field(
+        default=False,
+        description="Rank by citation count instead of relevance (bulk search).",
+    )
+    include_abstracts: bool = Field(
+        default=True,
+        description=(
+            "Set to false when only titles, years and citation counts are "
+            "needed; responses are much smaller."
+        ),
+    )
+
+    @field_validator("max_results", mode="before")
+    @classmethod
+    def coerce_to_int(cls, v: Any) -> int | None:
+        """Coerces string inputs from the LLM into integers."""
+        if v is None or v == "":
+            return None
+        try:
+            return int(v)
+        except (ValueError, TypeError):
+            return v
 
 
 @tool("semantic_scholar_search", args_schema=SemanticScholarInput)
-def semantic_scholar_tool(runtime: ToolRuntime, query: str) -> str:
+def semantic_scholar_tool(
+    runtime: ToolRuntime,
+    query: str,
+    max_results: int | None = None,
+    most_cited: bool = False,
+    include_abstracts: bool = True,
+) -> str:
     """
     Search for academic papers on Semantic Scholar.
     Use it for finding verification, citations, and original sources for medical news.
     """
-    url = "https://api.semanticscholar.org/graph/v1/paper/search"
-
-    # We request specific fields to help the agent judge relevance/impact
-    params = {
-        "query": query,
-        "limit": 5,
-        "fields": "title,url,abstract,year,citationCount,isOpenAccess,authors",
-    }
-
-    # Create Request Data Object
-    request_data = HTTPRequestData(method="GET", url=url, params=params)
-
+    limit = max_results or 5
+    fields = (
+        semantic_scholar.PAPER_FIELDS
+        if include_abstracts
+        else semantic_scholar.CITATION_FIELDS
+    )
     try:
-        transport = runtime.context.container.http_transport
-        data: Any = transport.request(request_data)
-
-        # Access the 'data' key which contains the list of papers
-        papers = data.get("data", [])
+        container = runtime.context.container
+        stale = False
+        if most_cited:
+            deadline = time.monotonic() + settings.ACADEMIC_SEARCH.deep_search_seconds
+            bulk = semantic_scholar.iter_bulk_search(
+                container.http_transport, query, fields=fields, deadline=deadline
+            )
+            # Bulk pages are fetched on demand, only as far as `limit`
+            fetched = list(islice(bulk, limit))
+        else:
+            search = search_with_index(
+                container.paper_repository,
+                semantic_scholar.SOURCE_NAME,
+                query,
+                None,
+                limit,
+                fetch=lambda: semantic_scholar.search_papers(
+                    container.http_transport, query, limit=limit, fields=fields
+                ),
+                # Partial projections would blank stored abstracts and authors
+                store=include_abstracts,
+            )
+            fetched, stale = search.papers, search.stale
 
-        if not papers:
+        if not fetched:
             return "No academic papers found for this query."
-
-        results = []
-        for paper in papers:
-            # Format authors list safely
-            authors_list = paper.get("authors", [])
-            authors_names = [a.get("name", "Unknown") for a in authors_list[:3]]
-            authors_str = ", ".join(authors_names)
-            if len(authors_list) > 3:
-                authors_str += " et al."
-
-            # Format Abstract (handle None and truncation)
-            abstract = paper.get("abstract")
-            if abstract:
-                abstract_preview = abstract[:400] + "..."
-            else:
-                abstract_preview = "No abstract available"
-
-            results.append(
-                f"Title: {paper.get('title', 'Untitled')}\n"
-                f"Year: {paper.get('year', 'N/A')}\n"
-                f"Citations: {paper.get('citationCount', 0)}\n"
-                f"Authors: {authors_str}\n"
-                f"Link: {paper.get('url', 'N/A')}\n"
-                f"Abstract: {abstract_preview}"
+        output = render_cards(
+            fetched, _format_paper if include_abstracts else _format_citation
+        )
+        if stale:
+            return (
+                f"{STALE_NOTE.format(source=semantic_scholar.SOURCE_NAME)}\n\n{output}"
             )
-
-        return "\n\n".join(results)
+        return output
 
     except BaseTransportException as e:
         # Handle specific transport errors (429s, 500s, etc.)
@@ -75,3 +108,31 @@ def semantic_scholar_tool(runtime: ToolRuntime, query: str) -> str:
     except Exception as e:
         # Handle unexpected parsing or logic errors
         return f"Unexpected Error searching Semantic Scholar: {str(e)}"
+
+
+def _format_paper(
+    number: int, paper: Paper, abstract: str | None, author_limit: int
+) -> str:
+    lines = [
+        f"Title: {paper.title}",
+        f"Year: {paper.year or 'N/A'}",
+        f"Citations: {paper.citations_label}",
+    ]
+    if author_limit and paper.authors:
+        lines.append(f"Authors: {paper.authors_short(author_limit)}")
+    lines.append(f"Link: {paper.url or 'N/A'}")
+    if abstract:
+        lines.append(f"Abstract: {abstract}")
+    elif not paper.abstract:
+        lines.append("Abstract: No abstract available")
+    return "\n".join(lines)
+
+
+def _format_citation(
+    number: int, paper: Paper, abstract: str | None, author_limit: int
+) -> str:
+    return (
+        f"Title: {paper.title}\n"
+        f"Year: {paper.year or 'N/A'} | Citations: {paper.citations_label}\n"
+        f"Link: {paper.link or 'N/A'}"
+    )
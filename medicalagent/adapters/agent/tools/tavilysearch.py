@@ -1,15 +1,23 @@
+from functools import cache
+from typing import Any
+
+from langchain_core.tools import tool
 from langchain_tavily import TavilySearch
+from langgraph.prebuilt.tool_node import ToolRuntime
 from pydantic import BaseModel, Field
 
+from medicalagent.adapters.news.trusted import prefer_trusted
 from medicalagent.config import settings
+from medicalagent.config.settings import TrustedSitesMode
 
 
 class TavilySearchInput(BaseModel):
     query: str = Field(description="The search query to look up medical news.")
 
 
+@cache
 def get_tavily() -> TavilySearch:
-    tavily_search_tool = TavilySearch(
+    return TavilySearch(
         tavily_api_key=settings.AI_SETTINGS.tavily_api_key.get_secret_value(),
         max_results=5,
         topic="news",
@@ -18,6 +26,43 @@ def get_tavily() -> TavilySearch:
         include_raw_content=False,
         time_range="month",
     )
-    tavily_search_tool.args_schema = TavilySearchInput
-    tavily_search_tool.description = "Search for recent medical news and studies."
-    return tavily_search_tool
+
+
+@tool("tavily_search", args_schema=TavilySearchInput)
+def tavily_search_tool(runtime: ToolRuntime, query: str) -> dict[str, Any]:
+    """Search for recent medical news and studies."""
+    trusted = runtime.context.trusted_domains
+    payload: dict[str, Any] = {"query": query}
+    if trusted and settings.TRUSTED_SITES.web_mode is TrustedSitesMode.filter:
+        # Let Tavily search the trusted outlets instead of filtering after
+        max_domains = settings.TRUSTED_SITES.max_include_domains
+        payload["include_domains"] = trusted.domains[:max_domains]
+    response = get_tavily().invoke(payload)
+    fallback = "include_domains" in payload and not (
+        isinstance(response, dict) and response.get("results")
+    )
+    if fallback:
+        response = get_tavily().invoke({"query": query})
+    if not isinstance(response, dict) or not response.get("results"):
+        return response
+
+    preferred = prefer_trusted(trusted, response["results"], url_key="url")
+    # Syndicated copies and results already shown in this dialog
+    outcome = runtime.context.container.news_deduplicator.filter(
+        runtime.context.dialog_id,
+        preferred.results,
+        url_key="url",
+        text_keys=("title", "content"),
+    )
+    response["results"] = outcome.kept
+    if outcome.duplicates:
+        response["duplicates_removed"] = outcome.duplicates
+    if outcome.repeated:
+        # Shown by an earlier search; listed briefly so they stay reachable
+        response["already_shown"] = [
+            {"title": result.get("title"), "url": result.get("url")}
+            for result in outcome.repeated
+        ]
+    if fallback or preferred.fallback:
+        response["note"] = "No results from the user's trusted sites; showing all."
+    return response
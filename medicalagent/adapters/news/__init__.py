@@ -0,0 +1,2 @@
+"""Web and news search helpers: result normalization, deduplication and
+trusted-site preference."""
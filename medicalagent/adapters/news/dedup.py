@@ -0,0 +1,159 @@
+"""Drop web results the model has already seen: same page or same story.
+
+Two results are duplicates when their canonical URLs match (tracking
+parameters, `www.`, AMP variants and fragments removed) or when the 64-bit
+SimHashes of their title and snippet are within a few bits of each other,
+which catches wire stories syndicated under different URLs.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from medicalagent.config.settings import NewsDedupSettings
+
+_WORD = re.compile(r"\w+")
+# Word pairs: snippets are short, longer shingles make the hash too sensitive
+SHINGLE_WORDS = 2
+HASH_BITS = 64
+
+
+def canonicalize_url(url: str, settings: NewsDedupSettings) -> str:
+    """'http://www.site.com/a/amp/?utm_source=x&id=2#top' -> 'https://site.com/a?id=2'
+
+    Only identity-neutral parts are dropped; the result is used for
+    comparison, never fetched.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    host = host.removeprefix("www.").removeprefix("amp.").removeprefix("m.")
+    path = re.sub(r"/(amp/?)?$", "", parts.path) or "/"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in settings.tracking_params
+        and not key.lower().startswith(settings.tracking_prefixes)
+        and key.lower() != "amp"
+    )
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over word-pair shingles (single words for tiny texts)"""
+    words = _WORD.findall(text.casefold())
+    if len(words) >= SHINGLE_WORDS:
+        shingles = [
+            " ".join(words[i : i + SHINGLE_WORDS])
+            for i in range(len(words) - SHINGLE_WORDS + 1)
+        ]
+    else:
+        shingles = words
+    weights = [0] * HASH_BITS
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(HASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+@dataclass
+class SeenResults:
+    """Results already shown in one dialog"""
+
+    urls: set[str] = field(default_factory=set)
+    hashes: list[int] = field(default_factory=list)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+
+@dataclass
+class DedupOutcome:
+    kept: list[dict]
+    # Copies of another result in the same call, dropped
+    duplicates: int = 0
+    # Results shown by an earlier call. Their output may since have been
+    # cleared from the context, so callers list them briefly, not drop them.
+    repeated: list[dict] = field(default_factory=list)
+
+
+class NewsDeduplicator:
+    """Per-dialog memory of shown web results, shared by the search tools.
+
+    State is kept for the `max_dialogs` most recently active dialogs, so a
+    result Tavily returned is not shown in full again when DuckDuckGo (or a
+    later Tavily query in the same dialog) returns it.
+    """
+
+    def __init__(self, settings: NewsDedupSettings | None = None) -> None:
+        self.settings = settings or NewsDedupSettings()
+        self._dialogs: OrderedDict[int, SeenResults] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(
+        self,
+        dialog_id: int,
+        results: list[dict],
+        url_key: str,
+        text_keys: tuple[str, ...],
+    ) -> DedupOutcome:
+        """Results split into new ones, in their original order, and ones
+        shown by earlier calls in the dialog.
+
+        `url_key` and `text_keys` name the fields of the source's result
+        dicts (e.g. 'url' and ('title', 'content') for Tavily).
+        """
+        if not self.settings.enabled:
+            return DedupOutcome(kept=results)
+        seen = self._seen(dialog_id)
+        outcome = DedupOutcome(kept=[])
+        # Shown by this call
+        current = SeenResults()
+        with seen._lock:
+            for result in results:
+                url = result.get(url_key)
+                canonical = canonicalize_url(url, self.settings) if url else None
+                text = " ".join(str(result.get(key) or "") for key in text_keys)
+                fingerprint = simhash(text) if text.strip() else None
+                if self._matches(current, canonical, fingerprint):
+                    outcome.duplicates += 1
+                    continue
+                repeated = self._matches(seen, canonical, fingerprint)
+                for state in (current, seen):
+                    if canonical:
+                        state.urls.add(canonical)
+                    if fingerprint is not None:
+                        state.hashes.append(fingerprint)
+                if repeated:
+                    outcome.repeated.append(result)
+                else:
+                    outcome.kept.append(result)
+        return outcome
+
+    def _matches(
+        self, seen: SeenResults, canonical: str | None, fingerprint: int | None
+    ) -> bool:
+        return canonical in seen.urls or (
+            fingerprint is not None and self._near(fingerprint, seen.hashes)
+        )
+
+    def _near(self, fingerprint: int, hashes: list[int]) -> bool:
+        max_distance = self.settings.max_distance
+        return any(
+            (fingerprint ^ other).bit_count() <= max_distance for other in hashes
+        )
+
+    def _seen(self, dialog_id: int) -> SeenResults:
+        with self._lock:
+            seen = self._dialogs.get(dialog_id)
+            if seen is None:
+                seen = self._dialogs[dialog_id] = SeenResults()
+                while len(self._dialogs) > self.settings.max_dialogs:
+                    self._dialogs.popitem(last=False)
+            else:
+                self._dialogs.move_to_end(dialog_id)
+            return seen
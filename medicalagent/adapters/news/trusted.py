@@ -0,0 +1,32 @@
+"""Prefer web results from the domains a user trusts."""
+
+from dataclasses import dataclass
+
+from medicalagent.config import settings
+from medicalagent.config.settings import TrustedSitesMode
+from medicalagent.domain.sites import DomainMatcher
+
+
+@dataclass
+class TrustedOutcome:
+    results: list[dict]
+    # Set when filtering found nothing from trusted sites and kept everything
+    fallback: bool = False
+
+
+def prefer_trusted(
+    trusted: DomainMatcher, results: list[dict], url_key: str
+) -> TrustedOutcome:
+    """Results from trusted domains only, or first, per TRUSTED_SITES__WEB_MODE.
+
+    Without trusted sites the results pass through unchanged.
+    """
+    if not trusted:
+        return TrustedOutcome(results)
+    preferred = [r for r in results if trusted.matches(r.get(url_key))]
+    if settings.TRUSTED_SITES.web_mode is TrustedSitesMode.filter:
+        if preferred or not results:
+            return TrustedOutcome(preferred)
+        return TrustedOutcome(results, fallback=True)
+    others = [r for r in results if not trusted.matches(r.get(url_key))]
+    return TrustedOutcome(preferred + others)
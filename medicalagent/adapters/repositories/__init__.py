@@ -2,10 +2,12 @@
 
 from .in_memory_dialog_repository import InMemoryDialogRepository
 from .in_memory_findings_repository import InMemoryFindingsRepository
+from .in_memory_paper_repository import InMemoryPaperRepository
 from .in_memory_user_repository import InMemoryUserRepository
 
 __all__ = [
     "InMemoryDialogRepository",
     "InMemoryFindingsRepository",
+    "InMemoryPaperRepository",
     "InMemoryUserRepository",
 ]
@@ -0,0 +1,77 @@
+"""In-memory implementation of PaperRepository."""
+
+from datetime import UTC, datetime, timedelta
+
+from medicalagent.domain.paper import Paper, QueryRun, normalize_title
+from medicalagent.ports.paper_repository import PaperRepository
+
+
+class InMemoryPaperRepository(PaperRepository):
+    """In-memory implementation of PaperRepository with naive term matching."""
+
+    def __init__(self) -> None:
+        """Initialize the repository."""
+        self._papers: dict[str, tuple[Paper, datetime]] = {}
+        self._query_runs: dict[tuple, tuple[QueryRun, datetime]] = {}
+
+    def upsert(self, papers: list[Paper]) -> None:
+        """Store papers, merging with stored copies."""
+        now = datetime.now(UTC)
+        for paper in papers:
+            stored = self._papers.get(paper.dedup_key)
+            merged = paper.merged_with(stored[0]) if stored else paper
+            self._papers[paper.dedup_key] = (merged, now)
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        year_min: int | None = None,
+        source: str | None = None,
+        max_age: timedelta | None = None,
+    ) -> list[Paper]:
+        """Papers whose title or abstract contains every query term."""
+        terms = normalize_title(query).split()
+        if not terms:
+            return []
+        scored = []
+        for paper in self._fresh(max_age):
+            if year_min and (paper.year or 0) < year_min:
+                continue
+            if source and source not in paper.sources:
+                continue
+            words = normalize_title(f"{paper.title} {paper.abstract or ''}").split()
+            if all(term in words for term in terms):
+                score = sum(words.count(term) for term in terms)
+                scored.append((score, paper.citations or 0, paper))
+        scored.sort(key=lambda item: item[:2], reverse=True)
+        return [paper for _, _, paper in scored[:limit]]
+
+    def get_by_dois(
+        self, dois: list[str], max_age: timedelta | None = None
+    ) -> list[Paper]:
+        """Stored papers with the given DOIs."""
+        wanted = set(dois)
+        return [paper for paper in self._fresh(max_age) if paper.doi in wanted]
+
+    def record_query_run(self, run: QueryRun) -> None:
+        """Store the run, replacing the query's earlier one."""
+        key = (run.source, normalize_title(run.query), run.year_min)
+        self._query_runs[key] = (run, datetime.now(UTC))
+
+    def get_query_run(
+        self, source: str, query: str, year_min: int | None, max_age: timedelta
+    ) -> QueryRun | None:
+        """The query's last run, if within `max_age`."""
+        stored = self._query_runs.get((source, normalize_title(query), year_min))
+        if stored is None or datetime.now(UTC) - stored[1] > max_age:
+            return None
+        return stored[0]
+
+    def _fresh(self, max_age: timedelta | None) -> list[Paper]:
+        now = datetime.now(UTC)
+        return [
+            paper
+            for paper, fetched_at in self._papers.values()
+            if max_age is None or now - fetched_at <= max_age
+        ]
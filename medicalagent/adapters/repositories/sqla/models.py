@@ -1,8 +1,17 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -71,3 +80,57 @@ class UserModel(Base):
     last_login_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+
+
+class PaperModel(Base):
+    """SQLAlchemy model for the Papers table: local index of fetched papers."""
+
+    __tablename__ = "papers"
+
+    # Paper.dedup_key: "doi:<doi>", or "title:<normalized title>" without DOI
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    doi: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    url: Mapped[str | None] = mapped_column(String, nullable=True)
+    abstract: Mapped[str | None] = mapped_column(Text, nullable=True)
+    authors: Mapped[list[str]] = mapped_column(JSONB, default=list)
+    # NULL when no source reported a count
+    citations: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Sources the paper was fetched from, e.g. ["OpenAlex"]
+    sources: Mapped[list[str]] = mapped_column(JSONB, default=list)
+
+    search_vector = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', title || ' ' || coalesce(abstract, ''))",
+            persisted=True,
+        ),
+        deferred=True,  # only used in WHERE / ORDER BY
+    )
+
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+
+    __table_args__ = (
+        Index("ix_papers_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_papers_sources", "sources", postgresql_using="gin"),
+    )
+
+
+class PaperQueryRunModel(Base):
+    """SQLAlchemy model for upstream searches answered into the paper index."""
+
+    __tablename__ = "paper_query_runs"
+
+    source: Mapped[str] = mapped_column(String, primary_key=True)
+    # normalize_title() of the query text
+    query: Mapped[str] = mapped_column(String, primary_key=True)
+    # 0 when the search had no year filter (primary key columns are not null)
+    year_min: Mapped[int] = mapped_column(Integer, primary_key=True)
+    result_limit: Mapped[int] = mapped_column(Integer, nullable=False)
+    found: Mapped[int] = mapped_column(Integer, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,181 @@
+from datetime import timedelta
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query, Session
+
+from medicalagent.adapters.repositories.sqla.models import (
+    PaperModel,
+    PaperQueryRunModel,
+)
+from medicalagent.domain.paper import Paper, QueryRun, normalize_title
+from medicalagent.infra.db import get_session
+from medicalagent.ports.paper_repository import PaperRepository
+
+# Union of the stored and incoming source lists
+MERGED_SOURCES = text(
+    "(SELECT jsonb_agg(DISTINCT source) FROM "
+    "jsonb_array_elements_text(papers.sources || excluded.sources) AS source)"
+)
+
+
+class SQLAPaperRepository(PaperRepository):
+    """SQLAlchemy implementation of the PaperRepository (PostgreSQL FTS)."""
+
+    def upsert(self, papers: list[Paper]) -> None:
+        # One row per key: ON CONFLICT cannot touch a row twice per statement
+        rows = {paper.dedup_key: self._to_row(paper) for paper in papers}
+        if not rows:
+            return
+
+        session: Session = get_session()
+        try:
+            stmt = insert(PaperModel).values(list(rows.values()))
+            new = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[PaperModel.key],
+                set_={
+                    "doi": func.coalesce(new.doi, PaperModel.doi),
+                    "title": new.title,
+                    "year": func.coalesce(new.year, PaperModel.year),
+                    "url": func.coalesce(PaperModel.url, new.url),
+                    "abstract": func.coalesce(new.abstract, PaperModel.abstract),
+                    "authors": new.authors,
+                    # Indexes lag each other; keep the fresher (larger) count.
+                    # GREATEST skips NULL, so PubMed's unknown count loses.
+                    "citations": func.greatest(new.citations, PaperModel.citations),
+                    "sources": MERGED_SOURCES,
+                    "fetched_at": func.now(),
+                },
+            )
+            session.execute(stmt)
+            session.commit()
+        finally:
+            session.close()
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        year_min: int | None = None,
+        source: str | None = None,
+        max_age: timedelta | None = None,
+    ) -> list[Paper]:
+        session: Session = get_session()
+        try:
+            tsquery = func.websearch_to_tsquery("english", query)
+            db_query = session.query(PaperModel).filter(
+                PaperModel.search_vector.op("@@")(tsquery)
+            )
+            if year_min:
+                db_query = db_query.filter(PaperModel.year >= year_min)
+            if source:
+                db_query = db_query.filter(PaperModel.sources.contains([source]))
+            db_papers = (
+                self._fresh(db_query, max_age)
+                .order_by(
+                    func.ts_rank_cd(PaperModel.search_vector, tsquery).desc(),
+                    PaperModel.citations.desc().nulls_last(),
+                )
+                .limit(limit)
+                .all()
+            )
+            return [self._to_domain(p) for p in db_papers]
+        finally:
+            session.close()
+
+    def get_by_dois(
+        self, dois: list[str], max_age: timedelta | None = None
+    ) -> list[Paper]:
+        if not dois:
+            return []
+        session: Session = get_session()
+        try:
+            db_query = session.query(PaperModel).filter(PaperModel.doi.in_(dois))
+            return [self._to_domain(p) for p in self._fresh(db_query, max_age).all()]
+        finally:
+            session.close()
+
+    def record_query_run(self, run: QueryRun) -> None:
+        session: Session = get_session()
+        try:
+            stmt = insert(PaperQueryRunModel).values(
+                source=run.source,
+                query=normalize_title(run.query),
+                year_min=run.year_min or 0,
+                result_limit=run.limit,
+                found=run.found,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    PaperQueryRunModel.source,
+                    PaperQueryRunModel.query,
+                    PaperQueryRunModel.year_min,
+                ],
+                set_={
+                    "result_limit": stmt.excluded.result_limit,
+                    "found": stmt.excluded.found,
+                    "fetched_at": func.now(),
+                },
+            )
+            session.execute(stmt)
+            session.commit()
+        finally:
+            session.close()
+
+    def get_query_run(
+        self, source: str, query: str, year_min: int | None, max_age: timedelta
+    ) -> QueryRun | None:
+        session: Session = get_session()
+        try:
+            db_run = (
+                session.query(PaperQueryRunModel)
+                .filter(
+                    PaperQueryRunModel.source == source,
+                    PaperQueryRunModel.query == normalize_title(query),
+                    PaperQueryRunModel.year_min == (year_min or 0),
+                    PaperQueryRunModel.fetched_at >= func.now() - max_age,
+                )
+                .one_or_none()
+            )
+            if db_run is None:
+                return None
+            return QueryRun(
+                source=db_run.source,
+                query=db_run.query,
+                year_min=db_run.year_min or None,
+                limit=db_run.result_limit,
+                found=db_run.found,
+            )
+        finally:
+            session.close()
+
+    def _fresh(self, db_query: Query, max_age: timedelta | None) -> Query:
+        if max_age is None:
+            return db_query
+        return db_query.filter(PaperModel.fetched_at >= func.now() - max_age)
+
+    def _to_row(self, paper: Paper) -> dict:
+        return {
+            "key": paper.dedup_key,
+            "doi": paper.doi,
+            "title": paper.title,
+            "year": paper.year,
+            "url": paper.url,
+            "abstract": paper.abstract,
+            "authors": paper.authors,
+            "citations": paper.citations,
+            "sources": paper.sources,
+        }
+
+    def _to_domain(self, db_paper: PaperModel) -> Paper:
+        return Paper(
+            title=db_paper.title,
+            year=db_paper.year,
+            doi=db_paper.doi,
+            url=db_paper.url,
+            abstract=db_paper.abstract,
+            authors=db_paper.authors or [],
+            citations=db_paper.citations,
+            sources=db_paper.sources or [],
+        )
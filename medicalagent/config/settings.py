@@ -1,18 +1,42 @@
+from datetime import timedelta
+from enum import StrEnum
 from urllib import parse
 
 import urllib3
-from pydantic import SecretStr
+from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from urllib3.util.request import ACCEPT_ENCODING
 
 
 class HTTPTransportSettings(BaseSettings):
     chunk_size: int = 8192
     user_agent: str = "MedicalNewsAgent/1.0 pet-project"
     default_timeout: int = 30
+    # Streaming: hard cap on a streamed body, and how much of it
+    # streaming.spool keeps in memory before spilling to a temp file
+    max_stream_bytes: int = 100 * 1024 * 1024
+    spool_memory_bytes: int = 2 * 1024 * 1024
+
+    # Connection pooling. Sessions live as long as the transport, so
+    # TCP/TLS handshakes are paid once per pooled connection.
+    pool_connections: int = 10  # number of per-host pools to keep
+    pool_maxsize: int = 10  # connections kept per host
+    pool_block: bool = False  # wait for a free slot instead of opening extra
+    host_pool_maxsize: dict[str, int] = {
+        "api.openalex.org": 10,
+        "api.semanticscholar.org": 4,
+    }
+    keep_alive: bool = True
 
     @property
     def common_headers(self) -> dict[str, str]:
-        return {"user-agent": self.user_agent}
+        # A new dict per call: transports add per-request headers to it
+        return {
+            "user-agent": self.user_agent,
+            "connection": "keep-alive" if self.keep_alive else "close",
+            # gzip/deflate, plus br/zstd when brotli/zstandard are installed
+            "accept-encoding": ACCEPT_ENCODING.replace(",", ", "),
+        }
 
 
 class RetryBackoffSettings(BaseSettings):
@@ -22,6 +46,145 @@ class RetryBackoffSettings(BaseSettings):
     max_backoff: int = 120
     status_forcelist: list[int] = [413, 429, 502, 503, 504]
     allowed_methods: frozenset[str] = urllib3.Retry.DEFAULT_ALLOWED_METHODS
+    # Statuses whose Retry-After header replaces the computed backoff
+    retry_after_statuses: frozenset[int] = frozenset({413, 429, 503})
+    # Total seconds one request may spend across attempts and waits
+    deadline: float = 60
+    # Process-wide budget: retries may add at most this share of requests
+    # on top of a small burst reserve, so retries cannot amplify an outage
+    retry_budget_ratio: float = 0.1
+    retry_budget_burst: int = 10
+
+
+class CircuitBreakerSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_CIRCUIT_BREAKER__", env_file=".env", extra="ignore"
+    )
+
+    enabled: bool = True
+    failure_threshold: int = 5  # consecutive failures that open the circuit
+    recovery_timeout: float = 30  # seconds open before a half-open probe
+    half_open_max_calls: int = 1  # concurrent probes allowed while half-open
+    # Client errors that still mean "upstream is unhealthy"
+    failure_statuses: list[int] = [429]
+
+
+class TransportMetricsSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_METRICS__", env_file=".env", extra="ignore"
+    )
+
+    # Upper bounds of the latency histogram buckets; one more catches the rest
+    latency_buckets_ms: tuple[float, ...] = (
+        10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+    )  # fmt: skip
+    # Attempts slower than this are logged as warnings
+    slow_request_seconds: float = 5
+
+
+class HTTPCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_CACHE__", env_file=".env", extra="ignore"
+    )
+
+    enabled: bool = True
+    cacheable_methods: frozenset[str] = frozenset({"GET", "HEAD"})
+    # In-memory LRU tier
+    max_entries: int = 512
+    max_bytes: int = 32 * 1024 * 1024
+    # Seconds a response stays fresh; 0 disables caching for a host
+    default_ttl: int = 900
+    host_ttls: dict[str, int] = {
+        "api.openalex.org": 3600,
+        "api.semanticscholar.org": 3600,
+    }
+    # Optional on-disk (SQLite) tier shared by all processes on the machine
+    disk_path: str | None = None
+    disk_max_entries: int = 20_000
+
+    def ttl_for(self, host: str) -> int:
+        return self.host_ttls.get(host, self.default_ttl)
+
+
+class RateLimitSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_RATE_LIMIT__", env_file=".env", extra="ignore"
+    )
+
+    enabled: bool = True
+    # Sustained requests per second per host; hosts not listed are unlimited
+    host_rates: dict[str, float] = {
+        "api.openalex.org": 10.0,  # polite pool
+        "api.semanticscholar.org": 1.0,  # unauthenticated budget
+        "eutils.ncbi.nlm.nih.gov": 3.0,  # NCBI limit without an API key
+    }
+    # Requests allowed back-to-back before the sustained rate applies
+    host_bursts: dict[str, int] = {
+        "api.openalex.org": 10,
+        "api.semanticscholar.org": 2,
+        "eutils.ncbi.nlm.nih.gov": 3,
+    }
+    # Longest a request may queue for a token before failing fast
+    max_wait: float = 30.0
+
+
+class CassetteMode(StrEnum):
+    off = "off"
+    record = "record"  # call upstream and write every interaction
+    replay = "replay"  # answer from the cassette only, never the network
+
+
+class CassetteSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_CASSETTE__", env_file=".env", extra="ignore"
+    )
+
+    mode: CassetteMode = CassetteMode.off
+    path: str = "cassettes/http.jsonl.gz"
+    # Replay sleeps recorded latency * scale: 0 replays instantly,
+    # 1 reproduces the recorded timings
+    latency_scale: float = 0.0
+
+
+class LatencyDistribution(StrEnum):
+    fixed = "fixed"  # always latency_ms
+    uniform = "uniform"  # latency_ms +- latency_jitter_ms
+    lognormal = "lognormal"  # median latency_ms, tail set by latency_sigma
+    exponential = "exponential"  # mean latency_ms
+
+
+class FaultProfile(BaseModel):
+    """Faults injected into the calls to one host"""
+
+    latency_ms: float = 0
+    latency_distribution: LatencyDistribution = LatencyDistribution.fixed
+    latency_jitter_ms: float = 0
+    latency_sigma: float = 0.5
+    # Share of calls answered with `error_status` instead of going upstream
+    error_rate: float = 0
+    error_status: int = Field(default=503, ge=400, le=599)
+    error_retry_after: str | None = None
+    # Share of calls that hang for `timeout_seconds`, then fail to connect
+    timeout_rate: float = 0
+    timeout_seconds: float = 30
+    # Delay before every chunk of a streamed body
+    stream_chunk_delay_ms: float = 0
+
+
+class FaultInjectionSettings(BaseSettings):
+    """Load testing only: never enable in production"""
+
+    model_config = SettingsConfigDict(
+        env_prefix="HTTP_FAULTS__", env_file=".env", extra="ignore"
+    )
+
+    enabled: bool = False
+    # host -> profile; "*" applies to hosts not listed
+    hosts: dict[str, FaultProfile] = {}
+    seed: int | None = None
+
+    def profile_for(self, host: str) -> FaultProfile | None:
+        return self.hosts.get(host, self.hosts.get("*"))
 
 
 class AISettings(BaseSettings):
@@ -41,6 +204,148 @@ class AISettings(BaseSettings):
     summarization_model_max_tokens: int = 10_000
 
 
+class AcademicSearchSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="ACADEMIC_SEARCH__", env_file=".env", extra="ignore"
+    )
+
+    # OpenAlex polite pool: requests with a contact email get 10 req/s
+    openalex_mailto: str = "medical_agent_user@example.com"
+    # Candidates fetched from each source before merging
+    per_source_limit: int = 8
+    # Papers returned by the federated tool after merge and ranking
+    result_limit: int = 6
+    # Longest abstract kept from OpenAlex (indexed and shown in full by the
+    # OpenAlex tool); longer inverted indexes are cut while reconstructing
+    abstract_max_chars: int = 3000
+    # Seconds the federated tool waits for all sources before answering
+    # with whatever has arrived
+    timeout: float = 25
+    # Seconds OpenAlex keeps paging for more results (deep backfill); the
+    # page in flight is finished
+    deep_search_seconds: float = 10
+    # NCBI E-utilities identify callers by tool name and email; an API key
+    # raises their limit to 10 req/s (raise HTTP_RATE_LIMIT__HOST_RATES too)
+    ncbi_tool: str = "medicalagent"
+    ncbi_email: str = "medical_agent_user@example.com"
+    ncbi_api_key: str | None = None
+    # Identifiers one paper_lookup call may resolve
+    lookup_max_dois: int = 100
+
+
+class CitationGraphSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="CITATION_GRAPH__", env_file=".env", extra="ignore"
+    )
+
+    # Hard bounds on what the agent may ask for
+    max_depth: int = 2
+    max_fan_out: int = 10
+    max_results: int = 25
+    # Seconds one expansion may spend; what was reached by then is returned
+    time_budget: float = 15
+    # Citing works fetched per node; requests for smaller fan-outs reuse them
+    citing_page_size: int = 25
+    # Local cache of works and their citation edges
+    cache_ttl: int = 24 * 3600
+    cache_max_entries: int = 20_000
+    cache_max_bytes: int = 32 * 1024 * 1024
+
+
+class ToolOutputSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="TOOL_OUTPUT__", env_file=".env", extra="ignore"
+    )
+
+    # Tokens one tool call may put into the prompt. Fields are trimmed to
+    # fit: abstracts first, then author lists, then trailing results.
+    max_tokens: int = 1500
+    # Longest abstract shown even when the budget has room for more
+    abstract_max_tokens: int = 160
+    # Below this share per result, abstracts are dropped instead of cut
+    abstract_min_tokens: int = 25
+    author_limit: int = 3
+
+
+class PaperIndexSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="PAPER_INDEX__", env_file=".env", extra="ignore"
+    )
+
+    enabled: bool = True
+    # Indexed papers older than this are fetched again (citations drift)
+    max_age_days: float = 7
+    # A search is answered from the index only if the same query went
+    # upstream this recently; older queries go upstream to see new papers
+    query_max_age_hours: float = 6
+
+    @property
+    def max_age(self) -> timedelta:
+        return timedelta(days=self.max_age_days)
+
+    @property
+    def query_max_age(self) -> timedelta:
+        return timedelta(hours=self.query_max_age_hours)
+
+
+class RerankSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="RERANK__", env_file=".env", extra="ignore"
+    )
+
+    # Re-rank academic results by relevance to the tool query and the
+    # user's prompt before they are shown to the model
+    enabled: bool = True
+    # Candidates fetched per result shown, and at most in total
+    candidate_factor: int = 3
+    max_candidates: int = 50
+    # BM25 over title + abstract; title terms count `title_weight` times
+    k1: float = 1.2
+    b: float = 0.75
+    title_weight: int = 2
+    # fastembed model (e.g. 'BAAI/bge-small-en-v1.5') fused with BM25 when
+    # set and fastembed is installed; BM25 alone otherwise
+    embedding_model: str | None = None
+
+
+class NewsDedupSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="NEWS_DEDUP__", env_file=".env", extra="ignore"
+    )
+
+    enabled: bool = True
+    # Snippets whose 64-bit SimHashes differ in at most this many bits are
+    # treated as the same story. Syndicated copies of a snippet land around
+    # 5, same-template stories on other drugs around 20, unrelated ones 32.
+    max_distance: int = 7
+    # Query parameters that only track the click, dropped from URLs
+    tracking_params: frozenset[str] = frozenset(
+        {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid"}
+        | {"ocid", "cmpid", "smid", "sr_share", "ref", "ref_src", "taid", "guccounter"}
+    )
+    tracking_prefixes: tuple[str, ...] = ("utm_", "at_", "itm_")
+    # Dialogs whose seen-results state is kept (least recently used dropped)
+    max_dialogs: int = 256
+
+
+class TrustedSitesMode(StrEnum):
+    filter = "filter"  # show only results from trusted sites
+    boost = "boost"  # show results from trusted sites first
+
+
+class TrustedSitesSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="TRUSTED_SITES__", env_file=".env", extra="ignore"
+    )
+
+    # How web results are treated when the user has trusted sites. Filtering
+    # falls back to all results when none come from a trusted site. Academic
+    # results are always boosted: journals rarely match news outlets.
+    web_mode: TrustedSitesMode = TrustedSitesMode.filter
+    # Tavily accepts at most this many include_domains
+    max_include_domains: int = 300
+
+
 class PostgreSQLSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="db__", env_file=".env", extra="ignore"
@@ -73,5 +378,9 @@ class AppSettings(BaseSettings):
 
 class Settings(BaseSettings):
     AI_SETTINGS: AISettings = AISettings()
+    ACADEMIC_SEARCH: AcademicSearchSettings = AcademicSearchSettings()
+    TOOL_OUTPUT: ToolOutputSettings = ToolOutputSettings()
+    TRUSTED_SITES: TrustedSitesSettings = TrustedSitesSettings()
+    PAPER_INDEX: PaperIndexSettings = PaperIndexSettings()
     POSTGRESQL: PostgreSQLSettings = PostgreSQLSettings()
     APP_SETTINGS: AppSettings = AppSettings()
@@ -0,0 +1,89 @@
+"""Academic paper domain model, normalized across literature sources."""
+
+import re
+
+from pydantic import BaseModel, Field
+
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "doi:")
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_doi(value: str | None) -> str | None:
+    """'https://doi.org/10.1056/NEJMoa2032183' -> '10.1056/nejmoa2032183'"""
+    if not value:
+        return None
+    doi = value.strip().lower()
+    for prefix in DOI_PREFIXES:
+        if doi.startswith(prefix):
+            doi = doi[len(prefix) :]
+            break
+    return doi or None
+
+
+def normalize_title(value: str | None) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a title"""
+    return _NON_WORD.sub(" ", (value or "").casefold()).strip()
+
+
+class QueryRun(BaseModel):
+    """An upstream search whose results went into the paper index."""
+
+    source: str
+    query: str
+    year_min: int | None = None
+    # Results asked for and results returned
+    limit: int
+    found: int
+
+
+class Paper(BaseModel):
+    """Paper domain model."""
+
+    title: str
+    year: int | None = None
+    doi: str | None = None
+    url: str | None = None
+    abstract: str | None = None
+    authors: list[str] = Field(default_factory=list)
+    # None when the source does not report citation counts (PubMed)
+    citations: int | None = None
+    sources: list[str] = Field(default_factory=list)
+
+    @property
+    def link(self) -> str | None:
+        """DOI link when known, else the source's landing page"""
+        return f"https://doi.org/{self.doi}" if self.doi else self.url
+
+    @property
+    def dedup_key(self) -> str:
+        return f"doi:{self.doi}" if self.doi else f"title:{normalize_title(self.title)}"
+
+    def merged_with(self, other: "Paper") -> "Paper":
+        """One record from two sources' views of the same paper"""
+        return self.model_copy(
+            update={
+                "year": self.year or other.year,
+                "doi": self.doi or other.doi,
+                "url": self.url or other.url,
+                "abstract": max((self.abstract or "", other.abstract or ""), key=len)
+                or None,
+                "authors": self.authors or other.authors,
+                # Indexes lag each other; the larger count is the fresher one
+                "citations": max(
+                    (c for c in (self.citations, other.citations) if c is not None),
+                    default=None,
+                ),
+                "sources": self.sources
+                + [s for s in other.sources if s not in self.sources],
+            }
+        )
+
+    @property
+    def citations_label(self) -> str:
+        """Citation count for display; 'N/A' rather than a misleading 0"""
+        return "N/A" if self.citations is None else str(self.citations)
+
+    def authors_short(self, limit: int = 3) -> str:
+        names = ", ".join(self.authors[:limit])
+        return f"{names} et al." if len(self.authors) > limit else names
@@ -0,0 +1,58 @@
+"""Matching URLs against a user's trusted sites."""
+
+from collections.abc import Iterable
+from urllib.parse import urlsplit
+
+# Marks a trie node where a trusted domain ends
+_END = ""
+
+
+def normalize_domain(site: str) -> str | None:
+    """'https://www.NEJM.org/news' -> 'nejm.org'; '*.nih.gov' -> 'nih.gov'
+
+    Paths are ignored: a site is trusted as a whole domain.
+    """
+    site = site.strip().lower()
+    if not site:
+        return None
+    host = urlsplit(site if "://" in site else f"//{site}").hostname or ""
+    host = host.removeprefix("*.").removeprefix("www.").strip(".")
+    return host if "." in host else None
+
+
+class DomainMatcher:
+    """Suffix trie over domain labels, built once per set of sites.
+
+    'nih.gov' matches nih.gov and its subdomains (pubmed.ncbi.nlm.nih.gov)
+    but not lookalikes such as fakenih.gov. A lookup costs one step per
+    label of the host, however many sites are trusted.
+    """
+
+    def __init__(self, sites: Iterable[str] = ()) -> None:
+        self.domains: list[str] = []
+        self._root: dict[str, dict] = {}
+        for site in sites:
+            domain = normalize_domain(site)
+            if domain and domain not in self.domains:
+                self.domains.append(domain)
+                node = self._root
+                for label in reversed(domain.split(".")):
+                    node = node.setdefault(label, {})
+                node[_END] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.domains)
+
+    def matches(self, url: str | None) -> bool:
+        """Whether the host of `url` (or a bare host) is a trusted domain"""
+        if not url or not self._root:
+            return False
+        host = urlsplit(url if "://" in url else f"//{url}").hostname or ""
+        node = self._root
+        for label in reversed(host.rstrip(".").split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
@@ -73,6 +73,7 @@ def handle_chat_input() -> None:
                     chat_history=chat_history,
                     dialog_id=active_dialog_id,
                     callbacks=[status_callback],
+                    trusted_sites=user.profile.trusted_sites,
                 )
                 response_text = (
                     response[0].content
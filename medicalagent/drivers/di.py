@@ -1,21 +1,61 @@
 """Dependency injection container for the Medical News Agent."""
 
+from medicalagent.adapters.academic.citations import CitationGraph
+from medicalagent.adapters.academic.rerank import Reranker
 from medicalagent.adapters.agent.langchain_base import LangChainAgentService
+from medicalagent.adapters.news.dedup import NewsDeduplicator
 from medicalagent.adapters.repositories.sqla.sqla_dialog_repo import (
     SQLADialogRepository,
 )
 from medicalagent.adapters.repositories.sqla.sqla_findings_repo import (
     SQLAFindingsRepository,
 )
+from medicalagent.adapters.repositories.sqla.sqla_paper_repo import (
+    SQLAPaperRepository,
+)
 from medicalagent.adapters.repositories.sqla.sqla_user_repo import SQLAUserRepository
-from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.config.settings import (
+    CassetteMode,
+    CassetteSettings,
+    CircuitBreakerSettings,
+    FaultInjectionSettings,
+    HTTPCacheSettings,
+    RateLimitSettings,
+)
+from medicalagent.infra.requests_transport.base import (
+    AbstractAsyncHTTPTransport,
+    AbstractSyncHTTPTransport,
+)
+from medicalagent.infra.requests_transport.cache import CachingHTTPTransport
+from medicalagent.infra.requests_transport.cassette import CassetteHTTPTransport
+from medicalagent.infra.requests_transport.circuit_breaker import (
+    CircuitBreakerHTTPTransport,
+    CircuitBreakers,
+)
+from medicalagent.infra.requests_transport.faults import FaultInjectingHTTPTransport
+from medicalagent.infra.requests_transport.httpx_transport import (
+    HttpxAsyncHTTPTransport,
+)
+from medicalagent.infra.requests_transport.metrics import TransportMetrics
+from medicalagent.infra.requests_transport.rate_limit import (
+    HostRateLimiter,
+    RateLimitedHTTPTransport,
+)
 from medicalagent.infra.requests_transport.requests_transport import (
     RequestsHTTPTransport,
 )
+from medicalagent.infra.requests_transport.retry import (
+    RetryingHTTPTransport,
+    RetryPolicy,
+)
+from medicalagent.infra.requests_transport.singleflight import (
+    SingleFlightHTTPTransport,
+)
 from medicalagent.ports import (
     AgentService,
     DialogRepository,
     FindingsRepository,
+    PaperRepository,
     UserRepository,
 )
 
@@ -28,9 +68,84 @@ class DIContainer:
         self._dialog_repository = SQLADialogRepository()
         self._findings_repository = SQLAFindingsRepository()
         self._user_repository = SQLAUserRepository()
-        self._http_transport = RequestsHTTPTransport()
+        self._paper_repository = SQLAPaperRepository()
+        # Edge cache shared by every session in the process
+        self._citation_graph = CitationGraph()
+        # Web results already shown, per dialog
+        self._news_deduplicator = NewsDeduplicator()
+        # Holds the embedding model, if one is configured
+        self._reranker = Reranker()
+        # Shared by the sync and async transports and the retry policy
+        self._transport_metrics = TransportMetrics()
+        # One policy, so sync and async calls share the retry budget
+        self._retry_policy = RetryPolicy(metrics=self._transport_metrics)
+        # The container is a process-wide singleton, so the limiter's buckets
+        # and the breakers are shared by every Streamlit session in the
+        # process, and by the sync and async transports
+        rate_limit_settings = RateLimitSettings()
+        self._rate_limiter = (
+            HostRateLimiter(rate_limit_settings)
+            if rate_limit_settings.enabled
+            else None
+        )
+        breaker_settings = CircuitBreakerSettings()
+        self._circuit_breakers = (
+            CircuitBreakers(breaker_settings) if breaker_settings.enabled else None
+        )
+        self._http_transport = self._build_http_transport()
+        self._async_http_transport = HttpxAsyncHTTPTransport(
+            retry_policy=self._retry_policy,
+            metrics=self._transport_metrics,
+            rate_limiter=self._rate_limiter,
+            circuit_breakers=self._circuit_breakers,
+        )
         self._agent_service = LangChainAgentService(container=self)
 
+    def _build_http_transport(self) -> AbstractSyncHTTPTransport:
+        """Stack the transport decorators around the requests transport."""
+        # Innermost, so every attempt (retries included) is measured
+        transport: AbstractSyncHTTPTransport = RequestsHTTPTransport(
+            metrics=self._transport_metrics
+        )
+
+        # Record real traffic, or replay it offline for benchmarks
+        cassette_settings = CassetteSettings()
+        if cassette_settings.mode == CassetteMode.record:
+            transport = CassetteHTTPTransport(transport, cassette_settings)
+        elif cassette_settings.mode == CassetteMode.replay:
+            transport = CassetteHTTPTransport(
+                None, cassette_settings, self._transport_metrics
+            )
+
+        # Load testing: the layers above react to injected faults as to real ones
+        fault_settings = FaultInjectionSettings()
+        if fault_settings.enabled:
+            transport = FaultInjectingHTTPTransport(
+                transport, fault_settings, self._transport_metrics
+            )
+
+        if self._rate_limiter is not None:
+            transport = RateLimitedHTTPTransport(transport, self._rate_limiter)
+
+        # Below the retry layer, so every attempt counts as a failure and a
+        # dead host opens the circuit mid-retry; rejected calls take no token
+        if self._circuit_breakers is not None:
+            transport = CircuitBreakerHTTPTransport(
+                transport, breakers=self._circuit_breakers
+            )
+
+        # Every attempt takes its own rate-limit token and passes the breaker
+        transport = RetryingHTTPTransport(transport, self._retry_policy)
+
+        # Identical concurrent requests share one upstream call (and token)
+        transport = SingleFlightHTTPTransport(transport)
+
+        cache_settings = HTTPCacheSettings()
+        if cache_settings.enabled:
+            transport = CachingHTTPTransport(transport, cache_settings)
+
+        return transport
+
     @property
     def dialog_repository(self) -> DialogRepository:
         """Get the dialog repository instance."""
@@ -51,9 +166,36 @@ class DIContainer:
         """Get the user repository instance."""
         return self._user_repository
 
+    @property
+    def paper_repository(self) -> PaperRepository:
+        """Get the paper index repository instance."""
+        return self._paper_repository
+
+    @property
+    def citation_graph(self) -> CitationGraph:
+        return self._citation_graph
+
+    @property
+    def news_deduplicator(self) -> NewsDeduplicator:
+        return self._news_deduplicator
+
+    @property
+    def reranker(self) -> Reranker:
+        return self._reranker
+
     @property
     def http_transport(self) -> AbstractSyncHTTPTransport:
         return self._http_transport
 
+    @property
+    def async_http_transport(self) -> AbstractAsyncHTTPTransport:
+        """Shares retries, rate limits and circuit breakers with
+        `http_transport`, but has no single-flight or response cache"""
+        return self._async_http_transport
+
+    @property
+    def transport_metrics(self) -> TransportMetrics:
+        return self._transport_metrics
+
 
 di_container = DIContainer()
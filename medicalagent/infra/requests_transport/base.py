@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 
 from medicalagent.infra.requests_transport.schemas import (
     HTTPRequestData,
@@ -18,3 +18,20 @@ class AbstractSyncHTTPTransport(ABC):
         Returns:
             tuple[int, Iterator[bytes]]: content-length, iterator
         """
+
+
+class AbstractAsyncHTTPTransport(ABC):
+    @abstractmethod
+    async def request(self, data: HTTPRequestData) -> ResponseContent: ...
+
+    @abstractmethod
+    async def stream(self, data: HTTPRequestData) -> tuple[int, AsyncIterator[bytes]]:
+        """Streaming request
+
+        Returns:
+            tuple[int, AsyncIterator[bytes]]: content-length, async iterator
+        """
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """Release pooled connections"""
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from logging import getLogger
+from typing import Any
+
+from medicalagent.config.settings import HTTPCacheSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import (
+    content_from_json,
+    content_to_json,
+    request_host,
+    request_key,
+)
+
+logger = getLogger(__name__)
+
+
+def _serialize(content: ResponseContent | bytes) -> str:
+    return json.dumps(content_to_json(content))
+
+
+def _deserialize(payload: str) -> Any:
+    return content_from_json(json.loads(payload))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expired: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def incr(self, name: str, by: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + by)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    size: int
+    value: Any
+
+
+class MemoryLRUCache:
+    """Entry- and byte-bounded LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int, max_bytes: int, stats: CacheStats) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = stats
+        self.bytes = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry.expires_at <= time.monotonic():
+                self._drop(key)
+                self.stats.incr("expired")
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry.value
+
+    def set(self, key: str, value: Any, ttl: float, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(time.monotonic() + ttl, size, value)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.stats.incr("evictions")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+
+
+class DiskCache:
+    """SQLite-backed second tier. Survives restarts and is shared between
+    processes on the same machine; expiry uses wall-clock time.
+    """
+
+    def __init__(self, path: str, max_entries: int, stats: CacheStats) -> None:
+        self.max_entries = max_entries
+        self.stats = stats
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> tuple[bool, str | None]:
+        digest = self._digest(key)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, payload FROM http_cache WHERE key = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            expires_at, payload = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM http_cache WHERE key = ?", (digest,))
+                self._conn.commit()
+                self.stats.incr("expired")
+                return False, None
+            self._conn.execute(
+                "UPDATE http_cache SET accessed_at = ? WHERE key = ?", (now, digest)
+            )
+            self._conn.commit()
+            return True, payload
+
+    def set(self, key: str, payload: str, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?)",
+                (self._digest(key), now + ttl, now, payload),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM http_cache WHERE key IN ("
+                    "SELECT key FROM http_cache ORDER BY expires_at <= ? DESC, "
+                    "accessed_at ASC LIMIT ?)",
+                    (now, overflow),
+                )
+                self.stats.incr("evictions", overflow)
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+
+    def _digest(self, key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+
+class CachingHTTPTransport(AbstractSyncHTTPTransport):
+    """Caches successful responses of the wrapped transport.
+
+    Keyed on request_key (method, url, sorted params, body). Lookups go memory ->
+    disk -> upstream; errors are never cached and streams pass through.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        inner: AbstractSyncHTTPTransport,
+        settings: HTTPCacheSettings = HTTPCacheSettings(),
+    ) -> None:
+        self.inner = inner
+        self.settings = settings
+        self.cache_stats = CacheStats()
+        self.memory = MemoryLRUCache(
+            settings.max_entries, settings.max_bytes, self.cache_stats
+        )
+        self.disk = (
+            DiskCache(settings.disk_path, settings.disk_max_entries, self.cache_stats)
+            if settings.disk_path
+            else None
+        )
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        ttl = self.settings.ttl_for(request_host(data))
+        if data.method not in self.settings.cacheable_methods or ttl <= 0:
+            return self.inner.request(data)
+
+        key = request_key(data)
+        found, value = self.memory.get(key)
+        if found:
+            self.cache_stats.incr("hits")
+            return value
+
+        if self.disk:
+            found, payload = self.disk.get(key)
+            if found and payload is not None:
+                self.cache_stats.incr("disk_hits")
+                value = _deserialize(payload)
+                self.memory.set(key, value, ttl, len(payload))
+                return value
+
+        self.cache_stats.incr("misses")
+        value = self.inner.request(data)
+        try:
+            payload = _serialize(value)
+        except (TypeError, ValueError):
+            logger.debug(f"Response for {data.url} is not cacheable")
+            return value
+
+        self.memory.set(key, value, ttl, len(payload))
+        if self.disk:
+            self.disk.set(key, payload, ttl)
+        self.cache_stats.incr("stores")
+        return value
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        return self.inner.stream(data)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.cache_stats.as_dict(),
+            "entries": len(self.memory),
+            "bytes": self.memory.bytes,
+        }
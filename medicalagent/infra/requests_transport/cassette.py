@@ -0,0 +1,278 @@
+import copy
+import gzip
+import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from medicalagent.config.settings import CassetteMode, CassetteSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.exceptions import (
+    BaseTransportException,
+    CassetteMissError,
+    ClientError,
+    ConnectionTransportError,
+    ResponseTooLargeError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.metrics import TransportMetrics
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import (
+    content_from_json,
+    content_to_json,
+    request_key,
+)
+
+logger = getLogger(__name__)
+
+REPLAY_CHUNK_SIZE = 8192
+
+ERROR_CLASSES: dict[str, type[BaseTransportException]] = {
+    cls.__name__: cls
+    for cls in (
+        ClientError,
+        ServerError,
+        ConnectionTransportError,
+        ResponseTooLargeError,
+    )
+}
+
+
+@dataclass
+class Interaction:
+    """One recorded call: its outcome (content or error) and how long it took"""
+
+    key: str
+    kind: str  # "request" or "stream"
+    elapsed: float
+    content: Any = None
+    error: BaseTransportException | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "key": self.key,
+            "kind": self.kind,
+            "elapsed": round(self.elapsed, 4),
+        }
+        if self.error is not None:
+            result["error"] = {
+                "class": type(self.error).__name__,
+                "status_code": self.error.status_code,
+                "response": content_to_json(self.error.response or ""),
+                "message": self.error.message,
+                "headers": dict(self.error.headers),
+            }
+        else:
+            result["content"] = content_to_json(self.content)
+        return result
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "Interaction":
+        error = None
+        if "error" in data:
+            err = data["error"]
+            error_class = ERROR_CLASSES.get(err["class"], ConnectionTransportError)
+            error = error_class(
+                status_code=err["status_code"],
+                response=content_from_json(err["response"]),
+                message=err["message"],
+                headers=err["headers"],
+            )
+        return cls(
+            key=data["key"],
+            kind=data["kind"],
+            elapsed=data["elapsed"],
+            content=content_from_json(data["content"]) if "content" in data else None,
+            error=error,
+        )
+
+
+class Cassette:
+    """Recorded interactions, stored as gzip-compressed JSON lines.
+
+    Every interaction is appended as its own gzip member, so a recording cut
+    short by a crash is still readable. Several recordings of one request
+    (e.g. a 503 then the retried 200) replay in order; the last one repeats.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._interactions: dict[str, list[Interaction]] = {}
+        self._cursors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._interactions.values())
+
+    def load(self) -> None:
+        with self._lock:
+            self._interactions.clear()
+            self._cursors.clear()
+            if not self.path.exists():
+                return
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        self._add(Interaction.from_json(json.loads(line)))
+
+    def truncate(self) -> None:
+        with self._lock:
+            self._interactions.clear()
+            self._cursors.clear()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.unlink(missing_ok=True)
+
+    def append(self, interaction: Interaction) -> None:
+        line = json.dumps(interaction.to_json(), ensure_ascii=False) + "\n"
+        with self._lock:
+            self._add(interaction)
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.write(line)
+
+    def next(self, key: str) -> Interaction | None:
+        with self._lock:
+            items = self._interactions.get(key)
+            if not items:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return items[min(cursor, len(items) - 1)]
+
+    def _add(self, interaction: Interaction) -> None:
+        self._interactions.setdefault(interaction.key, []).append(interaction)
+
+
+@dataclass
+class CassetteStats:
+    recorded: int = 0
+    replayed: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class CassetteHTTPTransport(AbstractSyncHTTPTransport):
+    """Records upstream interactions to a cassette, or replays them offline.
+
+    record: every call goes to `inner` and its outcome (content or error)
+    is written with its latency; the cassette starts empty.
+    replay: calls are answered from the cassette, optionally sleeping the
+    recorded latency scaled by `latency_scale`; unknown requests raise
+    CassetteMissError. `inner` is not used and may be None.
+    """
+
+    def __init__(
+        self,
+        inner: AbstractSyncHTTPTransport | None,
+        settings: CassetteSettings = CassetteSettings(),
+        metrics: TransportMetrics | None = None,
+    ) -> None:
+        if settings.mode == CassetteMode.record and inner is None:
+            raise ValueError("Recording needs an inner transport")
+        self.inner = inner
+        self.settings = settings
+        # Replayed calls never reach a measuring transport, so measure here
+        self.metrics = metrics or TransportMetrics()
+        self.cassette_stats = CassetteStats()
+        self.cassette = Cassette(Path(settings.path))
+        if settings.mode == CassetteMode.record:
+            self.cassette.truncate()
+        else:
+            self.cassette.load()
+            logger.info(
+                f"Replaying {len(self.cassette)} interactions from {settings.path}"
+            )
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        if self.settings.mode != CassetteMode.record:
+            return self._replay(data, "request").content
+
+        assert self.inner is not None  # nosec B101
+        started = time.perf_counter()
+        try:
+            content = self.inner.request(data)
+        except BaseTransportException as exc:
+            self._record(data, "request", started, error=exc)
+            raise
+        self._record(data, "request", started, content=content)
+        return content
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        if self.settings.mode != CassetteMode.record:
+            body = self._replay(data, "stream").content
+            return len(body), self._iter_chunks(body)
+
+        assert self.inner is not None  # nosec B101
+        started = time.perf_counter()
+        try:
+            # The whole body is needed for the cassette anyway
+            _, chunks = self.inner.stream(data)
+            body = b"".join(chunks)
+        except BaseTransportException as exc:
+            self._record(data, "stream", started, error=exc)
+            raise
+        self._record(data, "stream", started, content=body)
+        return len(body), self._iter_chunks(body)
+
+    def stats(self) -> dict[str, Any]:
+        return self.cassette_stats.as_dict()
+
+    def _record(
+        self,
+        data: HTTPRequestData,
+        kind: str,
+        started: float,
+        content: Any = None,
+        error: BaseTransportException | None = None,
+    ) -> None:
+        self.cassette.append(
+            Interaction(
+                key=self._key(data, kind),
+                kind=kind,
+                elapsed=time.perf_counter() - started,
+                content=content,
+                error=error,
+            )
+        )
+        self.cassette_stats.incr("recorded")
+
+    def _replay(self, data: HTTPRequestData, kind: str) -> Interaction:
+        with self.metrics.measure(data) as attempt:
+            interaction = self.cassette.next(self._key(data, kind))
+            if interaction is None:
+                self.cassette_stats.incr("misses")
+                raise CassetteMissError(
+                    message=f"No recorded interaction for {data.method} {data.url}"
+                )
+            self.cassette_stats.incr("replayed")
+            if self.settings.latency_scale > 0:
+                time.sleep(interaction.elapsed * self.settings.latency_scale)
+            if interaction.error is not None:
+                raise copy.copy(interaction.error)
+            attempt.status = 200
+            if isinstance(interaction.content, bytes | str):
+                attempt.nbytes = len(interaction.content)
+            return interaction
+
+    def _key(self, data: HTTPRequestData, kind: str) -> str:
+        return f"{kind} {request_key(data)}"
+
+    def _iter_chunks(self, body: bytes) -> Iterator[bytes]:
+        for start in range(0, len(body), REPLAY_CHUNK_SIZE):
+            yield body[start : start + REPLAY_CHUNK_SIZE]
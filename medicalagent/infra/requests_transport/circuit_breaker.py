@@ -0,0 +1,203 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from enum import StrEnum
+from http import HTTPStatus
+from logging import getLogger
+from typing import Any, TypeVar
+
+from medicalagent.config.settings import CircuitBreakerSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.exceptions import (
+    CircuitOpenError,
+    ClientError,
+    ConnectionTransportError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import request_host
+
+logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitState(StrEnum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for a single host.
+
+    closed -> open after `failure_threshold` failures in a row; open rejects
+    every call until `recovery_timeout` passes; then half-open lets
+    `half_open_max_calls` probes through - a successful probe closes the
+    circuit, a failed one opens it again.
+    """
+
+    def __init__(self, host: str, settings: CircuitBreakerSettings) -> None:
+        self.host = host
+        self.settings = settings
+        self.state = CircuitState.closed
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self.state == CircuitState.open:
+                if self._remaining_open() > 0:
+                    self._reject()
+                self.state = CircuitState.half_open
+                self._probes = 0
+                logger.info(f"Circuit for {self.host} is half-open, probing")
+
+            if self.state == CircuitState.half_open:
+                if self._probes >= self.settings.half_open_max_calls:
+                    self._reject()
+                self._probes += 1
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.state != CircuitState.closed:
+                logger.info(f"Circuit for {self.host} closed")
+            self.state = CircuitState.closed
+            self.consecutive_failures = 0
+            self._probes = 0
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if (
+                self.state == CircuitState.half_open
+                or self.consecutive_failures >= self.settings.failure_threshold
+            ):
+                if self.state != CircuitState.open:
+                    self.times_opened += 1
+                    logger.warning(
+                        f"Circuit for {self.host} opened after "
+                        f"{self.consecutive_failures} consecutive failures"
+                    )
+                self.state = CircuitState.open
+                self.opened_at = time.monotonic()
+                self._probes = 0
+
+    def record(self, status: int | None) -> None:
+        """Outcome of a call the host answered; None when it did not answer.
+
+        A 4xx about our request says the host is healthy, unless the status
+        is one of `failure_statuses` (e.g. 429).
+        """
+        if (
+            status is None
+            or status >= HTTPStatus.INTERNAL_SERVER_ERROR
+            or status in self.settings.failure_statuses
+        ):
+            self.on_failure()
+        else:
+            self.on_success()
+
+    def release(self) -> None:
+        """The call ended without telling us anything about the host"""
+        with self._lock:
+            if self.state == CircuitState.half_open and self._probes > 0:
+                self._probes -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": str(self.state),
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in": round(self._remaining_open(), 3)
+                if self.state == CircuitState.open
+                else 0.0,
+            }
+
+    def _remaining_open(self) -> float:
+        elapsed = time.monotonic() - self.opened_at
+        return max(0.0, self.settings.recovery_timeout - elapsed)
+
+    def _reject(self) -> None:
+        self.rejected += 1
+        raise CircuitOpenError(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            message=(
+                f"Circuit open for {self.host}: upstream is failing, "
+                f"retry in {self._remaining_open():.0f}s or use another source"
+            ),
+        )
+
+
+class CircuitBreakers:
+    """Per-host breakers, shared by the transport stacks they are given to"""
+
+    def __init__(self, settings: CircuitBreakerSettings = CircuitBreakerSettings()):
+        self.settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(host, self.settings)
+            return self._breakers[host]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.snapshot() for host, breaker in breakers.items()}
+
+
+class CircuitBreakerHTTPTransport(AbstractSyncHTTPTransport):
+    """Fails fast with CircuitOpenError while a host's circuit is open"""
+
+    def __init__(
+        self,
+        inner: AbstractSyncHTTPTransport,
+        settings: CircuitBreakerSettings = CircuitBreakerSettings(),
+        breakers: CircuitBreakers | None = None,
+    ) -> None:
+        self.inner = inner
+        self.breakers = breakers or CircuitBreakers(settings)
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        return self._guarded(self.inner.request, data)
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        return self._guarded(self.inner.stream, data)
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        return self.breakers.get(host)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return self.breakers.stats()
+
+    def _guarded(
+        self, call: Callable[[HTTPRequestData], T], data: HTTPRequestData
+    ) -> T:
+        breaker = self.breaker(request_host(data))
+        breaker.before_call()
+        try:
+            result = call(data)
+        except (ServerError, ConnectionTransportError):
+            breaker.on_failure()
+            raise
+        except ClientError as exc:
+            breaker.record(exc.status_code)
+            raise
+        except BaseException:
+            # e.g. a client-side rate limit rejection: the host was not asked
+            breaker.release()
+            raise
+        breaker.on_success()
+        return result
@@ -0,0 +1,52 @@
+"""Caller deadline shared by every transport call made in a block of code.
+
+The federated academic search stops waiting for its sources after
+ACADEMIC_SEARCH__TIMEOUT. Sources run on a shared thread pool, so they get
+the same deadline: retries, rate-limit waits and socket timeouts end with
+it, and the worker is free for the next search instead of finishing work
+nobody waits for.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http import HTTPStatus
+
+from medicalagent.infra.requests_transport.exceptions import DeadlineExceededError
+
+_deadline: ContextVar[float | None] = ContextVar("transport_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: float) -> Iterator[None]:
+    """Transport calls in this block end by `deadline` (time.monotonic()).
+
+    Nested scopes can only shorten the deadline. Context variables do not
+    follow work handed to a thread pool: enter the scope in the worker.
+    """
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining(limit: float) -> float:
+    """`limit` seconds, or less if the caller's deadline comes sooner"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return limit
+    return max(0.0, min(limit, deadline - time.monotonic()))
+
+
+def attempt_timeout(limit: float) -> float:
+    """Socket timeout for one attempt; raises once the deadline has passed"""
+    timeout = remaining(limit)
+    if timeout <= 0:
+        raise DeadlineExceededError(
+            status_code=HTTPStatus.GATEWAY_TIMEOUT,
+            message="Caller deadline passed before the request was sent",
+        )
+    return timeout
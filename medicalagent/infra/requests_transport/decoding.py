@@ -0,0 +1,62 @@
+import json
+from email.message import Message
+from typing import Any
+
+from medicalagent.infra.requests_transport.schemas import (
+    ContentTypeEnum,
+    ResponseContent,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def parse_media_type(header: str | None) -> tuple[str, dict[str, str]]:
+    """'Application/JSON; charset=UTF-8' -> ('application/json', {'charset': 'utf-8'})"""
+    if not header:
+        return "", {}
+    msg = Message()
+    msg["content-type"] = header
+    params = {k.lower(): v.lower() for k, v in msg.get_params()[1:]}
+    return msg.get_content_type(), params
+
+
+def is_json(media_type: str) -> bool:
+    return media_type == ContentTypeEnum.json or media_type.endswith("+json")
+
+
+def decode_json(raw: bytes) -> Any:
+    """JSON straight from UTF-8 bytes, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def decode_body(
+    content_type: str | None, raw: bytes, fallback_encoding: str = "utf-8"
+) -> ResponseContent | bytes:
+    """Decode an (already decompressed) body according to its media type.
+
+    JSON of any flavour -> parsed object, binary -> bytes, anything else
+    (HTML, XML, plain text) -> str.
+    """
+    if not raw:
+        return ""
+    media_type, params = parse_media_type(content_type)
+    charset = params.get("charset")
+
+    if is_json(media_type):
+        if charset in (None, "utf-8", "utf8"):
+            return decode_json(raw)
+        return json.loads(raw.decode(charset or fallback_encoding))
+
+    if media_type in (
+        ContentTypeEnum.binary_octet_stream,
+        ContentTypeEnum.application_octet_stream,
+        ContentTypeEnum.pdf,
+    ):
+        return raw
+
+    return raw.decode(charset or fallback_encoding, errors="replace")
@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+
 from medicalagent.infra.requests_transport.schemas import ResponseContent
 
 
@@ -7,10 +9,12 @@ class BaseTransportException(Exception):
         status_code: int | None = None,
         response: ResponseContent | None = None,
         message: str | None = None,
+        headers: Mapping[str, str] | None = None,
     ):
         self.status_code = status_code
         self.response = response
         self.message = message
+        self.headers = headers or {}
 
     def __str__(self) -> str:
         return f"HTTP Exception. Code: {self.status_code}; Response: {self.response}; Message: {self.message}"
@@ -29,3 +33,23 @@ class ClientError(BaseTransportException):
 
 class ServerError(BaseTransportException):
     """HTTP errors with status >= 500."""
+
+
+class RateLimitExceededError(BaseTransportException):
+    """Client-side limiter would queue the request longer than allowed."""
+
+
+class CircuitOpenError(BaseTransportException):
+    """Host circuit is open: the call was rejected without going upstream."""
+
+
+class DeadlineExceededError(BaseTransportException):
+    """The caller's deadline passed before the request could be sent."""
+
+
+class ResponseTooLargeError(BaseTransportException):
+    """Streamed body is larger than the configured cap."""
+
+
+class CassetteMissError(BaseTransportException):
+    """Replay mode: no recorded interaction matches the request."""
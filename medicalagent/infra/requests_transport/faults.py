@@ -0,0 +1,192 @@
+import math
+import random
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from http import HTTPStatus
+from logging import getLogger
+from typing import Any
+
+from medicalagent.config.settings import (
+    FaultInjectionSettings,
+    FaultProfile,
+    LatencyDistribution,
+)
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.exceptions import (
+    ClientError,
+    ConnectionTransportError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.metrics import TransportMetrics
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import request_host
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class FaultStats:
+    calls: int = 0
+    delayed: int = 0
+    delay_seconds: float = 0.0
+    errors: int = 0
+    timeouts: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, delay: float, outcome: str | None) -> None:
+        with self._lock:
+            self.calls += 1
+            if delay:
+                self.delayed += 1
+                self.delay_seconds += delay
+            if outcome is not None:
+                setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class FaultInjectingHTTPTransport(AbstractSyncHTTPTransport):
+    """Injects latency, error responses, timeouts and slow bodies per host.
+
+    Meant to sit directly above the base transport, so the retry, breaker
+    and limiter layers react to injected faults as to real ones. Injected
+    errors and timeouts never reach the wrapped transport and are reported
+    to `metrics` here; injected delays show up in stats().
+    """
+
+    def __init__(
+        self,
+        inner: AbstractSyncHTTPTransport,
+        settings: FaultInjectionSettings = FaultInjectionSettings(),
+        metrics: TransportMetrics | None = None,
+    ) -> None:
+        self.inner = inner
+        self.settings = settings
+        self.metrics = metrics or TransportMetrics()
+        self._random = random.Random(settings.seed)  # nosec B311
+        self._random_lock = threading.Lock()
+        self._stats: dict[str, FaultStats] = {}
+        self._lock = threading.Lock()
+        logger.warning(f"Fault injection enabled for {list(settings.hosts)}")
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        self._inject(data)
+        return self.inner.request(data)
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        profile = self._inject(data)
+        content_len, chunks = self.inner.stream(data)
+        if profile is None or not profile.stream_chunk_delay_ms:
+            return content_len, chunks
+        return content_len, self._slow_body(chunks, profile.stream_chunk_delay_ms)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            hosts = dict(self._stats)
+        return {host: stats.as_dict() for host, stats in hosts.items()}
+
+    def _inject(self, data: HTTPRequestData) -> FaultProfile | None:
+        """Sleep the injected latency, then maybe fail instead of calling on"""
+        host = request_host(data)
+        profile = self.settings.profile_for(host)
+        if profile is None:
+            return None
+
+        started = time.perf_counter()
+        delay = self._latency(profile)
+        roll = self._uniform()
+        outcome = None
+        if roll < profile.timeout_rate:
+            outcome = "timeouts"
+            delay += profile.timeout_seconds
+        elif roll < profile.timeout_rate + profile.error_rate:
+            outcome = "errors"
+        self._host_stats(host).record(delay, outcome)
+        if delay:
+            time.sleep(delay)
+
+        if outcome is None:
+            return profile
+        error_class = ConnectionTransportError.__name__
+        if outcome == "errors":
+            error_class = self._error_class(profile.error_status).__name__
+        self.metrics.record_attempt(
+            data,
+            time.perf_counter() - started,
+            status=profile.error_status if outcome == "errors" else None,
+            error_class=error_class,
+        )
+        if outcome == "timeouts":
+            raise ConnectionTransportError(
+                message=f"Injected timeout after {profile.timeout_seconds}s"
+            )
+        status = profile.error_status
+        raise self._error_class(status)(
+            status_code=status,
+            response={"error": "injected fault"},
+            # Unregistered codes (520, 599) have no phrase
+            message=(
+                HTTPStatus(status).phrase
+                if status in HTTPStatus._value2member_map_
+                else f"HTTP {status}"
+            ),
+            headers=(
+                {"retry-after": profile.error_retry_after}
+                if profile.error_retry_after
+                else None
+            ),
+        )
+
+    def _latency(self, profile: FaultProfile) -> float:
+        """Seconds of injected latency, drawn from the profile's distribution"""
+        base = profile.latency_ms
+        if base <= 0:
+            return 0.0
+        with self._random_lock:
+            match profile.latency_distribution:
+                case LatencyDistribution.uniform:
+                    jitter = profile.latency_jitter_ms
+                    value = self._random.uniform(base - jitter, base + jitter)
+                case LatencyDistribution.lognormal:
+                    value = self._random.lognormvariate(
+                        math.log(base), profile.latency_sigma
+                    )
+                case LatencyDistribution.exponential:
+                    value = self._random.expovariate(1 / base)
+                case _:
+                    value = base
+        return max(0.0, value) / 1000
+
+    def _uniform(self) -> float:
+        with self._random_lock:
+            return self._random.random()
+
+    def _error_class(self, status: int) -> type[ClientError | ServerError]:
+        if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            return ServerError
+        return ClientError
+
+    def _host_stats(self, host: str) -> FaultStats:
+        with self._lock:
+            if host not in self._stats:
+                self._stats[host] = FaultStats()
+            return self._stats[host]
+
+    def _slow_body(self, chunks: Iterator[bytes], delay_ms: float) -> Iterator[bytes]:
+        try:
+            for chunk in chunks:
+                time.sleep(delay_ms / 1000)
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
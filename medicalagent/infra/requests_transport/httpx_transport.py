@@ -0,0 +1,257 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from logging import getLogger
+from typing import Any
+
+import httpx
+
+from medicalagent.config.settings import HTTPTransportSettings
+from medicalagent.infra.requests_transport.base import AbstractAsyncHTTPTransport
+from medicalagent.infra.requests_transport.circuit_breaker import CircuitBreakers
+from medicalagent.infra.requests_transport.decoding import decode_body
+from medicalagent.infra.requests_transport.exceptions import (
+    ClientError,
+    ConnectionTransportError,
+    ResponseTooLargeError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.metrics import (
+    TransportMetrics,
+    error_name,
+)
+from medicalagent.infra.requests_transport.rate_limit import HostRateLimiter
+from medicalagent.infra.requests_transport.retry import RetryPolicy
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import request_host
+
+logger = getLogger(__name__)
+
+
+class HttpxAsyncHTTPTransport(AbstractAsyncHTTPTransport):  # pragma: nocover
+    """Based on httpx, for async calls. Retries with the same RetryPolicy as
+    the sync stack (Retry-After, deadline, shared budget) and maps errors the
+    same way, so tools can await several upstream calls concurrently.
+
+    Given the sync stack's `rate_limiter` and `circuit_breakers`, every
+    attempt takes a token from the same per-host buckets and passes the same
+    breakers (an open circuit raises CircuitOpenError, never retried).
+    There is no single-flight or response cache on this path.
+    Every attempt is reported to `metrics`.
+    """
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy | None = None,
+        client_settings: HTTPTransportSettings = HTTPTransportSettings(),
+        metrics: TransportMetrics | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+    ) -> None:
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.client_settings = client_settings
+        self.metrics = metrics or TransportMetrics()
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        # httpx pools are bound to the event loop they were opened on: one
+        # client per loop. A client is dropped with its loop (asyncio.run
+        # per Streamlit rerun), which releases its sockets.
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._clients_lock = threading.Lock()
+
+    async def request(self, data: HTTPRequestData) -> ResponseContent:
+        response = await self._send_with_retries(data, stream=False)
+        return self._handle_response(response)
+
+    async def stream(self, data: HTTPRequestData) -> tuple[int, AsyncIterator[bytes]]:
+        response = await self._send_with_retries(data, stream=True)
+        if response.is_error:
+            await response.aread()
+            await response.aclose()
+            self._handle_response(response)
+
+        content_len = int(response.headers.get("content-length", 0))
+        max_bytes = self.client_settings.max_stream_bytes
+        if content_len > max_bytes:
+            await response.aclose()
+            raise ResponseTooLargeError(
+                status_code=response.status_code,
+                message=f"Content-Length {content_len} exceeds {max_bytes} bytes",
+            )
+
+        async def iterator() -> AsyncIterator[bytes]:
+            received = 0
+            error: BaseException | None = None
+            try:
+                async for chunk in response.aiter_bytes(
+                    chunk_size=self.client_settings.chunk_size
+                ):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise ResponseTooLargeError(
+                            status_code=response.status_code,
+                            message=f"Streamed body exceeds {max_bytes} bytes",
+                        )
+                    yield chunk
+            except httpx.TransportError as exc:
+                error = ConnectionTransportError(message=str(exc))
+                raise error from exc
+            except Exception as exc:
+                error = exc
+                raise
+            finally:
+                await response.aclose()
+                self.metrics.record_body(data, received, error_name(error))
+
+        return content_len, iterator()
+
+    async def aclose(self) -> None:
+        current = asyncio.get_running_loop()
+        with self._clients_lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for loop, client in clients:
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                # Closed on its own loop, which another thread is running
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def _send_with_retries(
+        self, data: HTTPRequestData, stream: bool
+    ) -> httpx.Response:
+        """Returns the final response; error statuses are mapped by the caller"""
+        deadline = self.retry_policy.start()
+        host = request_host(data)
+        breaker = self.circuit_breakers.get(host) if self.circuit_breakers else None
+        attempt = 0
+        while True:
+            response: httpx.Response | None = None
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(host)
+                started = time.perf_counter()
+                response = await self._client.send(
+                    self._build_request(data), stream=stream
+                )
+                status = response.status_code
+                retry_after = response.headers.get("retry-after")
+            except httpx.TransportError as exc:
+                error = exc
+                status, retry_after = None, None
+            except BaseException:
+                # Rate-limit rejection or cancellation: the host was not asked
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record(status)
+            self._record_attempt(data, started, response, stream)
+
+            if response is not None and response.status_code < HTTPStatus.BAD_REQUEST:
+                return response
+
+            attempt += 1
+            delay = self.retry_policy.next_delay(
+                data, status, retry_after, attempt, deadline
+            )
+            if delay is None:
+                if response is None:
+                    raise ConnectionTransportError(message=str(error)) from error
+                return response
+
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    def _record_attempt(
+        self,
+        data: HTTPRequestData,
+        started: float,
+        response: httpx.Response | None,
+        stream: bool,
+    ) -> None:
+        seconds = time.perf_counter() - started
+        if response is None:
+            self.metrics.record_attempt(
+                data, seconds, error_class=ConnectionTransportError.__name__
+            )
+            return
+        error_class = None
+        if response.is_error:
+            error_class = (
+                ServerError if response.is_server_error else ClientError
+            ).__name__
+        # A streamed body is counted by the iterator as it is read
+        nbytes = 0 if stream else len(response.content)
+        self.metrics.record_attempt(
+            data, seconds, response.status_code, nbytes, error_class
+        )
+
+    def _build_request(self, data: HTTPRequestData) -> httpx.Request:
+        headers = self.client_settings.common_headers
+        if data.headers:
+            headers.update(data.headers)
+        return self._client.build_request(
+            method=data.method,
+            url=data.url,
+            headers=headers,
+            params=data.params,
+            json=data.json_body,
+        )
+
+    def _handle_response(self, response: httpx.Response) -> ResponseContent:
+        content = self._parse_content(response)
+        status = response.status_code
+        if status >= HTTPStatus.BAD_REQUEST:
+            exception_class = (
+                ServerError
+                if status >= HTTPStatus.INTERNAL_SERVER_ERROR
+                else ClientError
+            )
+            raise exception_class(
+                status_code=status,
+                response=content,
+                message=response.reason_phrase,
+                headers=response.headers,
+            )
+        return content
+
+    def _parse_content(self, response: httpx.Response) -> str | Any:
+        return decode_body(
+            response.headers.get("content-type"),
+            response.content,
+            fallback_encoding=response.charset_encoding or "utf-8",
+        )
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._clients.get(loop)
+            if client is not None:
+                return client
+            # Clients of finished loops cannot be closed from this one;
+            # dropping them lets their sockets be released
+            for closed in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed]
+
+            cs = self.client_settings
+            client = self._clients[loop] = httpx.AsyncClient(
+                timeout=cs.default_timeout,
+                limits=httpx.Limits(
+                    max_connections=cs.pool_connections * cs.pool_maxsize,
+                    max_keepalive_connections=cs.pool_maxsize,
+                ),
+            )
+            return client
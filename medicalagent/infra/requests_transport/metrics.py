@@ -0,0 +1,214 @@
+import bisect
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from medicalagent.config.settings import TransportMetricsSettings
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+from medicalagent.infra.requests_transport.utils import (
+    request_endpoint,
+    request_host,
+)
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def error_name(error: BaseException | None) -> str | None:
+    return type(error).__name__ if error is not None else None
+
+
+@dataclass
+class Attempt:
+    """Filled in by the transport while a measured attempt is in flight"""
+
+    status: int | None = None
+    nbytes: int = 0
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and a latency histogram for one host + endpoint."""
+
+    buckets_ms: tuple[float, ...] = field(repr=False)
+    attempts: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    latency_ms_sum: float = 0.0
+    latency_ms_max: float = 0.0
+    statuses: dict[int, int] = field(default_factory=dict)
+    error_classes: dict[str, int] = field(default_factory=dict)
+    histogram: list[int] = field(default_factory=list, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.histogram = [0] * (len(self.buckets_ms) + 1)
+
+    def record_attempt(
+        self, latency_ms: float, status: int | None, error_class: str | None
+    ) -> None:
+        with self._lock:
+            self.attempts += 1
+            self.latency_ms_sum += latency_ms
+            self.latency_ms_max = max(self.latency_ms_max, latency_ms)
+            self.histogram[bisect.bisect_left(self.buckets_ms, latency_ms)] += 1
+            if status is not None:
+                self.statuses[status] = self.statuses.get(status, 0) + 1
+            if error_class is not None:
+                self.errors += 1
+                self._count_error(error_class)
+
+    def record_body(self, nbytes: int, error_class: str | None) -> None:
+        """Bytes of a body read after the attempt was recorded (streams)"""
+        with self._lock:
+            self.bytes_received += nbytes
+            if error_class is not None:
+                self._count_error(error_class)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th attempt, in ms"""
+        with self._lock:
+            return self._percentile(q)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            result = {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+            result["latency_ms_sum"] = round(self.latency_ms_sum, 1)
+            result["latency_ms_max"] = round(self.latency_ms_max, 1)
+            result["statuses"] = dict(self.statuses)
+            result["error_classes"] = dict(self.error_classes)
+            result["latency_ms_mean"] = (
+                round(self.latency_ms_sum / self.attempts, 1) if self.attempts else 0.0
+            )
+            for q in PERCENTILES:
+                result[f"latency_ms_p{round(q * 100)}"] = self._percentile(q)
+            bounds = [f"le_{bound:g}" for bound in self.buckets_ms] + ["le_inf"]
+            result["latency_histogram_ms"] = dict(
+                zip(bounds, self.histogram, strict=True)
+            )
+            return result
+
+    def _count_error(self, error_class: str) -> None:
+        self.error_classes[error_class] = self.error_classes.get(error_class, 0) + 1
+
+    def _percentile(self, q: float) -> float:
+        if not self.attempts:
+            return 0.0
+        rank = q * self.attempts
+        seen = 0
+        for bound, count in zip(self.buckets_ms, self.histogram, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, round(self.latency_ms_max, 1))
+        return round(self.latency_ms_max, 1)
+
+
+class TransportMetrics:
+    """Per-host, per-endpoint transport metrics.
+
+    Transports report every attempt (latency, status, size, error class)
+    and the retry policy reports retries. `snapshot()` exports everything
+    as a plain dict; `log_snapshot()` writes it to the logging system.
+    """
+
+    def __init__(
+        self, settings: TransportMetricsSettings = TransportMetricsSettings()
+    ) -> None:
+        self.settings = settings
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def endpoint(self, data: HTTPRequestData) -> EndpointMetrics:
+        key = (request_host(data), request_endpoint(data))
+        with self._lock:
+            if key not in self._endpoints:
+                self._endpoints[key] = EndpointMetrics(
+                    buckets_ms=tuple(self.settings.latency_buckets_ms)
+                )
+            return self._endpoints[key]
+
+    @contextmanager
+    def measure(self, data: HTTPRequestData) -> Iterator[Attempt]:
+        """Time one attempt; the transport sets status and size on the Attempt"""
+        attempt = Attempt()
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            yield attempt
+        except BaseException as exc:
+            error = exc
+            if attempt.status is None and isinstance(exc, BaseTransportException):
+                attempt.status = exc.status_code
+            raise
+        finally:
+            self.record_attempt(
+                data,
+                time.perf_counter() - started,
+                status=attempt.status,
+                nbytes=attempt.nbytes,
+                error_class=error_name(error),
+            )
+
+    def record_attempt(
+        self,
+        data: HTTPRequestData,
+        seconds: float,
+        status: int | None = None,
+        nbytes: int = 0,
+        error_class: str | None = None,
+    ) -> None:
+        endpoint = self.endpoint(data)
+        endpoint.record_attempt(seconds * 1000, status, error_class)
+        if nbytes:
+            endpoint.record_body(nbytes, None)
+
+        log_level = (
+            logging.WARNING
+            if seconds >= self.settings.slow_request_seconds
+            else logging.DEBUG
+        )
+        if logger.isEnabledFor(log_level):
+            logger.log(
+                log_level,
+                f"{data.method} {data.url} -> {status or error_class} "
+                f"in {seconds * 1000:.0f}ms, {nbytes} bytes",
+            )
+
+    def record_body(
+        self, data: HTTPRequestData, nbytes: int, error_class: str | None = None
+    ) -> None:
+        self.endpoint(data).record_body(nbytes, error_class)
+
+    def record_retry(self, data: HTTPRequestData) -> None:
+        self.endpoint(data).record_retry()
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """{host: {endpoint: metrics}}"""
+        with self._lock:
+            endpoints = dict(self._endpoints)
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        for (host, path), metrics in sorted(endpoints.items()):
+            result.setdefault(host, {})[path] = metrics.as_dict()
+        return result
+
+    def log_snapshot(self, level: int = logging.INFO) -> None:
+        if logger.isEnabledFor(level):
+            logger.log(level, f"HTTP transport metrics: {json.dumps(self.snapshot())}")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
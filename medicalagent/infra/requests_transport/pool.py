@@ -0,0 +1,159 @@
+import socket
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+from urllib3.connection import HTTPConnection
+
+# Waits shorter than this are queue bookkeeping, not real contention
+WAIT_THRESHOLD_SECONDS = 0.001
+
+
+@dataclass
+class HostPoolStats:
+    """Connection pool counters for a single host."""
+
+    checkouts: int = 0
+    opened: int = 0
+    reused: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    discarded: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_checkout(self, reused: bool, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            if reused:
+                self.reused += 1
+            else:
+                self.opened += 1
+            if waited >= WAIT_THRESHOLD_SECONDS:
+                self.waits += 1
+                self.wait_seconds += waited
+
+    def record_discard(self) -> None:
+        with self._lock:
+            self.discarded += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class PoolStatsRegistry:
+    """Thread-safe collection of per-host pool counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostPoolStats] = {}
+
+    def for_host(self, host: str) -> HostPoolStats:
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostPoolStats()
+            return self._hosts[host]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: stats.as_dict() for host, stats in hosts.items()}
+
+
+class _InstrumentedPoolMixin:
+    """Counts fresh vs reused connections and time spent waiting for a slot."""
+
+    stats: HostPoolStats
+
+    def _get_conn(self, timeout: float | None = None) -> Any:
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        waited = time.perf_counter() - started
+        self.stats.record_checkout(
+            reused=bool(getattr(conn, "is_connected", False)), waited=waited
+        )
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        pool = getattr(self, "pool", None)
+        if pool is not None and pool.full():
+            self.stats.record_discard()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class InstrumentedPoolManager(PoolManager):
+    """PoolManager whose pools report into a shared PoolStatsRegistry."""
+
+    def __init__(self, *args: Any, registry: PoolStatsRegistry, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            "http": InstrumentedHTTPConnectionPool,
+            "https": InstrumentedHTTPSConnectionPool,
+        }
+        self.registry = registry
+
+    def _new_pool(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request_context: dict[str, Any] | None = None,
+    ) -> HTTPConnectionPool:
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.stats = self.registry.for_host(host)  # type: ignore[attr-defined]
+        return pool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with instrumented pools and optional TCP keep-alive"""
+
+    def __init__(
+        self,
+        registry: PoolStatsRegistry,
+        tcp_keepalive: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        self.registry = registry
+        self.tcp_keepalive = tcp_keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: Any,
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        if self.tcp_keepalive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                [
+                    *HTTPConnection.default_socket_options,
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                ],
+            )
+
+        self.poolmanager = InstrumentedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            registry=self.registry,
+            **pool_kwargs,
+        )
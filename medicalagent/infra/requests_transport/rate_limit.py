@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from http import HTTPStatus
+from logging import getLogger
+from typing import Any
+
+from medicalagent.config.settings import RateLimitSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.deadline import remaining
+from medicalagent.infra.requests_transport.exceptions import RateLimitExceededError
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import request_host
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class RateLimitStats:
+    acquired: int = 0
+    delayed: int = 0
+    rejected: int = 0
+    queued: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_acquire(self, wait: float) -> None:
+        with self._lock:
+            self.acquired += 1
+            if wait:
+                self.delayed += 1
+                self.queued += 1
+                self.wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+    def record_dequeue(self) -> None:
+        with self._lock:
+            self.queued -= 1
+
+    def record_reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations in arrival order.
+
+    Each caller takes a token immediately (the balance may go negative) and
+    is told how long to sleep before its token matures, so waiting callers
+    form a FIFO queue without holding the lock while sleeping.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.stats = RateLimitStats()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> float | None:
+        """Returns seconds to wait for the reserved token, or None when the
+        wait would exceed max_wait (nothing is reserved in that case)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+            wait = max(0.0, (1 - self.tokens) / self.rate)
+            if wait > max_wait:
+                return None
+            self.tokens -= 1
+            return wait
+
+    def acquire(self, max_wait: float) -> float:
+        wait = self._reserve_or_reject(max_wait)
+        if wait:
+            try:
+                time.sleep(wait)
+            finally:
+                self.stats.record_dequeue()
+        return wait
+
+    async def acquire_async(self, max_wait: float) -> float:
+        """acquire() for event loops: waits without blocking the thread"""
+        wait = self._reserve_or_reject(max_wait)
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self.stats.record_dequeue()
+        return wait
+
+    def _reserve_or_reject(self, max_wait: float) -> float:
+        wait = self.reserve(max_wait)
+        if wait is None:
+            self.stats.record_reject()
+            raise RateLimitExceededError(
+                status_code=HTTPStatus.TOO_MANY_REQUESTS,
+                message=f"Client-side rate limit: queue wait exceeds {max_wait}s",
+            )
+        self.stats.record_acquire(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Per-host token buckets shared by every caller of the transport stacks
+    it is given to (sync and async alike)"""
+
+    def __init__(self, settings: RateLimitSettings = RateLimitSettings()) -> None:
+        self.settings = settings
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> float:
+        bucket = self._bucket(host)
+        if bucket is None:
+            return 0.0
+        # Never queue past the caller's deadline
+        wait = bucket.acquire(remaining(self.settings.max_wait))
+        if wait:
+            logger.debug(f"Rate limiter delayed request to {host} by {wait:.3f}s")
+        return wait
+
+    async def acquire_async(self, host: str) -> float:
+        bucket = self._bucket(host)
+        if bucket is None:
+            return 0.0
+        wait = await bucket.acquire_async(remaining(self.settings.max_wait))
+        if wait:
+            logger.debug(f"Rate limiter delayed request to {host} by {wait:.3f}s")
+        return wait
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats.as_dict() for host, bucket in buckets.items()}
+
+    def _bucket(self, host: str) -> TokenBucket | None:
+        rate = self.settings.host_rates.get(host)
+        if not rate:
+            return None
+        with self._lock:
+            if host not in self._buckets:
+                burst = self.settings.host_bursts.get(host, 1)
+                self._buckets[host] = TokenBucket(rate, burst)
+            return self._buckets[host]
+
+
+class RateLimitedHTTPTransport(AbstractSyncHTTPTransport):
+    """Waits for a per-host token before every upstream call"""
+
+    def __init__(
+        self,
+        inner: AbstractSyncHTTPTransport,
+        limiter: HostRateLimiter,
+    ) -> None:
+        self.inner = inner
+        self.limiter = limiter
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        self.limiter.acquire(request_host(data))
+        return self.inner.request(data)
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        self.limiter.acquire(request_host(data))
+        return self.inner.stream(data)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return self.limiter.stats()
@@ -1,72 +1,151 @@
+import threading
 from collections.abc import Iterator
 from http import HTTPStatus
 from logging import getLogger
 from typing import Any
 
 import requests
-from requests.adapters import HTTPAdapter
 
-from medicalagent.config.settings import HTTPTransportSettings, RetryBackoffSettings
+from medicalagent.config.settings import HTTPTransportSettings
 from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.deadline import attempt_timeout
+from medicalagent.infra.requests_transport.decoding import decode_body
 from medicalagent.infra.requests_transport.exceptions import (
     BaseTransportException,
     ClientError,
     ConnectionTransportError,
+    ResponseTooLargeError,
     ServerError,
 )
+from medicalagent.infra.requests_transport.metrics import (
+    TransportMetrics,
+    error_name,
+)
+from medicalagent.infra.requests_transport.pool import (
+    PooledHTTPAdapter,
+    PoolStatsRegistry,
+)
 from medicalagent.infra.requests_transport.schemas import (
-    ContentTypeEnum,
     HTTPRequestData,
     ResponseContent,
 )
-from medicalagent.infra.requests_transport.utils import get_retry
 
 logger = getLogger(__name__)
 
 
 class RequestsHTTPTransport(AbstractSyncHTTPTransport):  # pragma: nocover
-    """Based on requests, for sync calls. Has retry, back-off support"""
+    """Based on requests, for sync calls. Makes a single attempt per call:
+    retries and back-off live in RetryingHTTPTransport.
+
+    A single pooled session is kept for the transport lifetime and shared
+    between threads, so keep-alive connections are reused across calls.
+    Every attempt is reported to `metrics`.
+    """
 
     def __init__(
         self,
-        retry_settings: RetryBackoffSettings = RetryBackoffSettings(),
         client_settings: HTTPTransportSettings = HTTPTransportSettings(),
+        metrics: TransportMetrics | None = None,
     ) -> None:
-        self.retry_settings = retry_settings
         self.client_settings = client_settings
+        self.metrics = metrics or TransportMetrics()
         self.session: requests.Session | None = None
+        self.pool_stats = PoolStatsRegistry()
+        self._session_lock = threading.Lock()
 
     def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
-        try:
-            with self._session as s:
+        """The returned iterator owns the response: it releases the connection
+        back to the pool once exhausted, closed or failed, and raises
+        ResponseTooLargeError past `max_stream_bytes`."""
+        with self.metrics.measure(data) as attempt:
+            try:
                 request = self._prepare_request(data).prepare()
-                response = s.send(request, stream=True)
-                iterator = response.iter_content(
-                    chunk_size=self.client_settings.chunk_size
+                response = self._session.send(
+                    request,
+                    stream=True,
+                    timeout=attempt_timeout(self.client_settings.default_timeout),
                 )
-                content_len = int(response.headers.get("content-length", 0))
-                return content_len, iterator
-        except requests.RequestException as exc:
-            raise self._handle_requests_exception(exc)
+            except requests.RequestException as exc:
+                raise self._handle_requests_exception(exc)
+
+            attempt.status = response.status_code
+            if not response.ok:
+                with response:
+                    attempt.nbytes = len(response.content)
+                    self._handle_response(response)
+
+        content_len = int(response.headers.get("content-length", 0))
+        max_bytes = self.client_settings.max_stream_bytes
+        if content_len > max_bytes:
+            response.close()
+            raise ResponseTooLargeError(
+                status_code=response.status_code,
+                message=f"Content-Length {content_len} exceeds {max_bytes} bytes",
+            )
+        return content_len, self._iter_body(data, response, max_bytes)
 
     def request(self, data: HTTPRequestData) -> ResponseContent:
-        try:
-            with self._session as s:
+        with self.metrics.measure(data) as attempt:
+            try:
                 request = self._prepare_request(data).prepare()
-                response = s.send(request)
+                response = self._session.send(
+                    request,
+                    timeout=attempt_timeout(self.client_settings.default_timeout),
+                )
+                attempt.status = response.status_code
+                attempt.nbytes = len(response.content)
 
                 return self._handle_response(response)
+            except requests.RequestException as exc:
+                raise self._handle_requests_exception(exc)
+
+    def close(self) -> None:
+        """Close the pooled session and drop all kept-alive connections"""
+        with self._session_lock:
+            if self.session:
+                self.session.close()
+                self.session = None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-host pool counters: checkouts, opened, reused, waits, discarded"""
+        return self.pool_stats.snapshot()
+
+    def _iter_body(
+        self, data: HTTPRequestData, response: requests.Response, max_bytes: int
+    ) -> Iterator[bytes]:
+        received = 0
+        error: BaseException | None = None
+        try:
+            for chunk in response.iter_content(
+                chunk_size=self.client_settings.chunk_size
+            ):
+                received += len(chunk)
+                if received > max_bytes:
+                    raise ResponseTooLargeError(
+                        status_code=response.status_code,
+                        message=f"Streamed body exceeds {max_bytes} bytes",
+                    )
+                yield chunk
         except requests.RequestException as exc:
-            raise self._handle_requests_exception(exc)
+            error = self._handle_requests_exception(exc)
+            raise error
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            response.close()
+            self.metrics.record_body(data, received, error_name(error))
 
     def _prepare_request(self, data: HTTPRequestData) -> requests.Request:
+        headers = self.client_settings.common_headers
+        if data.headers:
+            headers.update(data.headers)
         return requests.Request(
             method=data.method,
             url=data.url,
-            headers=self.client_settings.common_headers.update(data.headers)
-            if data.headers
-            else self.client_settings.common_headers,
+            headers=headers,
             params=data.params,
+            json=data.json_body,
         )
 
     def _handle_response(self, response: requests.Response) -> ResponseContent:
@@ -87,6 +166,7 @@ class RequestsHTTPTransport(AbstractSyncHTTPTransport):  # pragma: nocover
                 status_code=exc.response.status_code,
                 response=content,
                 message=exc.response.reason,
+                headers=exc.response.headers,
             )
         else:
             return ConnectionTransportError(message=str(exc))
@@ -98,26 +178,46 @@ class RequestsHTTPTransport(AbstractSyncHTTPTransport):  # pragma: nocover
         exception_class = (
             ServerError if status >= HTTPStatus.INTERNAL_SERVER_ERROR else ClientError
         )
-        return exception_class(status_code=status, response=content)
+        return exception_class(
+            status_code=status,
+            response=content,
+            message=exc.response.reason,
+            headers=exc.response.headers,
+        )
 
     def _parse_content(self, response: requests.Response) -> str | Any:
-        match response.headers.get("content-type"):
-            case ContentTypeEnum.text_html:
-                return response.text
-            case ContentTypeEnum.json:
-                return response.json()
-            case ContentTypeEnum.binary_octet_stream:
-                return response.content
-        return response.text
+        return decode_body(
+            response.headers.get("content-type"),
+            response.content,
+            fallback_encoding=response.encoding or "utf-8",
+        )
+
+    def _make_adapter(self, maxsize: int) -> PooledHTTPAdapter:
+        cs = self.client_settings
+        return PooledHTTPAdapter(
+            registry=self.pool_stats,
+            tcp_keepalive=cs.keep_alive,
+            pool_connections=cs.pool_connections,
+            pool_maxsize=maxsize,
+            pool_block=cs.pool_block,
+        )
 
     @property
     def _session(self) -> requests.Session:
         if self.session:  # pragma: nocover
             return self.session
 
-        adapter = HTTPAdapter(max_retries=get_retry(self.retry_settings))
-        s = requests.Session()
-        s.mount("https://", adapter)
+        with self._session_lock:
+            if self.session:
+                return self.session
+
+            s = requests.Session()
+            default_adapter = self._make_adapter(self.client_settings.pool_maxsize)
+            s.mount("https://", default_adapter)
+            s.mount("http://", default_adapter)
+            # Longest prefix wins, so these override the default pool size
+            for host, maxsize in self.client_settings.host_pool_maxsize.items():
+                s.mount(f"https://{host}", self._make_adapter(maxsize))
 
-        self.session = s
-        return self.session
+            self.session = s
+            return self.session
@@ -0,0 +1,226 @@
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field, fields
+from logging import getLogger
+from typing import Any, TypeVar
+
+from medicalagent.config.settings import RetryBackoffSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.deadline import remaining
+from medicalagent.infra.requests_transport.exceptions import (
+    CircuitOpenError,
+    ClientError,
+    ConnectionTransportError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.metrics import TransportMetrics
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+
+logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+
+@dataclass
+class RetryStats:
+    requests: int = 0
+    retries: int = 0
+    budget_exhausted: int = 0
+    deadline_exceeded: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class RetryBudget:
+    """Token budget: every request deposits `ratio` tokens, every retry
+    withdraws one. The balance is capped at `burst`, so in steady state
+    retries stay below ratio * requests plus a small reserve.
+    """
+
+    def __init__(self, ratio: float, burst: int) -> None:
+        self.ratio = ratio
+        self.burst = float(burst)
+        self.balance = float(burst)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.balance = min(self.burst, self.balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self.balance < 1:
+                return False
+            self.balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when to retry, from RetryBackoffSettings.
+
+    Owns the RetryBudget, so every transport sharing one policy (sync and
+    async alike) draws retries from the same process-wide budget. Granted
+    retries are counted per endpoint in `metrics`, when given.
+    """
+
+    def __init__(
+        self,
+        settings: RetryBackoffSettings = RetryBackoffSettings(),
+        metrics: TransportMetrics | None = None,
+    ) -> None:
+        self.settings = settings
+        self.metrics = metrics
+        self.budget = RetryBudget(
+            settings.retry_budget_ratio, settings.retry_budget_burst
+        )
+        self.stats = RetryStats()
+
+    def start(self) -> float:
+        """Register a new request; returns its deadline (monotonic), which
+        a caller's deadline_scope may bring forward"""
+        self.budget.deposit()
+        self.stats.incr("requests")
+        return time.monotonic() + remaining(self.settings.deadline)
+
+    def next_delay(
+        self,
+        data: HTTPRequestData,
+        status: int | None,
+        retry_after: str | None,
+        attempt: int,
+        deadline: float,
+    ) -> float | None:
+        """Seconds to wait before retry number `attempt`, None to give up"""
+        if attempt > self.settings.max_retries:
+            return None
+        if not self.is_retryable(data.method, status):
+            return None
+
+        delay = self.delay(attempt, status, retry_after)
+        if time.monotonic() + delay >= deadline:
+            self.stats.incr("deadline_exceeded")
+            logger.info(
+                f"Not retrying {data.url}: waiting {delay:.1f}s would exceed "
+                f"the {self.settings.deadline}s deadline"
+            )
+            return None
+        if not self.budget.try_withdraw():
+            self.stats.incr("budget_exhausted")
+            logger.warning(f"Retry budget exhausted, not retrying {data.url}")
+            return None
+
+        self.stats.incr("retries")
+        if self.metrics is not None:
+            self.metrics.record_retry(data)
+        logger.debug(
+            f"Retrying {data.method} {data.url} after {status or 'connection error'} "
+            f"in {delay:.2f}s (attempt {attempt}/{self.settings.max_retries})"
+        )
+        return delay
+
+    def is_retryable(self, method: str, status: int | None) -> bool:
+        """status is None for connection errors (no response at all)"""
+        if method not in self.settings.allowed_methods:
+            return False
+        return status is None or status in self.settings.status_forcelist
+
+    def delay(self, attempt: int, status: int | None, retry_after: str | None) -> float:
+        """Wait before retry number `attempt` (1-based).
+
+        A Retry-After sent with 413/429/503 wins over the computed backoff;
+        otherwise urllib3's formula: factor * 2 ** (attempt - 1) + jitter,
+        capped by max_backoff, with no wait before the first retry.
+        """
+        rs = self.settings
+        if status in rs.retry_after_statuses:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                return server_delay
+        if attempt <= 1:
+            return 0.0
+        value = rs.backoff_factor * (2 ** (attempt - 1))
+        if rs.backoff_jitter:
+            value += random.random() * rs.backoff_jitter  # nosec B311
+        return float(max(0, min(rs.max_backoff, value)))
+
+
+class RetryingHTTPTransport(AbstractSyncHTTPTransport):
+    """Retries failed calls of the wrapped transport.
+
+    Honors Retry-After, gives up once the next wait would overrun the
+    per-request deadline, and draws every retry from the policy's budget.
+    CircuitOpenError is never retried.
+    """
+
+    def __init__(
+        self,
+        inner: AbstractSyncHTTPTransport,
+        policy: RetryPolicy | None = None,
+    ) -> None:
+        self.inner = inner
+        self.policy = policy or RetryPolicy()
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        return self._with_retries(self.inner.request, data)
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        # Only establishing the stream is retried, never a half-read body
+        return self._with_retries(self.inner.stream, data)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.policy.stats.as_dict(),
+            "budget_balance": round(self.policy.budget.balance, 3),
+        }
+
+    def _with_retries(
+        self, call: Callable[[HTTPRequestData], T], data: HTTPRequestData
+    ) -> T:
+        deadline = self.policy.start()
+        attempt = 0
+        while True:
+            try:
+                return call(data)
+            except CircuitOpenError:
+                # The breaker below opened mid-retry: retrying cannot help
+                raise
+            except (ClientError, ServerError, ConnectionTransportError) as exc:
+                attempt += 1
+                delay = self.policy.next_delay(
+                    data,
+                    exc.status_code,
+                    exc.headers.get("retry-after"),
+                    attempt,
+                    deadline,
+                )
+                if delay is None:
+                    raise
+                time.sleep(delay)
@@ -9,7 +9,10 @@ ResponseContent = dict[str, Any] | str
 
 class ContentTypeEnum(StrEnum):
     binary_octet_stream = "binary/octet-stream"
+    application_octet_stream = "application/octet-stream"
+    pdf = "application/pdf"
     json = "application/json"
+    xml = "application/xml"
     text_html = "text/html"
 
 
@@ -18,3 +21,5 @@ class HTTPRequestData(BaseModel):
     url: str
     params: dict[str, Any] | None = None
     headers: dict[str, Any] | None = None
+    # JSON request body (e.g. batch endpoints taking a list of ids)
+    json_body: Any | None = None
@@ -0,0 +1,92 @@
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+from medicalagent.infra.requests_transport.utils import request_key
+
+COALESCIBLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass
+class SingleFlightStats:
+    leaders: int = 0
+    coalesced: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: ResponseContent | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlightHTTPTransport(AbstractSyncHTTPTransport):
+    """Coalesces identical in-flight requests.
+
+    The first caller for a request_key (the leader) goes upstream; callers
+    arriving while it is in flight wait and receive the leader's result or
+    exception. Nothing is remembered once the leader finishes - that is the
+    cache's job.
+    """
+
+    def __init__(self, inner: AbstractSyncHTTPTransport) -> None:
+        self.inner = inner
+        self.flight_stats = SingleFlightStats()
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        if data.method not in COALESCIBLE_METHODS:
+            return self.inner.request(data)
+
+        key = request_key(data)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.flight_stats.incr("coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        self.flight_stats.incr("leaders")
+        try:
+            call.result = self.inner.request(data)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        # A stream can only be consumed once, so it is never shared
+        return self.inner.stream(data)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            in_flight = len(self._calls)
+        return {**self.flight_stats.as_dict(), "in_flight": in_flight}
@@ -0,0 +1,220 @@
+import codecs
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+from xml.etree.ElementTree import Element, XMLPullParser  # nosec B405
+
+from medicalagent.config.settings import HTTPTransportSettings
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+
+JSON_WHITESPACE = " \t\n\r"
+ARRAY_DELIMITERS = JSON_WHITESPACE + ",]"
+OBJECT_DELIMITERS = JSON_WHITESPACE + ",}"
+
+
+def spool(
+    transport: AbstractSyncHTTPTransport,
+    data: HTTPRequestData,
+    max_memory_bytes: int = HTTPTransportSettings().spool_memory_bytes,
+) -> IO[bytes]:
+    """Download a body into a SpooledTemporaryFile, rewound to the start.
+
+    Bodies up to `max_memory_bytes` stay in memory; larger ones spill to a
+    temp file, so big downloads never sit whole in the Streamlit process.
+    The connection goes back to the pool as soon as the body is read, however
+    slowly the caller parses it. The caller closes the file (which deletes
+    the spill file).
+    """
+    _, chunks = transport.stream(data)
+    buffer = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)  # noqa: SIM115
+    try:
+        for chunk in chunks:
+            buffer.write(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer  # type: ignore[return-value]
+
+
+def iter_file_chunks(file: IO[bytes], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def iter_json_items(chunks: Iterable[bytes], key: str = "results") -> Iterator[Any]:
+    """Yield the elements of the top-level array `key` as they arrive.
+
+    Only one element (plus the unread tail of the current chunk) is held in
+    memory at a time, so a 1000-item bulk search page can be consumed - and
+    abandoned early - without parsing the whole body. Yields nothing if the
+    document has no such top-level array.
+    """
+    stream = _TextStream(chunks)
+    if not _seek_value(stream, key) or _next_char(stream) != "[":
+        return
+    stream.pos += 1
+
+    decoder = json.JSONDecoder()
+    while True:
+        # Skip separators between elements
+        while True:
+            char = _next_char(stream)
+            if char is None:
+                raise ValueError(f"Unterminated '{key}' array")
+            if char == ",":
+                stream.pos += 1
+            elif char == "]":
+                return
+            else:
+                break
+        item = _decode(stream, decoder, ARRAY_DELIMITERS)
+        if item is _MISSING:
+            raise ValueError(f"Unterminated '{key}' array")
+        yield item
+
+
+def json_value(chunks: Iterable[bytes], key: str) -> Any:
+    """The value of top-level `key`, None when absent.
+
+    For small values next to a large array (a paging token after the
+    results): the document is scanned, not parsed, up to the key.
+    """
+    stream = _TextStream(chunks)
+    if not _seek_value(stream, key) or _next_char(stream) is None:
+        return None
+    value = _decode(stream, json.JSONDecoder(), OBJECT_DELIMITERS)
+    return None if value is _MISSING else value
+
+
+def iter_xml_elements(chunks: Iterable[bytes], tag: str) -> Iterator[Element]:
+    """Yield each `tag` element as soon as its end tag has arrived.
+
+    The XML counterpart of iter_json_items: an element is cleared once the
+    consumer moves on, so a 200-record efetch body is never held whole.
+    Only trusted APIs are parsed; expat does not fetch external entities.
+    """
+    parser = XMLPullParser(events=("end",))  # nosec B314
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _completed_elements(parser, tag)
+    parser.close()
+    yield from _completed_elements(parser, tag)
+
+
+def _completed_elements(parser: XMLPullParser, tag: str) -> Iterator[Element]:
+    for _, element in parser.read_events():
+        if element.tag == tag:
+            yield element
+            element.clear()
+
+
+_MISSING = object()
+
+
+class _TextStream:
+    """UTF-8 text buffer over byte chunks; drops consumed text on refill"""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._exhausted = False
+        self.buf = ""
+        self.pos = 0
+
+    def more(self) -> bool:
+        """Append the next chunk; False once the input is exhausted"""
+        while not self._exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                text = self._decoder.decode(b"", final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos :] + text
+                self.pos = 0
+                return True
+        return False
+
+
+def _next_char(stream: _TextStream) -> str | None:
+    """First character from stream.pos on that is not whitespace"""
+    while True:
+        if stream.pos >= len(stream.buf):
+            if not stream.more():
+                return None
+            continue
+        char = stream.buf[stream.pos]
+        if char not in JSON_WHITESPACE:
+            return char
+        stream.pos += 1
+
+
+def _decode(stream: _TextStream, decoder: json.JSONDecoder, delimiters: str) -> Any:
+    """Decode the value at stream.pos, reading more chunks as needed"""
+    while True:
+        try:
+            value, end = decoder.raw_decode(stream.buf, stream.pos)
+        except json.JSONDecodeError:
+            if not stream.more():
+                return _MISSING
+            continue
+        # A number cut by a chunk boundary ("2." of "2.5") still decodes:
+        # only trust it once a delimiter follows
+        at_boundary = end >= len(stream.buf) or stream.buf[end] not in delimiters
+        if at_boundary and stream.more():
+            continue
+        stream.pos = end
+        return value
+
+
+def _seek_value(stream: _TextStream, key: str) -> bool:
+    """Advance stream.pos just past the ':' after the top-level `key`.
+
+    Keys are collected as they are scanned, so the text of skipped values
+    (a whole results array) is dropped chunk by chunk.
+    """
+    depth = 0
+    last_string: str | None = None
+    chars = _scan_chars(stream)
+    for char in chars:
+        if char == '"':
+            text = _scan_string(chars, keep=depth == 1)
+            if depth == 1:
+                last_string = text
+        elif char == ":" and depth == 1 and last_string == key:
+            # Only keys are followed by ':'
+            return True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return False
+    return False
+
+
+def _scan_string(chars: Iterator[str], keep: bool) -> str | None:
+    """Consume a string whose opening quote was read; decoded if `keep`"""
+    raw: list[str] = []
+    escaped = False
+    for char in chars:
+        if char == '"' and not escaped:
+            break
+        escaped = char == "\\" and not escaped
+        if keep:
+            raw.append(char)
+    return json.loads('"' + "".join(raw) + '"') if keep else None
+
+
+def _scan_chars(stream: _TextStream) -> Iterator[str]:
+    """Characters from stream.pos on, advancing it as they are consumed"""
+    while True:
+        if stream.pos >= len(stream.buf) and not stream.more():
+            return
+        char = stream.buf[stream.pos]
+        stream.pos += 1
+        yield char
@@ -1,16 +1,65 @@
-import urllib3
-
-from medicalagent.config.settings import RetryBackoffSettings
-
-
-def get_retry(rs: RetryBackoffSettings) -> urllib3.Retry:  # pragma: no cover
-    return urllib3.Retry(
-        total=rs.max_retries,
-        allowed_methods=rs.allowed_methods,
-        status_forcelist=rs.status_forcelist,
-        backoff_factor=rs.backoff_factor,
-        backoff_jitter=rs.backoff_jitter,
-        backoff_max=rs.max_backoff,
-        raise_on_redirect=True,
-        raise_on_status=True,
-    )
+import base64
+import json
+import re
+from typing import Any
+from urllib.parse import urlsplit
+
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+
+
+def request_key(data: HTTPRequestData) -> str:
+    """Stable identity of a request: method, url, params sorted by name and
+    the JSON body, if any.
+
+    Headers are not part of the key: they only carry client identification.
+    """
+    params = sorted((str(k), str(v)) for k, v in (data.params or {}).items())
+    key: list[Any] = [str(data.method), data.url, params]
+    if data.json_body is not None:
+        key.append(data.json_body)
+    return json.dumps(key, separators=(",", ":"), sort_keys=True, default=str)
+
+
+_API_VERSION = re.compile(r"v\d+")
+
+
+def request_host(data: HTTPRequestData) -> str:
+    return urlsplit(data.url).hostname or ""
+
+
+def request_endpoint(data: HTTPRequestData) -> str:
+    """URL path with identifiers collapsed, for grouping metrics.
+
+    '/works/W2741809807' -> '/works/{id}'. Path segments after the first
+    identifier are dropped: DOIs and URLs used as ids contain slashes.
+    """
+    segments = []
+    for segment in urlsplit(data.url).path.split("/"):
+        if not segment:
+            continue
+        is_id = ":" in segment or (
+            any(char.isdigit() for char in segment)
+            and not _API_VERSION.fullmatch(segment)
+        )
+        if is_id:
+            segments.append("{id}")
+            break
+        segments.append(segment)
+    return "/" + "/".join(segments)
+
+
+def content_to_json(content: ResponseContent | bytes) -> dict[str, Any]:
+    """JSON-safe form of a decoded body; bytes are base64-encoded"""
+    if isinstance(content, bytes):
+        return {"kind": "bytes", "value": base64.b64encode(content).decode()}
+    kind = "text" if isinstance(content, str) else "json"
+    return {"kind": kind, "value": content}
+
+
+def content_from_json(data: dict[str, Any]) -> Any:
+    if data["kind"] == "bytes":
+        return base64.b64decode(data["value"])
+    return data["value"]
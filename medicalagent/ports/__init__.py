@@ -3,6 +3,13 @@
 from .agent import AgentService
 from .dialog_repository import DialogRepository
 from .findings_repository import FindingsRepository
+from .paper_repository import PaperRepository
 from .user_repository import UserRepository
 
-__all__ = ["AgentService", "DialogRepository", "FindingsRepository", "UserRepository"]
+__all__ = [
+    "AgentService",
+    "DialogRepository",
+    "FindingsRepository",
+    "PaperRepository",
+    "UserRepository",
+]
@@ -16,9 +16,12 @@ class AgentService(ABC):
         chat_history: list[ChatMessage],
         dialog_id: int,
         callbacks: list[BaseCallbackHandler] | None = None,
+        trusted_sites: list[str] | None = None,
     ) -> list[AIMessage]:
         """Call the agent with a prompt and return the response.
 
+        Search tools prefer results from `trusted_sites` (domains or URLs).
+
         Returns:
             The agent's response as a list of AIMessages
         """
@@ -0,0 +1,52 @@
+"""Paper repository interface (port): local index of fetched papers."""
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from medicalagent.domain.paper import Paper, QueryRun
+
+
+class PaperRepository(ABC):
+    """Abstract repository for Paper operations."""
+
+    @abstractmethod
+    def upsert(self, papers: list[Paper]) -> None:
+        """Insert papers or refresh the stored copies (merging their sources)."""
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        limit: int,
+        year_min: int | None = None,
+        source: str | None = None,
+        max_age: timedelta | None = None,
+    ) -> list[Paper]:
+        """Full-text search over titles and abstracts, best matches first.
+
+        Only papers seen from `source` and refreshed within `max_age` count.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_dois(
+        self, dois: list[str], max_age: timedelta | None = None
+    ) -> list[Paper]:
+        """Stored papers with the given (normalized) DOIs."""
+        pass
+
+    @abstractmethod
+    def record_query_run(self, run: QueryRun) -> None:
+        """Remember that a query went upstream now (replacing earlier runs)."""
+        pass
+
+    @abstractmethod
+    def get_query_run(
+        self, source: str, query: str, year_min: int | None, max_age: timedelta
+    ) -> QueryRun | None:
+        """The query's last upstream run, if within `max_age`.
+
+        Queries match after case, punctuation and whitespace normalization.
+        """
+        pass
@@ -0,0 +1,53 @@
+"""Scripted inner transports for testing the transport decorators"""
+
+import json
+import threading
+from collections.abc import Iterator
+
+from medicalagent.infra.requests_transport.base import AbstractSyncHTTPTransport
+from medicalagent.infra.requests_transport.schemas import (
+    HTTPRequestData,
+    ResponseContent,
+)
+
+STREAM_CHUNK = 7
+
+
+class FakeTransport(AbstractSyncHTTPTransport):
+    """Answers each call with the next scripted outcome.
+
+    An outcome is a response or an exception to raise; the last one repeats.
+    `gate`, when given, holds every call until it is set.
+    """
+
+    def __init__(
+        self,
+        *outcomes: ResponseContent | BaseException,
+        gate: threading.Event | None = None,
+    ) -> None:
+        self.outcomes = list(outcomes) or [{"ok": True}]
+        self.gate = gate
+        self.calls: list[HTTPRequestData] = []
+        self._lock = threading.Lock()
+
+    def request(self, data: HTTPRequestData) -> ResponseContent:
+        with self._lock:
+            self.calls.append(data)
+            outcome = self.outcomes[min(len(self.calls), len(self.outcomes)) - 1]
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def stream(self, data: HTTPRequestData) -> tuple[int, Iterator[bytes]]:
+        content = self.request(data)
+        text = content if isinstance(content, str) else json.dumps(content)
+        body = text.encode()
+        # Small chunks, so parsers see values cut at chunk boundaries
+        chunks = [body[i : i + STREAM_CHUNK] for i in range(0, len(body), STREAM_CHUNK)]
+        return len(body), iter(chunks)
+
+
+def get(url: str = "https://api.example.org/works") -> HTTPRequestData:
+    return HTTPRequestData(method="GET", url=url)
@@ -0,0 +1,88 @@
+import time
+
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.config.settings import CircuitBreakerSettings, RetryBackoffSettings
+from medicalagent.infra.requests_transport.circuit_breaker import (
+    CircuitBreakerHTTPTransport,
+    CircuitState,
+)
+from medicalagent.infra.requests_transport.exceptions import (
+    CircuitOpenError,
+    ClientError,
+    ConnectionTransportError,
+)
+from medicalagent.infra.requests_transport.retry import (
+    RetryingHTTPTransport,
+    RetryPolicy,
+)
+
+THRESHOLD = 3
+HOST = "api.example.org"
+# Wall-time bounds, seconds: one short retry loop, then an immediate reject
+RETRY_LOOP_BOUND = 2
+FAIL_FAST_BOUND = 0.1
+
+
+def _stack(
+    inner: FakeTransport, recovery_timeout: float = 30
+) -> tuple[RetryingHTTPTransport, CircuitBreakerHTTPTransport]:
+    breaker = CircuitBreakerHTTPTransport(
+        inner,
+        CircuitBreakerSettings(
+            failure_threshold=THRESHOLD, recovery_timeout=recovery_timeout
+        ),
+    )
+    # Generous retries and deadline: only the breaker may cut them short
+    policy = RetryPolicy(
+        RetryBackoffSettings(
+            max_retries=20, backoff_factor=0.01, backoff_jitter=0, deadline=60
+        )
+    )
+    return RetryingHTTPTransport(breaker, policy), breaker
+
+
+def test_dead_host_opens_the_circuit_within_one_retry_loop():
+    inner = FakeTransport(ConnectionTransportError(message="refused"))
+    transport, breaker = _stack(inner)
+
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError):
+        transport.request(get())
+
+    assert len(inner.calls) == THRESHOLD
+    assert time.monotonic() - started < RETRY_LOOP_BOUND
+    assert breaker.breaker(HOST).state == CircuitState.open
+
+    # Later requests fail fast without reaching the host
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError):
+        transport.request(get())
+    assert len(inner.calls) == THRESHOLD
+    assert time.monotonic() - started < FAIL_FAST_BOUND
+
+
+def test_half_open_probe_closes_the_circuit_on_success():
+    inner = FakeTransport(
+        *[ConnectionTransportError(message="refused")] * THRESHOLD, {"ok": True}
+    )
+    transport, breaker = _stack(inner, recovery_timeout=0.05)
+    with pytest.raises(CircuitOpenError):
+        transport.request(get())
+
+    time.sleep(0.06)
+
+    assert transport.request(get()) == {"ok": True}
+    assert breaker.breaker(HOST).state == CircuitState.closed
+
+
+def test_client_errors_about_the_request_keep_the_circuit_closed():
+    inner = FakeTransport(ClientError(status_code=404, message="not found"))
+    transport, breaker = _stack(inner)
+
+    for _ in range(THRESHOLD + 1):
+        with pytest.raises(ClientError):
+            transport.request(get())
+
+    assert breaker.breaker(HOST).state == CircuitState.closed
+    assert len(inner.calls) == THRESHOLD + 1
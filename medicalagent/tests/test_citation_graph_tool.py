@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+from medicalagent.adapters.agent.tools.citation_graph_tool import citation_graph_tool
+
+
+class BrokenGraph:
+    settings = SimpleNamespace(max_results=10)
+
+    def expand(self, *args: object) -> None:
+        raise KeyError("referenced_works")
+
+
+def test_unexpected_errors_are_returned_to_the_agent():
+    container = SimpleNamespace(citation_graph=BrokenGraph(), http_transport=None)
+    runtime = SimpleNamespace(context=SimpleNamespace(container=container))
+
+    output = citation_graph_tool.func(runtime=runtime, work="10.1056/nejmoa2307563")
+
+    assert output.startswith("Unexpected Error in citation graph")
+    assert "referenced_works" in output
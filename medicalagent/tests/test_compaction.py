@@ -0,0 +1,40 @@
+from medicalagent.adapters.agent.tools import compaction
+from medicalagent.adapters.agent.tools.compaction import count_tokens, render_cards
+from medicalagent.domain.paper import Paper
+
+BUDGET = 50
+
+
+def _title_only(number: int, paper: Paper, abstract: str | None, limit: int) -> str:
+    return paper.title
+
+
+def test_single_card_over_budget_is_truncated():
+    output = render_cards([Paper(title="x " * 400)], _title_only, max_tokens=BUDGET)
+
+    assert output.endswith("...")
+    assert count_tokens(output) <= BUDGET
+
+
+def test_cards_over_budget_keep_top_result_and_note():
+    papers = [Paper(title=f"result {i} " + "word " * 30) for i in range(5)]
+
+    output = render_cards(papers, _title_only, max_tokens=BUDGET)
+
+    assert output.startswith("result 0")
+    assert "4 more results omitted" in output
+    assert count_tokens(output) <= BUDGET
+
+
+def test_unavailable_tiktoken_vocabulary_falls_back_to_estimate(monkeypatch):
+    class OfflineTiktoken:
+        @staticmethod
+        def get_encoding(name: str):
+            raise ConnectionError("no network")
+
+    monkeypatch.setattr(compaction, "tiktoken", OfflineTiktoken)
+    compaction._encoding.cache_clear()
+    try:
+        assert count_tokens("semaglutide reduced events.") > 0
+    finally:
+        compaction._encoding.cache_clear()
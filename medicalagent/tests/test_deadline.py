@@ -0,0 +1,97 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.adapters.academic.rerank import Reranker
+from medicalagent.adapters.agent.tools import academic_search_tool
+from medicalagent.adapters.repositories import InMemoryPaperRepository
+from medicalagent.config import settings
+from medicalagent.config.settings import RateLimitSettings, RetryBackoffSettings
+from medicalagent.domain.paper import Paper
+from medicalagent.domain.sites import DomainMatcher
+from medicalagent.infra.requests_transport.deadline import deadline_scope
+from medicalagent.infra.requests_transport.exceptions import (
+    RateLimitExceededError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.rate_limit import (
+    HostRateLimiter,
+    RateLimitedHTTPTransport,
+)
+from medicalagent.infra.requests_transport.retry import (
+    RetryingHTTPTransport,
+    RetryPolicy,
+)
+
+SCOPE = 0.2
+# Retries that would go on for a minute without a caller deadline
+ENDLESS_RETRIES = RetryBackoffSettings(
+    max_retries=10_000,
+    backoff_factor=0.005,
+    backoff_jitter=0,
+    max_backoff=1,
+    retry_budget_burst=10_000,
+)
+
+
+def _failing() -> RetryingHTTPTransport:
+    inner = FakeTransport(ServerError(status_code=503, message="unavailable"))
+    return RetryingHTTPTransport(inner, RetryPolicy(ENDLESS_RETRIES))
+
+
+def test_retries_stop_at_the_callers_deadline():
+    transport = _failing()
+
+    started = time.monotonic()
+    with deadline_scope(started + SCOPE), pytest.raises(ServerError):
+        transport.request(get())
+
+    assert time.monotonic() - started < SCOPE + 0.1
+
+
+def test_rate_limit_wait_is_capped_by_the_callers_deadline():
+    host = "api.example.org"
+    limiter = HostRateLimiter(
+        RateLimitSettings(host_rates={host: 1}, host_bursts={host: 1}, max_wait=30)
+    )
+    transport = RateLimitedHTTPTransport(FakeTransport(), limiter)
+    transport.request(get())
+
+    with (
+        deadline_scope(time.monotonic() + SCOPE),
+        pytest.raises(RateLimitExceededError),
+    ):
+        transport.request(get())
+
+
+def test_timed_out_sources_release_their_worker(monkeypatch):
+    finished = threading.Event()
+
+    def slow_source(transport, query, year_min, limit) -> list[Paper]:  # noqa: ANN001
+        try:
+            _failing().request(get())
+        finally:
+            finished.set()
+        return []
+
+    monkeypatch.setattr(academic_search_tool, "SOURCES", {"Slow": slow_source})
+    monkeypatch.setattr(settings.ACADEMIC_SEARCH, "timeout", SCOPE)
+    container = SimpleNamespace(
+        paper_repository=InMemoryPaperRepository(),
+        http_transport=None,
+        reranker=Reranker(),
+    )
+    runtime = SimpleNamespace(
+        context=SimpleNamespace(
+            container=container, user_prompt="", trusted_domains=DomainMatcher([])
+        )
+    )
+
+    output = academic_search_tool.academic_search_tool.func(
+        runtime=runtime, query="semaglutide"
+    )
+
+    assert output.startswith("Academic Search Failed")
+    assert finished.wait(timeout=0.5)
@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.config.settings import (
+    CircuitBreakerSettings,
+    RateLimitSettings,
+    RetryBackoffSettings,
+)
+from medicalagent.infra.requests_transport.circuit_breaker import (
+    CircuitBreakerHTTPTransport,
+    CircuitBreakers,
+    CircuitState,
+)
+from medicalagent.infra.requests_transport.exceptions import (
+    CircuitOpenError,
+    RateLimitExceededError,
+)
+from medicalagent.infra.requests_transport.httpx_transport import (
+    HttpxAsyncHTTPTransport,
+)
+from medicalagent.infra.requests_transport.rate_limit import (
+    HostRateLimiter,
+    RateLimitedHTTPTransport,
+)
+from medicalagent.infra.requests_transport.retry import RetryPolicy
+
+HOST = "api.example.org"
+THRESHOLD = 3
+
+
+def _run(transport: HttpxAsyncHTTPTransport, handler) -> None:  # noqa: ANN001
+    async def main() -> None:
+        # Route the loop's client to an in-process handler
+        loop = asyncio.get_running_loop()
+        transport._clients[loop] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        try:
+            await transport.request(get())
+        finally:
+            await transport.aclose()
+
+    asyncio.run(main())
+
+
+def test_async_attempts_open_the_shared_circuit():
+    attempts = []
+
+    def dead_host(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(503)
+
+    breakers = CircuitBreakers(CircuitBreakerSettings(failure_threshold=THRESHOLD))
+    policy = RetryPolicy(
+        RetryBackoffSettings(max_retries=20, backoff_factor=0.001, backoff_jitter=0)
+    )
+    transport = HttpxAsyncHTTPTransport(policy, circuit_breakers=breakers)
+
+    with pytest.raises(CircuitOpenError):
+        _run(transport, dead_host)
+
+    assert len(attempts) == THRESHOLD
+    # The sync stack sharing the breakers fails fast too
+    inner = FakeTransport()
+    sync = CircuitBreakerHTTPTransport(inner, breakers=breakers)
+    with pytest.raises(CircuitOpenError):
+        sync.request(get())
+    assert not inner.calls
+    assert breakers.get(HOST).state == CircuitState.open
+
+
+def test_async_requests_take_tokens_from_the_shared_buckets():
+    limiter = HostRateLimiter(
+        RateLimitSettings(host_rates={HOST: 1}, host_bursts={HOST: 1}, max_wait=0.05)
+    )
+    # The sync stack spends the only token
+    RateLimitedHTTPTransport(FakeTransport(), limiter).request(get())
+    transport = HttpxAsyncHTTPTransport(rate_limiter=limiter)
+
+    with pytest.raises(RateLimitExceededError):
+        _run(transport, lambda request: httpx.Response(200, json={"ok": True}))
+
+    assert limiter.stats()[HOST]["rejected"] == 1
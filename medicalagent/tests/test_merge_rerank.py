@@ -0,0 +1,107 @@
+from medicalagent.adapters.academic.merge import merge_papers
+from medicalagent.adapters.academic.rerank import Reranker
+from medicalagent.config.settings import RerankSettings
+from medicalagent.domain.paper import Paper
+from medicalagent.domain.sites import DomainMatcher
+
+
+def _paper(title: str, source: str = "OpenAlex", **fields: object) -> Paper:
+    return Paper(title=title, sources=[source], **fields)
+
+
+def _titles(papers: list[Paper]) -> list[str]:
+    return [paper.title for paper in papers]
+
+
+def test_papers_ranked_by_both_sources_come_first():
+    shared = "Semaglutide and cardiovascular outcomes"
+    openalex = [_paper("OpenAlex only"), _paper(shared, doi="10.1/sel")]
+    s2 = [_paper(shared, "Semantic Scholar", doi="10.1/SEL"), _paper("S2 only")]
+
+    merged = merge_papers([openalex, s2])
+
+    assert _titles(merged) == [shared, "OpenAlex only", "S2 only"]
+    assert merged[0].sources == ["OpenAlex", "Semantic Scholar"]
+
+
+def test_equal_fused_scores_are_ordered_by_citations():
+    merged = merge_papers(
+        [
+            [_paper("Unknown count")],
+            [_paper("Well cited", "Semantic Scholar", citations=50)],
+            [_paper("Rarely cited", "PubMed", citations=2)],
+        ]
+    )
+
+    assert _titles(merged) == ["Well cited", "Rarely cited", "Unknown count"]
+
+
+def test_duplicates_merge_by_doi_or_long_title():
+    title = "Effect of semaglutide on kidney outcomes"
+    merged = merge_papers(
+        [
+            [_paper(title.upper() + ".", "PubMed", abstract="Longer abstract text")],
+            [_paper(title, "OpenAlex", doi="10.1/k", citations=7)],
+            [_paper("Editorial", "OpenAlex"), _paper("Editorial", "PubMed", doi="1")],
+        ]
+    )
+
+    kidney = merged[0]
+    assert kidney.doi == "10.1/k"
+    assert kidney.citations == 7
+    assert kidney.abstract == "Longer abstract text"
+    assert kidney.sources == ["PubMed", "OpenAlex"]
+    # Short titles are too generic to merge on
+    assert _titles(merged).count("Editorial") == 2
+
+
+def test_bm25_puts_the_relevant_paper_first():
+    papers = [
+        _paper("Statins and muscle pain"),
+        _paper("Aspirin for primary prevention"),
+        _paper("Semaglutide in heart failure", abstract="Semaglutide reduced events"),
+    ]
+
+    ranked = Reranker().rerank(papers, ["semaglutide heart failure"], 2)
+
+    assert _titles(ranked) == [
+        "Semaglutide in heart failure",
+        "Statins and muscle pain",
+    ]
+
+
+def test_rerank_ties_keep_the_source_order():
+    papers = [_paper(f"Unrelated topic {i}") for i in range(4)]
+
+    ranked = Reranker().rerank(papers, ["semaglutide"], 3)
+
+    assert _titles(ranked) == _titles(papers[:3])
+
+
+def test_trusted_landing_pages_are_boosted():
+    papers = [
+        _paper("Semaglutide trial", url="https://example.com/a"),
+        _paper("Semaglutide trial", url="https://www.nejm.org/doi/b"),
+    ]
+
+    ranked = Reranker().rerank(
+        papers, ["semaglutide"], 2, trusted=DomainMatcher(["nejm.org"])
+    )
+
+    assert ranked[0].url == "https://www.nejm.org/doi/b"
+
+
+def test_disabled_reranker_keeps_the_source_order():
+    reranker = Reranker(RerankSettings(enabled=False))
+    papers = [_paper("Aspirin"), _paper("Semaglutide")]
+
+    assert reranker.candidates(5) == 5
+    assert _titles(reranker.rerank(papers, ["semaglutide"], 1)) == ["Aspirin"]
+
+
+def test_candidates_over_fetch_up_to_the_cap():
+    reranker = Reranker(RerankSettings(candidate_factor=3, max_candidates=12))
+
+    assert reranker.candidates(3) == 9
+    assert reranker.candidates(5) == 12
+    assert reranker.candidates(20) == 20
@@ -0,0 +1,33 @@
+from medicalagent.adapters.news.dedup import NewsDeduplicator
+
+STORY = {
+    "url": "https://www.site.com/story?utm_source=feed",
+    "title": "FDA approves oral semaglutide for weight loss",
+    "content": "The agency approved the first oral GLP-1 pill for obesity on Monday.",
+}
+
+
+def _filter(deduplicator: NewsDeduplicator, results: list[dict]):  # noqa: ANN202
+    return deduplicator.filter(
+        1, results, url_key="url", text_keys=("title", "content")
+    )
+
+
+def test_copies_in_one_call_are_dropped():
+    copy = {**STORY, "url": "https://mirror.example/fda-semaglutide"}
+
+    outcome = _filter(NewsDeduplicator(), [STORY, copy])
+
+    assert outcome.kept == [STORY]
+    assert outcome.duplicates == 1
+
+
+def test_results_from_earlier_calls_are_kept_as_references():
+    deduplicator = NewsDeduplicator()
+    _filter(deduplicator, [STORY])
+
+    outcome = _filter(deduplicator, [{**STORY, "url": "https://site.com/story"}])
+
+    assert outcome.kept == []
+    assert outcome.duplicates == 0
+    assert [r["title"] for r in outcome.repeated] == [STORY["title"]]
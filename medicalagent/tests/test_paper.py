@@ -0,0 +1,21 @@
+from medicalagent.adapters.agent.tools.academic_search_tool import format_paper
+from medicalagent.domain.paper import Paper
+
+CITED = 42
+
+
+def test_unknown_citation_count_is_shown_as_not_available():
+    card = format_paper(1, Paper(title="Semaglutide", sources=["PubMed"]), None, 3)
+
+    assert "Citations: N/A" in card
+
+
+def test_merge_keeps_the_known_citation_count():
+    pubmed = Paper(title="Semaglutide", doi="10.1/x", sources=["PubMed"])
+    openalex = Paper(
+        title="Semaglutide", doi="10.1/x", citations=CITED, sources=["OpenAlex"]
+    )
+
+    assert pubmed.merged_with(openalex).citations == CITED
+    assert openalex.merged_with(pubmed).citations == CITED
+    assert pubmed.merged_with(pubmed).citations is None
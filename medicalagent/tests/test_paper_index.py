@@ -0,0 +1,66 @@
+import pytest
+from medicalagent.adapters.academic.index import search_with_index
+from medicalagent.adapters.repositories import InMemoryPaperRepository
+from medicalagent.domain.paper import Paper
+from medicalagent.infra.requests_transport.exceptions import BaseTransportException
+
+SOURCE = "OpenAlex"
+
+
+def _paper(title: str) -> Paper:
+    return Paper(title=title, year=2025, sources=[SOURCE])
+
+
+class Upstream:
+    def __init__(self, papers: list[Paper]) -> None:
+        self.papers = papers
+        self.calls = 0
+
+    def __call__(self) -> list[Paper]:
+        self.calls += 1
+        return self.papers
+
+
+def _search(repository, query: str, fetch) -> list[Paper]:  # noqa: ANN001
+    return search_with_index(repository, SOURCE, query, None, 2, fetch=fetch).papers
+
+
+def test_repeated_query_is_answered_from_the_index():
+    repository = InMemoryPaperRepository()
+    upstream = Upstream([_paper("semaglutide heart"), _paper("semaglutide kidney")])
+
+    _search(repository, "semaglutide", upstream)
+    papers = _search(repository, "Semaglutide!", upstream)
+
+    assert upstream.calls == 1
+    assert len(papers) == len(upstream.papers)
+
+
+def test_new_query_goes_upstream_even_if_the_index_could_answer():
+    repository = InMemoryPaperRepository()
+    _search(
+        repository,
+        "semaglutide heart",
+        Upstream([_paper("semaglutide heart"), _paper("semaglutide heart failure")]),
+    )
+    upstream = Upstream([_paper("semaglutide heart 2026")])
+
+    papers = _search(repository, "heart", upstream)
+
+    assert upstream.calls == 1
+    assert papers == upstream.papers
+
+
+def test_indexed_papers_are_served_when_upstream_fails():
+    repository = InMemoryPaperRepository()
+    _search(repository, "semaglutide", Upstream([_paper("semaglutide heart")]))
+
+    def failing() -> list[Paper]:
+        raise BaseTransportException(status_code=503, message="down")
+
+    search = search_with_index(repository, SOURCE, "heart", None, 2, fetch=failing)
+
+    assert search.stale
+    assert [p.title for p in search.papers] == ["semaglutide heart"]
+    with pytest.raises(BaseTransportException):
+        _search(repository, "kidney", failing)
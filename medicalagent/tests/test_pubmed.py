@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import pytest
+from fake_transport import FakeTransport
+from medicalagent.adapters.academic import pubmed
+from medicalagent.domain.paper import Paper
+from medicalagent.infra.requests_transport.exceptions import ClientError
+
+FIXTURES = Path(__file__).parent / "fixtures"
+ESEARCH = json.loads((FIXTURES / "pubmed_esearch.json").read_text())
+EFETCH = (FIXTURES / "pubmed_efetch.xml").read_text()
+
+
+@pytest.fixture
+def papers() -> list[Paper]:
+    return pubmed.search_papers(FakeTransport(ESEARCH, EFETCH), "semaglutide", limit=3)
+
+
+def test_structured_abstract_keeps_section_labels(papers):
+    select = papers[0]
+
+    assert select.title == (
+        "Semaglutide and Cardiovascular Outcomes in Obesity without Diabetes."
+    )
+    assert select.abstract.startswith("BACKGROUND: Semaglutide, a glucagon-like")
+    assert "METHODS: In a double-blind trial" in select.abstract
+    assert "receive once-weekly subcutaneous" in select.abstract
+    assert select.abstract.endswith(
+        "RESULTS: A total of 17,604 patients were enrolled."
+    )
+    assert select.doi == "10.1056/nejmoa2307563"
+    assert select.year == 2023
+    assert select.authors == [
+        "Lincoff AM",
+        "Brown-Frandsen K",
+        "SELECT Trial Investigators",
+    ]
+    assert select.url == "https://pubmed.ncbi.nlm.nih.gov/37952131/"
+
+
+def test_missing_abstract_and_doi(papers):
+    commentary = papers[1]
+
+    assert commentary.abstract is None
+    assert commentary.doi is None
+    assert commentary.link == "https://pubmed.ncbi.nlm.nih.gov/37812345/"
+    assert commentary.title == "GLP-1 receptor agonists: a 2023 commentary."
+    # MedlineDate ranges give their first year
+    assert commentary.year == 2023
+
+
+def test_unstructured_abstract_and_electronic_date(papers):
+    tirzepatide = papers[2]
+
+    assert tirzepatide.abstract == "Unstructured abstract in a single section."
+    assert tirzepatide.year == 2024
+    assert tirzepatide.doi == "10.1000/tzp.2024"
+    assert tirzepatide.authors == []
+    # PubMed reports no citation counts
+    assert tirzepatide.citations is None
+
+
+def test_efetch_reads_the_esearch_history_session():
+    transport = FakeTransport(ESEARCH, EFETCH)
+
+    pubmed.search_papers(transport, "semaglutide", year_min=2023, limit=3)
+
+    esearch, efetch = transport.calls
+    assert esearch.params["mindate"] == "2023"
+    assert efetch.params["WebEnv"] == ESEARCH["esearchresult"]["webenv"]
+    assert efetch.params["query_key"] == "1"
+    assert "id" not in efetch.params
+
+
+def test_expired_history_session_falls_back_to_pmids():
+    gone = ClientError(status_code=400, message="WebEnv expired")
+    transport = FakeTransport(ESEARCH, gone, EFETCH)
+
+    papers = pubmed.search_papers(transport, "semaglutide", limit=3)
+
+    assert len(papers) == 3
+    assert transport.calls[-1].params["id"] == "37952131,37812345,38900001"
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.config.settings import RateLimitSettings
+from medicalagent.infra.requests_transport.exceptions import RateLimitExceededError
+from medicalagent.infra.requests_transport.rate_limit import (
+    HostRateLimiter,
+    RateLimitedHTTPTransport,
+    TokenBucket,
+)
+
+HOST = "api.example.org"
+URL = f"https://{HOST}/works"
+
+
+def _transport(
+    rate: float, burst: int, max_wait: float
+) -> tuple[RateLimitedHTTPTransport, FakeTransport]:
+    inner = FakeTransport()
+    limiter = HostRateLimiter(
+        RateLimitSettings(
+            host_rates={HOST: rate}, host_bursts={HOST: burst}, max_wait=max_wait
+        )
+    )
+    return RateLimitedHTTPTransport(inner, limiter), inner
+
+
+def test_burst_passes_then_callers_wait_for_the_sustained_rate():
+    bucket = TokenBucket(rate=20, burst=2)
+
+    assert bucket.reserve(max_wait=1) == 0
+    assert bucket.reserve(max_wait=1) == 0
+    # Reservations queue up in arrival order, 1 / rate apart
+    assert bucket.reserve(max_wait=1) == pytest.approx(0.05, abs=0.01)
+    assert bucket.reserve(max_wait=1) == pytest.approx(0.10, abs=0.01)
+
+
+def test_request_is_delayed_until_its_token_matures():
+    transport, inner = _transport(rate=20, burst=1, max_wait=1)
+
+    started = time.monotonic()
+    transport.request(get(URL))
+    transport.request(get(URL))
+
+    assert time.monotonic() - started >= 0.04
+    assert len(inner.calls) == 2
+    assert transport.stats()[HOST]["delayed"] == 1
+
+
+def test_request_past_max_wait_is_rejected_without_going_upstream():
+    transport, inner = _transport(rate=1, burst=1, max_wait=0.1)
+    transport.request(get(URL))
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitExceededError):
+        transport.request(get(URL))
+
+    assert time.monotonic() - started < 0.05
+    assert len(inner.calls) == 1
+    assert transport.stats()[HOST]["rejected"] == 1
+
+
+def test_hosts_without_a_rate_are_not_limited():
+    transport, inner = _transport(rate=1, burst=1, max_wait=0)
+
+    for _ in range(5):
+        transport.request(get("https://other.example.org/"))
+
+    assert len(inner.calls) == 5
+    assert transport.stats() == {}
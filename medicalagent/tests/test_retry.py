@@ -0,0 +1,101 @@
+import email.utils
+import time
+
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.config.settings import RetryBackoffSettings
+from medicalagent.infra.requests_transport.exceptions import (
+    ClientError,
+    ConnectionTransportError,
+    ServerError,
+)
+from medicalagent.infra.requests_transport.retry import (
+    RetryingHTTPTransport,
+    RetryPolicy,
+    parse_retry_after,
+)
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+
+
+def _policy(**overrides: float) -> RetryPolicy:
+    settings = {"backoff_factor": 0.001, "backoff_jitter": 0, "deadline": 5}
+    return RetryPolicy(RetryBackoffSettings(**{**settings, **overrides}))
+
+
+def _unavailable(retry_after: str | None = None) -> ServerError:
+    headers = {"retry-after": retry_after} if retry_after else None
+    return ServerError(status_code=503, message="unavailable", headers=headers)
+
+
+def test_transient_errors_are_retried_until_success():
+    inner = FakeTransport(
+        _unavailable(), ConnectionTransportError(message="reset"), {"ok": True}
+    )
+    transport = RetryingHTTPTransport(inner, _policy())
+
+    assert transport.request(get()) == {"ok": True}
+    assert len(inner.calls) == 3
+    assert transport.stats()["retries"] == 2
+
+
+def test_request_errors_and_unsafe_methods_are_not_retried():
+    inner = FakeTransport(ClientError(status_code=404, message="not found"))
+    transport = RetryingHTTPTransport(inner, _policy())
+    with pytest.raises(ClientError):
+        transport.request(get())
+
+    inner = FakeTransport(_unavailable())
+    transport = RetryingHTTPTransport(inner, _policy())
+    with pytest.raises(ServerError):
+        transport.request(HTTPRequestData(method="POST", url=get().url))
+
+    assert len(inner.calls) == 1
+
+
+def test_retry_after_replaces_the_computed_backoff():
+    policy = _policy(backoff_factor=10)
+
+    assert policy.delay(3, 503, "7") == 7
+    assert policy.delay(3, 429, "0") == 0
+    # Only statuses in retry_after_statuses honor the header
+    assert policy.delay(3, 502, "7") == pytest.approx(10 * 2**2)
+
+
+def test_retry_after_http_date_is_converted_to_seconds():
+    later = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+    assert parse_retry_after(later) == pytest.approx(30, abs=2)
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_after_past_the_deadline_gives_up_without_waiting():
+    inner = FakeTransport(_unavailable(retry_after="30"), {"ok": True})
+    transport = RetryingHTTPTransport(inner, _policy(deadline=1))
+
+    started = time.monotonic()
+    with pytest.raises(ServerError):
+        transport.request(get())
+
+    assert time.monotonic() - started < 0.5
+    assert len(inner.calls) == 1
+    assert transport.stats()["deadline_exceeded"] == 1
+
+
+def test_exhausted_budget_stops_retries():
+    inner = FakeTransport(_unavailable())
+    policy = _policy(retry_budget_burst=2, retry_budget_ratio=0)
+    transport = RetryingHTTPTransport(inner, policy)
+
+    with pytest.raises(ServerError):
+        transport.request(get())
+    # The burst reserve paid for two retries; nothing is left for the next
+    assert len(inner.calls) == 3
+    with pytest.raises(ServerError):
+        transport.request(get())
+
+    assert len(inner.calls) == 4
+    stats = transport.stats()
+    assert stats["retries"] == 2
+    assert stats["budget_exhausted"] == 2
+    assert stats["budget_balance"] == 0
@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.infra.requests_transport.exceptions import ServerError
+from medicalagent.infra.requests_transport.schemas import HTTPRequestData
+from medicalagent.infra.requests_transport.singleflight import (
+    SingleFlightHTTPTransport,
+)
+
+CALLERS = 10
+
+
+def _concurrently(
+    transport: SingleFlightHTTPTransport, gate: threading.Event
+) -> list[Future]:
+    """Futures of CALLERS identical requests, released once all are waiting"""
+    pool = ThreadPoolExecutor(max_workers=CALLERS)
+    futures = [pool.submit(transport.request, get()) for _ in range(CALLERS)]
+    deadline = time.monotonic() + 5
+    while transport.stats()["coalesced"] < CALLERS - 1:
+        assert time.monotonic() < deadline, "callers never joined the flight"
+        time.sleep(0.001)
+    gate.set()
+    pool.shutdown(wait=True)
+    return futures
+
+
+def test_concurrent_identical_requests_share_one_upstream_call():
+    gate = threading.Event()
+    inner = FakeTransport({"ok": True}, gate=gate)
+    transport = SingleFlightHTTPTransport(inner)
+
+    futures = _concurrently(transport, gate)
+
+    assert [f.result() for f in futures] == [{"ok": True}] * CALLERS
+    assert len(inner.calls) == 1
+    assert transport.stats() == {"leaders": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+
+def test_followers_receive_the_leaders_error():
+    gate = threading.Event()
+    inner = FakeTransport(
+        ServerError(status_code=502, message="bad gateway"), gate=gate
+    )
+    transport = SingleFlightHTTPTransport(inner)
+
+    futures = _concurrently(transport, gate)
+
+    for future in futures:
+        with pytest.raises(ServerError):
+            future.result()
+    assert len(inner.calls) == 1
+
+
+def test_finished_requests_and_posts_are_not_shared():
+    inner = FakeTransport()
+    transport = SingleFlightHTTPTransport(inner)
+    post = HTTPRequestData(method="POST", url=get().url, json_body={"ids": []})
+
+    transport.request(get())
+    transport.request(get())
+    transport.request(post)
+
+    assert len(inner.calls) == 3
+    assert transport.stats()["coalesced"] == 0
@@ -0,0 +1,61 @@
+import pytest
+from fake_transport import FakeTransport, get
+from medicalagent.adapters.academic import semantic_scholar
+from medicalagent.infra.requests_transport.streaming import (
+    iter_file_chunks,
+    iter_json_items,
+    json_value,
+    spool,
+)
+
+PAGE = {
+    "total": 3,
+    "data": [
+        {"title": 'Quoted "key": [not an array]', "year": 2024.5},
+        {"title": "Café ünïcode", "nested": {"token": "inner"}},
+        {"title": "Third", "citationCount": 12},
+    ],
+    "token": "next-page",
+}
+
+
+def _chunks(text: str, size: int = 5) -> list[bytes]:
+    body = text.encode()
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def test_json_items_are_parsed_across_chunk_boundaries():
+    _, chunks = FakeTransport(PAGE).stream(get())
+
+    assert list(iter_json_items(chunks, "data")) == PAGE["data"]
+
+
+def test_json_value_finds_the_top_level_key_after_the_array():
+    _, chunks = FakeTransport(PAGE).stream(get())
+
+    assert json_value(chunks, "token") == "next-page"
+    assert json_value(_chunks('{"data": []}'), "token") is None
+
+
+def test_unterminated_array_is_an_error():
+    with pytest.raises(ValueError, match="Unterminated"):
+        list(iter_json_items(_chunks('{"data": [{"a": 1}, {"b"'), "data"))
+
+
+def test_spool_spills_large_bodies_to_disk():
+    transport = FakeTransport(PAGE)
+
+    with spool(transport, get(), max_memory_bytes=16) as page:
+        assert page._rolled  # type: ignore[attr-defined]
+        assert list(iter_json_items(iter_file_chunks(page, 5), "data")) == PAGE["data"]
+
+
+def test_bulk_search_follows_the_token_from_the_spooled_page():
+    first = {"token": "abc", "data": [{"title": "One"}, {"title": "Two"}]}
+    last = {"data": [{"title": "Three"}], "token": None}
+    transport = FakeTransport(first, last)
+
+    papers = list(semantic_scholar.iter_bulk_search(transport, "semaglutide"))
+
+    assert [p.title for p in papers] == ["One", "Two", "Three"]
+    assert transport.calls[1].params["token"] == "abc"